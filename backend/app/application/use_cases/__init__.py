@@ -1,5 +1,6 @@
 ﻿from backend.app.application.use_cases.auth_use_cases import AuthUseCases
 from backend.app.application.use_cases.backup_use_cases import BackupUseCases
+from backend.app.application.use_cases.batch_use_cases import BatchUseCases
 from backend.app.application.use_cases.categories_use_cases import CategoriesUseCases
 from backend.app.application.use_cases.dashboard_use_cases import DashboardUseCase
 from backend.app.application.use_cases.debts_use_cases import DebtsUseCases, PersonalDebtsUseCases
@@ -10,12 +11,14 @@ from backend.app.application.use_cases.fixed_payments_use_cases import FixedPaym
 from backend.app.application.use_cases.income_use_cases import IncomeUseCases
 from backend.app.application.use_cases.loans_use_cases import LoansUseCases
 from backend.app.application.use_cases.savings_use_cases import SavingsUseCases
+from backend.app.application.use_cases.search_use_cases import SearchUseCases
 from backend.app.application.use_cases.settings_use_cases import SettingsUseCases
 from backend.app.application.use_cases.subscription_use_cases import SubscriptionUseCases
 
 __all__ = [
     'AuthUseCases',
     'BackupUseCases',
+    'BatchUseCases',
     'CategoriesUseCases',
     'DashboardUseCase',
     'DebtsUseCases',
@@ -27,6 +30,7 @@ __all__ = [
     'LoansUseCases',
     'PersonalDebtsUseCases',
     'SavingsUseCases',
+    'SearchUseCases',
     'SettingsUseCases',
     'SubscriptionUseCases',
 ]
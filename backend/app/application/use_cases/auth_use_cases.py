@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from backend.app.domain.entities import AuthToken, User
 from backend.app.domain.ports import AuthPort
+from backend.services.auth_cache import AuthIdentity
 
 
 @dataclass(slots=True)
@@ -46,5 +47,5 @@ class AuthUseCases:
     async def logout(self, token: str) -> None:
         await self.auth.logout(token)
 
-    async def me(self, token: str) -> User:
+    async def me(self, token: str) -> AuthIdentity:
         return await self.auth.get_current_user_from_token(token)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
+
+from backend.app.domain.ports import FinancePort
+
+
+@dataclass(slots=True)
+class BatchUseCases:
+    finance: FinancePort
+
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        return self.finance.unit_of_work()
+
+    def operation(self, *, isolated: bool = True) -> AbstractAsyncContextManager[None]:
+        if not isolated:
+            return nullcontext()
+        return self.finance.savepoint()
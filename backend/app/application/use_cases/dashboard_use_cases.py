@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from backend.app.domain.entities import DashboardData
+from backend.app.domain.entities import DashboardData, YearOverview
 from backend.app.domain.ports import FinancePort
 
 
@@ -18,3 +18,6 @@ class DashboardUseCase:
         cycle: int | None = None,
     ) -> DashboardData:
         return await self.finance.get_dashboard_data(year=year, month=month, cycle=cycle)
+
+    async def year(self, *, year: int | None = None) -> YearOverview:
+        return await self.finance.get_year_overview(year)
@@ -76,8 +76,14 @@ class DebtsUseCases:
             notes=notes,
         )
 
-    async def list_payments(self, debt_id: int) -> list[DebtPayment]:
-        return await self.finance.list_debt_payments(debt_id)
+    async def list_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[DebtPayment]:
+        return await self.finance.list_debt_payments(debt_id, limit=limit, after=after)
 
 
 @dataclass(slots=True)
@@ -137,5 +143,11 @@ class PersonalDebtsUseCases:
             notes=notes,
         )
 
-    async def list_payments(self, debt_id: int) -> list[PersonalDebtPayment]:
-        return await self.finance.list_personal_debt_payments(debt_id)
+    async def list_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[PersonalDebtPayment]:
+        return await self.finance.list_personal_debt_payments(debt_id, limit=limit, after=after)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import date
 
-from backend.app.domain.entities import Expense
+from backend.app.domain.entities import Expense, ExpenseImportResult, ExpenseSuggestion
 from backend.app.domain.ports import FinancePort
 
 
@@ -11,8 +12,27 @@ from backend.app.domain.ports import FinancePort
 class ExpensesUseCases:
     finance: FinancePort
 
-    async def list(self, start_date: date, end_date: date) -> list[Expense]:
-        return await self.finance.list_expenses(start_date, end_date)
+    async def list(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Expense]:
+        return await self.finance.list_expenses(start_date, end_date, limit=limit, after=after)
+
+    def stream(self, start_date: date, end_date: date) -> AsyncIterator[Expense]:
+        return self.finance.stream_expenses(start_date, end_date)
+
+    async def count_current_period(self) -> int:
+        return await self.finance.count_current_period_expenses()
+
+    async def in_current_period(self, value: date) -> bool:
+        return await self.finance.is_in_current_period(value)
+
+    async def suggest(self, prefix: str, *, limit: int = 8) -> list[ExpenseSuggestion]:
+        return await self.finance.suggest_expenses(prefix, limit=limit)
 
     async def create(
         self,
@@ -50,3 +70,6 @@ class ExpensesUseCases:
 
     async def delete(self, expense_id: int) -> None:
         await self.finance.delete_expense(expense_id)
+
+    async def import_rows(self, rows: list[object], *, current_period_quota: int | None = None) -> ExpenseImportResult:
+        return await self.finance.import_expenses(rows, current_period_quota=current_period_quota)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import date
 
@@ -33,8 +34,18 @@ class IncomeUseCases:
     async def delete_salary_override(self, year: int, month: int, cycle: int) -> None:
         await self.finance.delete_salary_override(year, month, cycle)
 
-    async def list(self, start_date: date, end_date: date) -> list[Income]:
-        return await self.finance.list_income(start_date, end_date)
+    async def list(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Income]:
+        return await self.finance.list_income(start_date, end_date, limit=limit, after=after)
+
+    def stream(self, start_date: date, end_date: date) -> AsyncIterator[Income]:
+        return self.finance.stream_income(start_date, end_date)
 
     async def create(self, *, amount: float, description: str, date_value: date) -> Income:
         return await self.finance.add_income(amount=amount, description=description, date_value=date_value)
@@ -11,8 +11,14 @@ from backend.app.domain.ports import FinancePort
 class LoansUseCases:
     finance: FinancePort
 
-    async def list(self, *, include_paid: bool = False) -> list[Loan]:
-        return await self.finance.list_loans(include_paid=include_paid)
+    async def list(
+        self,
+        *,
+        include_paid: bool = False,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Loan]:
+        return await self.finance.list_loans(include_paid=include_paid, limit=limit, after=after)
 
     async def create(
         self,
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from backend.app.domain.entities import SearchHit
+from backend.app.domain.ports import FinancePort
+
+
+@dataclass(slots=True)
+class SearchUseCases:
+    finance: FinancePort
+
+    async def search(
+        self,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchHit]:
+        return await self.finance.search(query, kinds=kinds, limit=limit, offset=offset)
@@ -34,6 +34,12 @@ class SettingsUseCases:
             include_beta=include_beta,
         )
 
+    async def start_cycle_recompute(self) -> dict[str, object]:
+        return await self.finance.start_cycle_recompute()
+
+    async def get_cycle_recompute_status(self) -> dict[str, object] | None:
+        return await self.finance.get_cycle_recompute_status()
+
     async def get_custom_quincena(self, year: int, month: int, cycle: int) -> tuple[str, str]:
         return await self.finance.get_custom_quincena(year, month, cycle)
 
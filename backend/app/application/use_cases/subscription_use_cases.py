@@ -32,9 +32,15 @@ class SubscriptionPort(Protocol):
     ) -> str:
         ...
 
+    async def expense_limit(self, user_id: int) -> int | None:
+        ...
+
     async def can_create_expense(self, user_id: int, period_expense_count: int) -> bool:
         ...
 
+    async def remaining_expense_quota(self, user_id: int, period_expense_count: int) -> int | None:
+        ...
+
 
 @dataclass(slots=True)
 class SubscriptionUseCases:
@@ -59,5 +65,11 @@ class SubscriptionUseCases:
             headers=headers,
         )
 
+    async def expense_limit(self, user_id: int) -> int | None:
+        return await self.subscription.expense_limit(user_id)
+
     async def can_create_expense(self, user_id: int, period_expense_count: int) -> bool:
         return await self.subscription.can_create_expense(user_id, period_expense_count)
+
+    async def remaining_expense_quota(self, user_id: int, period_expense_count: int) -> int | None:
+        return await self.subscription.remaining_expense_quota(user_id, period_expense_count)
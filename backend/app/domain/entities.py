@@ -48,6 +48,15 @@ class Expense:
     category_ids: list[int] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class ExpenseSuggestion:
+    description: str
+    uses: int
+    amount: float
+    last_date: date
+    category_id: int | None = None
+
+
 @dataclass(slots=True)
 class FixedPayment:
     id: int
@@ -188,3 +197,59 @@ class DashboardData:
     fixed_payments_total: float = 0.0
     monthly_fixed_payments_total: float = 0.0
     period_range: PeriodRange | None = None
+
+
+@dataclass(slots=True)
+class ExpenseImportRowError:
+    row: int
+    message: str
+
+
+@dataclass(slots=True)
+class ExpenseImportResult:
+    imported: int
+    expense_ids: list[int] = field(default_factory=list)
+    errors: list[ExpenseImportRowError] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SearchHit:
+    kind: str
+    id: int
+    title: str
+    amount: float
+    rank: float
+    detail: str | None = None
+    date: date | None = None
+
+
+@dataclass(slots=True)
+class PeriodSummary:
+    year: int
+    month: int
+    cycle: int
+    start_date: str
+    end_date: str
+    period_title: str
+    salary: float
+    extra_income: float
+    period_savings: float
+    dinero_inicial: float
+    total_expenses: float
+    total_expenses_salary: float
+    total_expenses_savings: float
+    total_fixed: float
+    dinero_disponible: float
+    avg_daily: float
+    expense_count: int
+    fixed_count: int
+    cat_totals: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class YearOverview:
+    year: int
+    period_mode: str
+    total_savings: float
+    total_loans: float
+    periods: list[PeriodSummary] = field(default_factory=list)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from backend.app.domain.entities import AuthToken, User
+from backend.services.auth_cache import AuthIdentity
 
 
 class AuthPort(Protocol):
@@ -48,4 +49,4 @@ class AuthPort(Protocol):
     async def update_pin(self, user_id: int, *, pin: str | None) -> User: ...
     async def deactivate_profile(self, user_id: int) -> None: ...
     async def logout(self, token: str) -> None: ...
-    async def get_current_user_from_token(self, token: str) -> User: ...
+    async def get_current_user_from_token(self, token: str) -> AuthIdentity: ...
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
 from datetime import date
 from typing import Protocol
 
@@ -9,6 +11,8 @@ from backend.app.domain.entities import (
     Debt,
     DebtPayment,
     Expense,
+    ExpenseImportResult,
+    ExpenseSuggestion,
     FixedPayment,
     FixedPaymentStatus,
     Income,
@@ -16,10 +20,15 @@ from backend.app.domain.entities import (
     PersonalDebt,
     PersonalDebtPayment,
     SavingsGoal,
+    SearchHit,
+    YearOverview,
 )
 
 
 class FinancePort(Protocol):
+    def unit_of_work(self) -> AbstractAsyncContextManager[None]: ...
+    def savepoint(self) -> AbstractAsyncContextManager[None]: ...
+
     async def get_dashboard_data(
         self,
         *,
@@ -27,13 +36,25 @@ class FinancePort(Protocol):
         month: int | None = None,
         cycle: int | None = None,
     ) -> DashboardData: ...
+    async def get_year_overview(self, year: int | None = None) -> YearOverview: ...
 
     async def get_categories(self) -> list[Category]: ...
     async def add_category(self, name: str) -> Category: ...
     async def rename_category(self, category_id: int, new_name: str) -> Category: ...
     async def delete_category(self, category_id: int) -> None: ...
 
-    async def list_expenses(self, start_date: date, end_date: date) -> list[Expense]: ...
+    async def list_expenses(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Expense]: ...
+    def stream_expenses(self, start_date: date, end_date: date) -> AsyncIterator[Expense]: ...
+    async def count_current_period_expenses(self) -> int: ...
+    async def is_in_current_period(self, value: date) -> bool: ...
+    async def suggest_expenses(self, prefix: str, *, limit: int = 8) -> list[ExpenseSuggestion]: ...
     async def add_expense(
         self,
         *,
@@ -53,6 +74,12 @@ class FinancePort(Protocol):
         date_value: date,
     ) -> Expense: ...
     async def delete_expense(self, expense_id: int) -> None: ...
+    async def import_expenses(
+        self,
+        rows: list[object],
+        *,
+        current_period_quota: int | None = None,
+    ) -> ExpenseImportResult: ...
 
     async def get_fixed_payments_for_period(
         self,
@@ -89,7 +116,15 @@ class FinancePort(Protocol):
     ) -> FixedPaymentStatus: ...
     async def delete_fixed_payment(self, payment_id: int) -> None: ...
 
-    async def list_income(self, start_date: date, end_date: date) -> list[Income]: ...
+    async def list_income(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Income]: ...
+    def stream_income(self, start_date: date, end_date: date) -> AsyncIterator[Income]: ...
     async def add_income(self, *, amount: float, description: str, date_value: date) -> Income: ...
     async def update_income(
         self,
@@ -101,7 +136,13 @@ class FinancePort(Protocol):
     ) -> Income: ...
     async def delete_income(self, income_id: int) -> None: ...
 
-    async def list_loans(self, *, include_paid: bool = False) -> list[Loan]: ...
+    async def list_loans(
+        self,
+        *,
+        include_paid: bool = False,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Loan]: ...
     async def add_loan(
         self,
         *,
@@ -157,7 +198,13 @@ class FinancePort(Protocol):
         capital_amount: float,
         notes: str | None,
     ) -> DebtPayment: ...
-    async def list_debt_payments(self, debt_id: int) -> list[DebtPayment]: ...
+    async def list_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[DebtPayment]: ...
 
     async def list_personal_debts(self, *, include_paid: bool = False) -> list[PersonalDebt]: ...
     async def create_personal_debt(
@@ -186,7 +233,22 @@ class FinancePort(Protocol):
         amount: float,
         notes: str | None,
     ) -> PersonalDebtPayment: ...
-    async def list_personal_debt_payments(self, debt_id: int) -> list[PersonalDebtPayment]: ...
+    async def list_personal_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[PersonalDebtPayment]: ...
+
+    async def search(
+        self,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchHit]: ...
 
     async def get_salary(self) -> float: ...
     async def set_salary(self, amount: float) -> float: ...
@@ -217,6 +279,8 @@ class FinancePort(Protocol):
         auto_export: bool | None = None,
         include_beta: bool | None = None,
     ) -> dict[str, object]: ...
+    async def start_cycle_recompute(self) -> dict[str, object]: ...
+    async def get_cycle_recompute_status(self) -> dict[str, object] | None: ...
 
     async def get_custom_quincena(self, year: int, month: int, cycle: int) -> tuple[str, str]: ...
     async def get_period_range(self, year: int, month: int, cycle: int) -> tuple[str, str]: ...
@@ -3,6 +3,7 @@ from __future__ import annotations
 from backend.app.domain.entities import AuthToken, User
 from backend.app.domain.ports import AuthPort
 from backend.app.infrastructure.adapters.mappers import to_auth_token, to_user
+from backend.services.auth_cache import AuthIdentity
 from backend.services.auth_service import AuthService
 
 
@@ -54,6 +55,6 @@ class AuthServiceAdapter(AuthPort):
     async def logout(self, token: str) -> None:
         await self._service.logout(token)
 
-    async def get_current_user_from_token(self, token: str) -> User:
-        model = await self._service.get_current_user_from_token(token)
-        return to_user(model)
+    async def get_current_user_from_token(self, token: str) -> AuthIdentity:
+        # Already a plain, session-free value; there is no ORM row behind a cached identity.
+        return await self._service.get_current_user_from_token(token)
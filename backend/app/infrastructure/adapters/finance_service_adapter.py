@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
 from datetime import date
 
 from backend.app.domain.entities import (
@@ -8,6 +10,8 @@ from backend.app.domain.entities import (
     Debt,
     DebtPayment,
     Expense,
+    ExpenseImportResult,
+    ExpenseSuggestion,
     FixedPayment,
     FixedPaymentStatus,
     Income,
@@ -15,6 +19,8 @@ from backend.app.domain.entities import (
     PersonalDebt,
     PersonalDebtPayment,
     SavingsGoal,
+    SearchHit,
+    YearOverview,
 )
 from backend.app.domain.ports import FinancePort
 from backend.app.infrastructure.adapters.mappers import (
@@ -23,6 +29,8 @@ from backend.app.infrastructure.adapters.mappers import (
     to_debt,
     to_debt_payment,
     to_expense,
+    to_expense_import_result,
+    to_expense_suggestion,
     to_fixed_payment,
     to_fixed_payment_status,
     to_income,
@@ -30,6 +38,8 @@ from backend.app.infrastructure.adapters.mappers import (
     to_personal_debt,
     to_personal_debt_payment,
     to_savings_goal,
+    to_search_hit,
+    to_year_overview,
 )
 from backend.services.finance_service import FinanceService
 
@@ -40,10 +50,19 @@ class FinanceServiceAdapter(FinancePort):
     def __init__(self, service: FinanceService) -> None:
         self._service = service
 
+    def unit_of_work(self) -> AbstractAsyncContextManager[None]:
+        return self._service.unit_of_work()
+
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        return self._service.savepoint()
+
     async def get_dashboard_data(self, *, year: int | None = None, month: int | None = None, cycle: int | None = None) -> DashboardData:
         result = await self._service.get_dashboard_data(year=year, month=month, cycle=cycle)
         return to_dashboard(result)
 
+    async def get_year_overview(self, year: int | None = None) -> YearOverview:
+        return to_year_overview(await self._service.get_year_overview(year))
+
     async def get_categories(self) -> list[Category]:
         return [to_category(item) for item in await self._service.get_categories()]
 
@@ -56,8 +75,29 @@ class FinanceServiceAdapter(FinancePort):
     async def delete_category(self, category_id: int) -> None:
         await self._service.delete_category(category_id)
 
-    async def list_expenses(self, start_date: date, end_date: date) -> list[Expense]:
-        return [to_expense(item) for item in await self._service.list_expenses(start_date, end_date)]
+    async def list_expenses(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Expense]:
+        items = await self._service.list_expenses(start_date, end_date, limit=limit, after=after)
+        return [to_expense(item) for item in items]
+
+    async def stream_expenses(self, start_date: date, end_date: date) -> AsyncIterator[Expense]:
+        async for item in self._service.stream_expenses(start_date, end_date):
+            yield to_expense(item)
+
+    async def count_current_period_expenses(self) -> int:
+        return await self._service.count_current_period_expenses()
+
+    async def is_in_current_period(self, value: date) -> bool:
+        return await self._service.is_in_current_period(value)
+
+    async def suggest_expenses(self, prefix: str, *, limit: int = 8) -> list[ExpenseSuggestion]:
+        return [to_expense_suggestion(item) for item in await self._service.suggest_expenses(prefix, limit=limit)]
 
     async def add_expense(self, *, amount: float, description: str, category_id: int, date_value: date, source: str = 'sueldo') -> Expense:
         return to_expense(
@@ -84,6 +124,10 @@ class FinanceServiceAdapter(FinancePort):
     async def delete_expense(self, expense_id: int) -> None:
         await self._service.delete_expense(expense_id)
 
+    async def import_expenses(self, rows: list[object], *, current_period_quota: int | None = None) -> ExpenseImportResult:
+        result = await self._service.import_expenses(rows, current_period_quota=current_period_quota)
+        return to_expense_import_result(result)
+
     async def get_fixed_payments_for_period(self, year: int, month: int, cycle: int) -> list[FixedPaymentStatus]:
         return [to_fixed_payment_status(item) for item in await self._service.get_fixed_payments_for_period(year, month, cycle)]
 
@@ -116,8 +160,20 @@ class FinanceServiceAdapter(FinancePort):
     async def delete_fixed_payment(self, payment_id: int) -> None:
         await self._service.delete_fixed_payment(payment_id)
 
-    async def list_income(self, start_date: date, end_date: date) -> list[Income]:
-        return [to_income(item) for item in await self._service.list_income(start_date, end_date)]
+    async def list_income(
+        self,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Income]:
+        items = await self._service.list_income(start_date, end_date, limit=limit, after=after)
+        return [to_income(item) for item in items]
+
+    async def stream_income(self, start_date: date, end_date: date) -> AsyncIterator[Income]:
+        async for item in self._service.stream_income(start_date, end_date):
+            yield to_income(item)
 
     async def add_income(self, *, amount: float, description: str, date_value: date) -> Income:
         return to_income(await self._service.add_income(amount=amount, description=description, date_value=date_value))
@@ -128,8 +184,15 @@ class FinanceServiceAdapter(FinancePort):
     async def delete_income(self, income_id: int) -> None:
         await self._service.delete_income(income_id)
 
-    async def list_loans(self, *, include_paid: bool = False) -> list[Loan]:
-        return [to_loan(item) for item in await self._service.list_loans(include_paid=include_paid)]
+    async def list_loans(
+        self,
+        *,
+        include_paid: bool = False,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Loan]:
+        items = await self._service.list_loans(include_paid=include_paid, limit=limit, after=after)
+        return [to_loan(item) for item in items]
 
     async def add_loan(self, *, person: str, amount: float, description: str | None, date_value: date, deduction_type: str = 'ninguno') -> Loan:
         return to_loan(
@@ -203,8 +266,15 @@ class FinanceServiceAdapter(FinancePort):
             )
         )
 
-    async def list_debt_payments(self, debt_id: int) -> list[DebtPayment]:
-        return [to_debt_payment(item) for item in await self._service.list_debt_payments(debt_id)]
+    async def list_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[DebtPayment]:
+        items = await self._service.list_debt_payments(debt_id, limit=limit, after=after)
+        return [to_debt_payment(item) for item in items]
 
     async def list_personal_debts(self, *, include_paid: bool = False) -> list[PersonalDebt]:
         return [to_personal_debt(item) for item in await self._service.list_personal_debts(include_paid=include_paid)]
@@ -243,8 +313,26 @@ class FinanceServiceAdapter(FinancePort):
             )
         )
 
-    async def list_personal_debt_payments(self, debt_id: int) -> list[PersonalDebtPayment]:
-        return [to_personal_debt_payment(item) for item in await self._service.list_personal_debt_payments(debt_id)]
+    async def list_personal_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[PersonalDebtPayment]:
+        items = await self._service.list_personal_debt_payments(debt_id, limit=limit, after=after)
+        return [to_personal_debt_payment(item) for item in items]
+
+    async def search(
+        self,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchHit]:
+        items = await self._service.search(query, kinds=kinds, limit=limit, offset=offset)
+        return [to_search_hit(item) for item in items]
 
     async def get_salary(self) -> float:
         return await self._service.get_salary()
@@ -304,6 +392,12 @@ class FinanceServiceAdapter(FinancePort):
             include_beta=include_beta,
         )
 
+    async def start_cycle_recompute(self) -> dict[str, object]:
+        return self._service.schedule_cycle_recompute()
+
+    async def get_cycle_recompute_status(self) -> dict[str, object] | None:
+        return self._service.get_cycle_recompute_status()
+
     async def get_period_range(self, year: int, month: int, cycle: int) -> tuple[str, str]:
         return await self._service.get_period_range(year, month, cycle)
 
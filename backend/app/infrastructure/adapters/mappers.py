@@ -7,14 +7,20 @@ from backend.app.domain.entities import (
     Debt,
     DebtPayment,
     Expense,
+    ExpenseImportResult,
+    ExpenseImportRowError,
+    ExpenseSuggestion,
     FixedPayment,
     FixedPaymentStatus,
     Income,
     Loan,
     PersonalDebt,
     PersonalDebtPayment,
+    PeriodSummary,
     SavingsGoal,
+    SearchHit,
     User,
+    YearOverview,
 )
 from backend.app.domain.value_objects import PeriodRange
 
@@ -53,7 +59,10 @@ def to_category(model) -> Category:
 
 
 def to_expense(model) -> Expense:
-    category_ids = [link.category_id for link in getattr(model, 'expense_categories', [])]
+    if hasattr(model, 'category_ids'):
+        category_ids = list(model.category_ids)
+    else:
+        category_ids = [link.category_id for link in getattr(model, 'expense_categories', [])]
     if not category_ids:
         category_ids = [category.id for category in getattr(model, 'categories', [])]
     return Expense(
@@ -68,6 +77,16 @@ def to_expense(model) -> Expense:
     )
 
 
+def to_expense_suggestion(model) -> ExpenseSuggestion:
+    return ExpenseSuggestion(
+        description=model.description,
+        uses=int(model.uses),
+        amount=float(model.amount),
+        last_date=model.last_date,
+        category_id=model.category_id,
+    )
+
+
 def to_fixed_payment(model) -> FixedPayment:
     return FixedPayment(
         id=model.id,
@@ -180,6 +199,18 @@ def to_savings_goal(model) -> SavingsGoal:
     )
 
 
+def to_search_hit(row) -> SearchHit:
+    return SearchHit(
+        kind=row.kind,
+        id=row.id,
+        title=row.title,
+        amount=float(row.amount),
+        rank=float(row.rank),
+        detail=row.detail,
+        date=row.date,
+    )
+
+
 def to_dashboard(result) -> DashboardData:
     return DashboardData(
         initial_money=float(result.initial_money),
@@ -198,3 +229,44 @@ def to_dashboard(result) -> DashboardData:
             end=result.period_range.end,
         ) if getattr(result, 'period_range', None) else None,
     )
+
+
+def to_year_overview(result) -> YearOverview:
+    return YearOverview(
+        year=result.year,
+        period_mode=result.period_mode,
+        total_savings=float(result.total_savings),
+        total_loans=float(result.total_loans),
+        periods=[
+            PeriodSummary(
+                year=item.year,
+                month=item.month,
+                cycle=item.cycle,
+                start_date=item.start_date,
+                end_date=item.end_date,
+                period_title=item.period_title,
+                salary=float(item.salary),
+                extra_income=float(item.extra_income),
+                period_savings=float(item.period_savings),
+                dinero_inicial=float(item.dinero_inicial),
+                total_expenses=float(item.total_expenses),
+                total_expenses_salary=float(item.total_expenses_salary),
+                total_expenses_savings=float(item.total_expenses_savings),
+                total_fixed=float(item.total_fixed),
+                dinero_disponible=float(item.dinero_disponible),
+                avg_daily=float(item.avg_daily),
+                expense_count=int(item.expense_count),
+                fixed_count=int(item.fixed_count),
+                cat_totals=dict(item.cat_totals),
+            )
+            for item in result.periods
+        ],
+    )
+
+
+def to_expense_import_result(result) -> ExpenseImportResult:
+    return ExpenseImportResult(
+        imported=int(result.imported),
+        expense_ids=list(result.expense_ids),
+        errors=[ExpenseImportRowError(row=item.row, message=item.message) for item in result.errors],
+    )
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.application.use_cases import (
     AuthUseCases,
     BackupUseCases,
+    BatchUseCases,
     CategoriesUseCases,
     DashboardUseCase,
     DebtsUseCases,
@@ -17,6 +18,7 @@ from backend.app.application.use_cases import (
     LoansUseCases,
     PersonalDebtsUseCases,
     SavingsUseCases,
+    SearchUseCases,
     SettingsUseCases,
     SubscriptionUseCases,
 )
@@ -42,6 +44,8 @@ class FinanceUseCases:
     personal_debts: PersonalDebtsUseCases
     savings: SavingsUseCases
     settings: SettingsUseCases
+    batch: BatchUseCases
+    search: SearchUseCases
 
 
 class Container:
@@ -82,6 +86,8 @@ class Container:
             personal_debts=PersonalDebtsUseCases(finance=finance_port),
             savings=SavingsUseCases(finance=finance_port),
             settings=SettingsUseCases(finance=finance_port),
+            batch=BatchUseCases(finance=finance_port),
+            search=SearchUseCases(finance=finance_port),
         )
 
     def export_use_cases(self, user_id: int) -> ExportUseCases:
@@ -31,6 +31,17 @@ class Settings:
     jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))
     refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    password_hash_max_pending: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+    stateless_access_tokens: bool = os.getenv("STATELESS_ACCESS_TOKENS", "false").lower() in {"1", "true", "yes", "on"}
+    auth_sweep_interval_seconds: int = int(os.getenv("AUTH_SWEEP_INTERVAL_SECONDS", "900"))
+    auth_sweep_batch_size: int = int(os.getenv("AUTH_SWEEP_BATCH_SIZE", "500"))
+    auth_sweep_pause_ms: int = int(os.getenv("AUTH_SWEEP_PAUSE_MS", "200"))
+    rate_limit_backend: str = os.getenv("RATE_LIMIT_BACKEND", "memory").strip().lower()
+    rate_limit_max_keys: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+    rate_limit_shards: int = int(os.getenv("RATE_LIMIT_SHARDS", "16"))
+    metrics_flag: str = os.getenv("METRICS_ENABLED", "").strip().lower()
     database_url: str = _normalize_database_url(
         os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data/finanzas_app.db")
     )
@@ -54,11 +65,29 @@ class Settings:
     polar_return_url: str = os.getenv("POLAR_RETURN_URL", "http://127.0.0.1:8000/?checkout=cancel")
     polar_webhook_secret: str = os.getenv("POLAR_WEBHOOK_SECRET", "")
     google_client_id: str = os.getenv("GOOGLE_CLIENT_ID", "")
+    dashboard_cache_size: int = int(os.getenv("DASHBOARD_CACHE_SIZE", "512"))
+    dashboard_cache_ttl_seconds: int = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "60"))
+    entitlements_cache_size: int = int(os.getenv("ENTITLEMENTS_CACHE_SIZE", "1024"))
+    entitlements_cache_ttl_seconds: int = int(os.getenv("ENTITLEMENTS_CACHE_TTL_SECONDS", "30"))
+    expense_suggest_cache_users: int = int(os.getenv("EXPENSE_SUGGEST_CACHE_USERS", "256"))
+    auth_identity_cache_size: int = int(os.getenv("AUTH_IDENTITY_CACHE_SIZE", "4096"))
+    auth_identity_cache_ttl_seconds: int = int(os.getenv("AUTH_IDENTITY_CACHE_TTL_SECONDS", "60"))
+    cycle_recompute_batch_size: int = int(os.getenv("CYCLE_RECOMPUTE_BATCH_SIZE", "500"))
+    expense_import_max_rows: int = int(os.getenv("EXPENSE_IMPORT_MAX_ROWS", "5000"))
+    batch_max_operations: int = int(os.getenv("BATCH_MAX_OPERATIONS", "200"))
+    list_page_max_size: int = int(os.getenv("LIST_PAGE_MAX_SIZE", "500"))
+    stream_batch_size: int = int(os.getenv("STREAM_BATCH_SIZE", "500"))
 
     @property
     def is_production(self) -> bool:
         return self.app_env == "production"
 
+    @property
+    def metrics_enabled(self) -> bool:
+        if self.metrics_flag:
+            return self.metrics_flag in {"1", "true", "yes", "on"}
+        return not self.is_production
+
     @property
     def has_safe_secret_key(self) -> bool:
         secret = self.secret_key.strip()
@@ -0,0 +1,62 @@
+"""Compare the per-row cost of the ORM and Core expense list read paths.
+
+Usage: python -m backend.database.bench_expense_list USER_ID [ROUNDS]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import date
+from time import perf_counter
+
+from backend.app.infrastructure.adapters.mappers import to_expense
+from backend.database.engine import SessionLocal
+from backend.repositories import ExpenseRepository
+from backend.schemas.expense import ExpenseRead
+
+
+def _to_read(item) -> ExpenseRead:
+    expense = to_expense(item)
+    return ExpenseRead(
+        id=expense.id,
+        amount=expense.amount,
+        description=expense.description,
+        date=expense.date,
+        quincenal_cycle=expense.quincenal_cycle,
+        status=expense.status,
+        category_ids=expense.category_ids,
+    )
+
+
+async def bench(user_id: int, rounds: int = 5) -> dict[str, tuple[int, float]]:
+    """Return ``{path: (rows, best microseconds per row)}`` over the user's full history."""
+    start, end = date.min, date.max
+    paths = {
+        "orm": lambda repo: repo.list_by_range(user_id, start, end),
+        "core": lambda repo: repo.list_rows_by_range(user_id, start, end),
+    }
+    results: dict[str, tuple[int, float]] = {}
+    for name, fetch in paths.items():
+        best = float("inf")
+        rows = 0
+        for _ in range(rounds):
+            async with SessionLocal() as session:
+                began = perf_counter()
+                reads = [_to_read(item) for item in await fetch(ExpenseRepository(session))]
+                elapsed = perf_counter() - began
+            rows = len(reads)
+            best = min(best, elapsed)
+        results[name] = (rows, best * 1_000_000 / max(rows, 1))
+    return results
+
+
+def main(argv: list[str]) -> None:
+    if not argv:
+        raise SystemExit(__doc__)
+    rounds = int(argv[1]) if len(argv) > 1 else 5
+    for name, (rows, per_row) in asyncio.run(bench(int(argv[0]), rounds)).items():
+        print(f"{name}: {rows} rows, {per_row:.1f} us/row")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
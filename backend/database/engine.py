@@ -2,7 +2,7 @@
 
 from collections.abc import AsyncIterator
 
-from sqlalchemy import event
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.config import get_settings
@@ -30,6 +30,12 @@ async def get_db() -> AsyncIterator[AsyncSession]:
 get_async_session = get_db
 
 
+async def missing_tables() -> list[str]:
+    async with engine.connect() as connection:
+        existing = await connection.run_sync(lambda sync_connection: set(inspect(sync_connection).get_table_names()))
+    return sorted(name for name in Base.metadata.tables if name not in existing)
+
+
 async def init_db() -> None:
     if not settings.should_bootstrap_schema:
         return
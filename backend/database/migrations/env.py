@@ -8,6 +8,7 @@ from sqlalchemy import engine_from_config, pool
 from backend.config import get_settings
 from backend.database.base import Base
 from backend.database import models  # noqa: F401
+from backend.database.search_index import SEARCH_SOURCES
 
 config = context.config
 settings = get_settings()
@@ -18,6 +19,16 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# FTS5 virtual tables and their shadow tables (<table>_fts_data, _idx, ...)
+# are created by raw DDL in the migrations, not by the models.
+SEARCH_INDEX_TABLES = tuple(source.fts_table for source in SEARCH_SOURCES)
+
+
+def include_name(name, type_, parent_names) -> bool:
+    if type_ == "table" and name is not None:
+        return not any(name == fts or name.startswith(f"{fts}_") for fts in SEARCH_INDEX_TABLES)
+    return True
+
 
 def run_migrations_offline() -> None:
     context.configure(
@@ -25,6 +36,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -39,7 +51,12 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata, compare_type=True)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            include_name=include_name,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
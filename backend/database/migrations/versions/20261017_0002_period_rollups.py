@@ -0,0 +1,55 @@
+"""period rollups
+
+Revision ID: 20261017_0002
+Revises: 20260307_0001
+Create Date: 2026-10-17 10:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0002"
+down_revision = "20260307_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if "period_rollups" not in existing:
+        op.create_table(
+            "period_rollups",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("year", sa.Integer(), nullable=False),
+            sa.Column("month", sa.Integer(), nullable=False),
+            sa.Column("cycle", sa.Integer(), nullable=False),
+            sa.Column("expense_salary_total", sa.Float(), nullable=False),
+            sa.Column("expense_savings_total", sa.Float(), nullable=False),
+            sa.Column("expense_count", sa.Integer(), nullable=False),
+            sa.Column("extra_income_total", sa.Float(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.UniqueConstraint("user_id", "year", "month", "cycle", name="uq_period_rollups_period"),
+        )
+    if "period_category_rollups" not in existing:
+        op.create_table(
+            "period_category_rollups",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("year", sa.Integer(), nullable=False),
+            sa.Column("month", sa.Integer(), nullable=False),
+            sa.Column("cycle", sa.Integer(), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=False),
+            sa.Column("total", sa.Float(), nullable=False),
+            sa.UniqueConstraint(
+                "user_id", "year", "month", "cycle", "category_id",
+                name="uq_period_category_rollups_period",
+            ),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("period_category_rollups")
+    op.drop_table("period_rollups")
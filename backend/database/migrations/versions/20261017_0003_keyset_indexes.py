@@ -0,0 +1,53 @@
+"""keyset pagination indexes
+
+Revision ID: 20261017_0003
+Revises: 20261017_0002
+Create Date: 2026-10-17 12:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0003"
+down_revision = "20261017_0002"
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = (
+    ("expenses", "idx_expenses_user_date_id", ["user_id", "date", "id"]),
+    ("extra_income", "idx_extra_income_user_date_id", ["user_id", "date", "id"]),
+    ("loans", "idx_loans_user_date_id", ["user_id", "date", "id"]),
+    ("debt_payments", "idx_debt_payments_debt_date", ["debt_id", "payment_date", "id"]),
+    ("personal_debt_payments", "idx_personal_debt_payments_debt_date", ["personal_debt_id", "payment_date", "id"]),
+)
+
+PREVIOUS_COLUMNS = {
+    "idx_debt_payments_debt_date": ["debt_id", "payment_date"],
+    "idx_personal_debt_payments_debt_date": ["personal_debt_id", "payment_date"],
+}
+
+
+def _existing_indexes(table: str) -> dict[str, list[str]]:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"]: list(index["column_names"]) for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    for table, name, columns in KEYSET_INDEXES:
+        existing = _existing_indexes(table)
+        if existing.get(name) == columns:
+            continue
+        if name in existing:
+            op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for table, name, _columns in KEYSET_INDEXES:
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
+        if name in PREVIOUS_COLUMNS:
+            op.create_index(name, table, PREVIOUS_COLUMNS[name])
@@ -0,0 +1,67 @@
+"""composite indexes for per-user access paths
+
+Revision ID: 20261017_0004
+Revises: 20261017_0003
+Create Date: 2026-10-17 14:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0004"
+down_revision = "20261017_0003"
+branch_labels = None
+depends_on = None
+
+
+ACCESS_PATH_INDEXES = (
+    ("expense_categories", "idx_expense_categories_category", ["category_id"]),
+    ("fixed_payments", "idx_fixed_payments_user_active", ["user_id", "is_active"]),
+    ("fixed_payments", "idx_fixed_payments_category", ["category_id"]),
+    ("fixed_payment_records", "idx_fixed_payment_records_lookup", ["fixed_payment_id", "year", "month", "quincenal_cycle"]),
+    ("savings_goals", "idx_savings_goals_user", ["user_id"]),
+    ("subscriptions", "idx_subscriptions_user", ["user_id"]),
+    ("sessions", "idx_sessions_token_hash", ["token_hash"]),
+    ("sessions", "idx_sessions_user", ["user_id"]),
+    ("users", "idx_users_email", ["email"]),
+)
+
+# Replaced by idx_expenses_user_date_id: every expense range query filters user_id first.
+SUPERSEDED_INDEXES = (
+    ("expenses", "idx_expenses_date", ["date"]),
+)
+
+PREVIOUS_COLUMNS = {
+    "idx_fixed_payment_records_lookup": ["fixed_payment_id", "year", "month"],
+}
+
+
+def _existing_indexes(table: str) -> dict[str, list[str]]:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"]: list(index["column_names"]) for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    for table, name, columns in ACCESS_PATH_INDEXES:
+        existing = _existing_indexes(table)
+        if existing.get(name) == columns:
+            continue
+        if name in existing:
+            op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns)
+    for table, name, _columns in SUPERSEDED_INDEXES:
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, name, columns in SUPERSEDED_INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+    for table, name, _columns in reversed(ACCESS_PATH_INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
+        if name in PREVIOUS_COLUMNS:
+            op.create_index(name, table, PREVIOUS_COLUMNS[name])
@@ -0,0 +1,60 @@
+"""full-text search index
+
+Revision ID: 20261017_0005
+Revises: 20261017_0004
+Create Date: 2026-10-17 16:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.database.base import Base
+from backend.database import models  # noqa: F401
+from backend.database.search_index import (
+    SEARCH_SOURCES,
+    search_index_name,
+    sqlite_backfill_statement,
+    sqlite_create_statements,
+    sqlite_drop_statements,
+)
+
+
+revision = "20261017_0005"
+down_revision = "20261017_0004"
+branch_labels = None
+depends_on = None
+
+
+def _search_index(source) -> sa.Index:
+    name = search_index_name(source)
+    return next(index for index in Base.metadata.tables[source.table].indexes if index.name == name)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for source in SEARCH_SOURCES:
+            _search_index(source).create(bind, checkfirst=True)
+        return
+    if bind.dialect.name != "sqlite":
+        return
+    existing = set(sa.inspect(bind).get_table_names())
+    for source in SEARCH_SOURCES:
+        for statement in sqlite_create_statements(source):
+            op.execute(statement)
+        if source.fts_table not in existing:
+            op.execute(sqlite_backfill_statement(source))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for source in SEARCH_SOURCES:
+            _search_index(source).drop(bind, checkfirst=True)
+        return
+    if bind.dialect.name != "sqlite":
+        return
+    for source in SEARCH_SOURCES:
+        for statement in sqlite_drop_statements(source):
+            op.execute(statement)
@@ -0,0 +1,59 @@
+"""default subscription rows for existing users
+
+Revision ID: 20261017_0006
+Revises: 20261017_0005
+Create Date: 2026-10-17 18:00:00
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0006"
+down_revision = "20261017_0005"
+branch_labels = None
+depends_on = None
+
+
+users = sa.table("users", sa.column("id", sa.Integer))
+subscriptions = sa.table(
+    "subscriptions",
+    sa.column("user_id", sa.Integer),
+    sa.column("plan", sa.String),
+    sa.column("status", sa.String),
+    sa.column("trial_end", sa.DateTime),
+    sa.column("current_period_end", sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    # Subscription reads no longer create the row lazily; give every user
+    # without one the same free trial registration hands out.
+    bind = op.get_bind()
+    missing = bind.execute(
+        sa.select(users.c.id).where(~sa.exists().where(subscriptions.c.user_id == users.c.id))
+    ).scalars().all()
+    if not missing:
+        return
+    trial_end = datetime.now(timezone.utc) + timedelta(days=14)
+    op.bulk_insert(
+        subscriptions,
+        [
+            {
+                "user_id": user_id,
+                "plan": "free",
+                "status": "trialing",
+                "trial_end": trial_end,
+                "current_period_end": trial_end,
+            }
+            for user_id in missing
+        ],
+    )
+
+
+def downgrade() -> None:
+    # The backfilled rows are indistinguishable from ones created at registration.
+    pass
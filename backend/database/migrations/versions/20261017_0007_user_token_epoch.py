@@ -0,0 +1,32 @@
+"""per-user access token epoch
+
+Revision ID: 20261017_0007
+Revises: 20261017_0006
+Create Date: 2026-10-17 20:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return any(item["name"] == column for item in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    if not _has_column("users", "token_epoch"):
+        op.add_column("users", sa.Column("token_epoch", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    if _has_column("users", "token_epoch"):
+        with op.batch_alter_table("users") as batch:
+            batch.drop_column("token_epoch")
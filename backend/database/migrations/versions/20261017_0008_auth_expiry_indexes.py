@@ -0,0 +1,42 @@
+"""expiry indexes for the expired session and OTP sweeper
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17 21:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+
+EXPIRY_INDEXES = (
+    ("sessions", "idx_sessions_expires", ["expires_at"]),
+    ("otp_challenges", "idx_otp_challenges_expires", ["expires_at"]),
+)
+
+
+def _existing_indexes(table: str) -> set[str] | None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None  # otp_challenges may not exist yet; 20261017_0009 creates it with its indexes
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    for table, name, columns in EXPIRY_INDEXES:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for table, name, _columns in reversed(EXPIRY_INDEXES):
+        if name in (_existing_indexes(table) or ()):
+            op.drop_index(name, table_name=table)
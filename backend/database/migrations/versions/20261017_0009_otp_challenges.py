@@ -0,0 +1,45 @@
+"""otp_challenges for databases created before OTP registration
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17 22:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0009"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The app used to create this table lazily on the first OTP request; it is
+    # now expected to exist before startup.
+    if sa.inspect(op.get_bind()).has_table("otp_challenges"):
+        return
+    op.create_table(
+        "otp_challenges",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("purpose", sa.String(40), nullable=False),
+        sa.Column("username", sa.String(120), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("pin_hash", sa.String(255)),
+        sa.Column("pin_length", sa.Integer(), nullable=False),
+        sa.Column("code_hash", sa.String(255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("consumed_at", sa.DateTime()),
+        sa.Column("attempt_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("idx_otp_challenges_lookup", "otp_challenges", ["email", "purpose", "expires_at"])
+    op.create_index("idx_otp_challenges_expires", "otp_challenges", ["expires_at"])
+
+
+def downgrade() -> None:
+    # Databases that already had the table keep it; 0001 owns its lifecycle there.
+    pass
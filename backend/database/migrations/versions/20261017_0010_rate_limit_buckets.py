@@ -0,0 +1,35 @@
+"""shared token buckets for the database rate limit backend
+
+Revision ID: 20261017_0010
+Revises: 20261017_0009
+Create Date: 2026-10-17 23:00:00
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0010"
+down_revision = "20261017_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("rate_limit_buckets"):
+        return
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("bucket_key", sa.String(255), nullable=False, unique=True),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("idx_rate_limit_buckets_expires", "rate_limit_buckets", ["expires_at"])
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("rate_limit_buckets"):
+        op.drop_table("rate_limit_buckets")
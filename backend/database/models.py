@@ -18,6 +18,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database.base import Base
+from backend.database.search_index import SEARCH_SOURCES, attach_search_index
 
 
 class TimestampMixin:
@@ -42,6 +43,7 @@ class User(Base, TimestampMixin):
     pin_hash: Mapped[str | None] = mapped_column(String(255))
     pin_length: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    token_epoch: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     categories: Mapped[list[Category]] = relationship(back_populates="user")
     expenses: Mapped[list[Expense]] = relationship(back_populates="user")
@@ -67,6 +69,7 @@ class OtpChallenge(Base, TimestampMixin):
     __tablename__ = "otp_challenges"
     __table_args__ = (
         Index("idx_otp_challenges_lookup", "email", "purpose", "expires_at"),
+        Index("idx_otp_challenges_expires", "expires_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -116,6 +119,44 @@ class Category(Base, TimestampMixin):
     fixed_payments: Mapped[list[FixedPayment]] = relationship(back_populates="category")
 
 
+class PeriodRollup(Base):
+    __tablename__ = "period_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", "cycle", name="uq_period_rollups_period"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    month: Mapped[int] = mapped_column(Integer, nullable=False)
+    cycle: Mapped[int] = mapped_column(Integer, nullable=False)
+    expense_salary_total: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    expense_savings_total: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    expense_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    extra_income_total: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class PeriodCategoryRollup(Base):
+    __tablename__ = "period_category_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "year", "month", "cycle", "category_id",
+            name="uq_period_category_rollups_period",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    month: Mapped[int] = mapped_column(Integer, nullable=False)
+    cycle: Mapped[int] = mapped_column(Integer, nullable=False)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
+    total: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
 class Budget(Base, TimestampMixin):
     __tablename__ = "budgets"
     __table_args__ = (
@@ -202,7 +243,7 @@ class FixedPayment(Base, TimestampMixin, UpdatedAtMixin):
 class FixedPaymentRecord(Base, TimestampMixin):
     __tablename__ = "fixed_payment_records"
     __table_args__ = (
-        Index("idx_fixed_payment_records_lookup", "fixed_payment_id", "year", "month"),
+        Index("idx_fixed_payment_records_lookup", "fixed_payment_id", "year", "month", "quincenal_cycle"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -306,7 +347,7 @@ class Debt(Base, TimestampMixin, UpdatedAtMixin):
 
 class DebtPayment(Base, TimestampMixin):
     __tablename__ = "debt_payments"
-    __table_args__ = (Index("idx_debt_payments_debt_date", "debt_id", "payment_date"),)
+    __table_args__ = (Index("idx_debt_payments_debt_date", "debt_id", "payment_date", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     debt_id: Mapped[int] = mapped_column(ForeignKey("debts.id", ondelete="CASCADE"), nullable=False)
@@ -340,7 +381,7 @@ class PersonalDebt(Base, TimestampMixin, UpdatedAtMixin):
 class PersonalDebtPayment(Base, TimestampMixin):
     __tablename__ = "personal_debt_payments"
     __table_args__ = (
-        Index("idx_personal_debt_payments_debt_date", "personal_debt_id", "payment_date"),
+        Index("idx_personal_debt_payments_debt_date", "personal_debt_id", "payment_date", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -460,7 +501,31 @@ class SessionToken(Base, TimestampMixin):
     user: Mapped[User] = relationship(back_populates="sessions")
 
 
-Index("idx_expenses_date", Expense.date)
-Index("idx_expenses_user_cycle", Expense.user_id, Expense.quincenal_cycle)
+class RateLimitBucket(Base):
+    __tablename__ = "rate_limit_buckets"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    bucket_key: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
 
+Index("idx_expenses_user_cycle", Expense.user_id, Expense.quincenal_cycle)
+Index("idx_expenses_user_date_id", Expense.user_id, Expense.date, Expense.id)
+Index("idx_expense_categories_category", ExpenseCategory.category_id)
+Index("idx_fixed_payments_user_active", FixedPayment.user_id, FixedPayment.is_active)
+Index("idx_fixed_payments_category", FixedPayment.category_id)
+Index("idx_extra_income_user_date_id", ExtraIncome.user_id, ExtraIncome.date, ExtraIncome.id)
+Index("idx_loans_user_date_id", Loan.user_id, Loan.date, Loan.id)
+Index("idx_savings_goals_user", SavingsGoal.user_id)
+Index("idx_subscriptions_user", Subscription.user_id)
+Index("idx_sessions_token_hash", SessionToken.token_hash)
+Index("idx_sessions_user", SessionToken.user_id)
+Index("idx_sessions_expires", SessionToken.expires_at)
+Index("idx_rate_limit_buckets_expires", RateLimitBucket.expires_at)
+Index("idx_users_email", User.email)
+
+
+for _source in SEARCH_SOURCES:
+    attach_search_index(Base.metadata.tables[_source.table], _source)
@@ -0,0 +1,226 @@
+"""Run the app's repository queries against a scratch database and flag full table scans.
+
+Usage: python -m backend.database.query_audit [DATABASE_URL]
+
+The target database is created/extended with ``create_all`` and seeded with a
+throwaway user, so point it at a disposable SQLite file or Postgres database.
+Every SELECT/UPDATE/DELETE issued while exercising the services is explained
+once (``EXPLAIN QUERY PLAN`` on SQLite, ``EXPLAIN (FORMAT JSON)`` with
+``enable_seqscan`` off on PostgreSQL). Exit status is 1 if any scan is found.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from secrets import token_hex
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.database.base import Base
+from backend.database import models  # noqa: F401
+from backend.repositories.subscription_repo import SubscriptionRepository
+from backend.services.auth_service import AuthService
+from backend.services.auth_sweeper import ExpiredAuthSweeper
+from backend.services.finance_service import FinanceService
+from backend.services.rate_limiter import DatabaseRateLimitStore
+from backend.services.subscription_service import SubscriptionService
+
+AUDITED_PREFIXES = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclass(slots=True)
+class QueryPlan:
+    statement: str
+    plan: list[str]
+    scans: list[str] = field(default_factory=list)
+
+
+class QueryAudit:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.dialect = engine.dialect.name
+        self.tables = set(Base.metadata.tables)
+        self.plans: dict[str, QueryPlan] = {}
+
+    def __enter__(self) -> QueryAudit:
+        event.listen(self.engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        event.remove(self.engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @property
+    def flagged(self) -> list[QueryPlan]:
+        return [plan for plan in self.plans.values() if plan.scans]
+
+    def _after_cursor_execute(self, conn, _cursor, statement, parameters, _context, executemany) -> None:
+        if executemany or statement in self.plans:
+            return
+        if not statement.lstrip().upper().startswith(AUDITED_PREFIXES):
+            return
+        cursor = conn.connection.cursor()
+        try:
+            if self.dialect == "postgresql":
+                self.plans[statement] = self._explain_postgresql(cursor, statement, parameters)
+            else:
+                self.plans[statement] = self._explain_sqlite(cursor, statement, parameters)
+        finally:
+            cursor.close()
+
+    def _explain_sqlite(self, cursor, statement: str, parameters) -> QueryPlan:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        lines = [row[-1] for row in cursor.fetchall()]
+        scans = []
+        for line in lines:
+            parts = line.split()
+            # "SCAN expenses" / "SCAN e USING INDEX ..." walk the whole table or index;
+            # "SEARCH ..." is an index lookup and subquery/constant scans are not tables.
+            if len(parts) >= 2 and parts[0] == "SCAN" and parts[1] in self.tables:
+                scans.append(line)
+        return QueryPlan(statement=statement, plan=lines, scans=scans)
+
+    def _explain_postgresql(self, cursor, statement: str, parameters) -> QueryPlan:
+        cursor.execute("SET enable_seqscan = off")
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        raw = cursor.fetchone()[0]
+        root = (raw if isinstance(raw, list) else json.loads(raw))[0]["Plan"]
+        lines: list[str] = []
+        scans: list[str] = []
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            label = node["Node Type"]
+            if "Relation Name" in node:
+                label = f"{label} on {node['Relation Name']}"
+                if node["Node Type"] == "Seq Scan":
+                    scans.append(label)
+            if "Index Name" in node:
+                label = f"{label} using {node['Index Name']}"
+            lines.append("  " * depth + label)
+            stack.extend((child, depth + 1) for child in reversed(node.get("Plans", [])))
+        return QueryPlan(statement=statement, plan=lines, scans=scans)
+
+
+async def exercise(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Drive the read and write paths the API uses for one freshly seeded user."""
+    async with session_factory() as session:
+        auth = AuthService(session)
+        result = await auth.register(f"audit_{token_hex(4)}", None, "audit-password")
+        uid = result.user.id
+        await auth.get_current_user_from_token(result.access_token)
+        refreshed = await auth.refresh(result.refresh_token or "")
+        await auth.login(result.user.username, "audit-password")
+
+    today = date.today()
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        categories = await finance.get_categories()
+        category_id = categories[0].id
+        extra = await finance.add_category(f"audit {token_hex(2)}")
+        await finance.delete_category(extra.id)
+        for offset in range(0, 90, 3):
+            await finance.add_expense(
+                amount=10 + offset,
+                description=f"audit {offset}",
+                category_id=category_id,
+                date_value=today - timedelta(days=offset),
+            )
+        expense = (await finance.list_expenses(today - timedelta(days=90), today))[0]
+        await finance.update_expense(
+            expense.id,
+            amount=99,
+            description="audit update",
+            category_id=categories[1].id,
+            date_value=today,
+        )
+        await finance.delete_expense(expense.id)
+        income = await finance.add_income(amount=50, description="audit", date_value=today)
+        await finance.update_income(income.id, amount=60, description="audit", date_value=today)
+        payment = await finance.add_fixed_payment(name="audit", amount=20, due_day=today.day, category_id=category_id)
+        cycle = await finance.get_cycle_for_date(today)
+        await finance.set_fixed_payment_paid(payment.id, today.year, today.month, cycle, True)
+        await finance.add_loan(person="audit", amount=15, description=None, date_value=today)
+        debt = await finance.create_debt(
+            name="audit",
+            principal_amount=1000,
+            annual_rate=12,
+            term_months=12,
+            start_date=today,
+            payment_day=10,
+        )
+        await finance.add_debt_payment(debt.id, payment_date=today, total_amount=100, interest_amount=10, capital_amount=90)
+        personal = await finance.create_personal_debt(person="audit", total_amount=100, description=None, date_value=today)
+        await finance.add_personal_debt_payment(personal.id, payment_date=today, amount=10)
+        await finance.add_savings(25)
+        await finance.create_savings_goal("audit", 500)
+
+        start = today - timedelta(days=120)
+        await finance.list_expenses(start, today, limit=10)
+        async for _item in finance.stream_expenses(start, today):
+            pass
+        await finance.list_income(start, today)
+        await finance.list_loans(include_paid=True)
+        await finance.list_debts(include_inactive=True)
+        await finance.list_debt_payments(debt.id)
+        await finance.list_personal_debts(include_paid=True)
+        await finance.list_personal_debt_payments(personal.id)
+        await finance.list_savings_goals()
+        await finance.get_fixed_payments_for_period(today.year, today.month, cycle)
+        await finance.get_dashboard_data(today.year, today.month, cycle)
+        await finance.get_year_overview(today.year)
+        await finance.get_period_rollups(today.year)
+        await finance.get_settings_payload()
+        await finance.search("audit", limit=10)
+        await finance.suggest_expenses("aud")
+
+    async with session_factory() as session:
+        subscriptions = SubscriptionService(SubscriptionRepository(session))
+        await subscriptions.get_status(uid)
+        await subscriptions.remaining_expense_quota(uid, 1)
+
+    async with session_factory() as session:
+        await AuthService(session).logout(refreshed.access_token)
+
+    sweeper = ExpiredAuthSweeper(session_factory, interval_seconds=0, batch_size=100, pause_seconds=0)
+    await sweeper.sweep_once()
+
+
+async def audit(database_url: str) -> QueryAudit:
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        with QueryAudit(engine) as report:
+            await exercise(async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession))
+            limiter = DatabaseRateLimitStore(engine)
+            for _attempt in range(3):
+                await limiter.hit(f"audit:{token_hex(4)}", limit=2, window_seconds=60)
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main(argv: list[str]) -> None:
+    if argv:
+        database_url = argv[0]
+    else:
+        database_url = f"sqlite+aiosqlite:///{Path(tempfile.mkdtemp()) / 'query_audit.db'}"
+    report = asyncio.run(audit(database_url))
+    for plan in report.plans.values():
+        marker = "SCAN" if plan.scans else "ok  "
+        print(f"[{marker}] {' '.join(plan.statement.split())[:160]}")
+        for line in plan.plan:
+            print(f"         {line}")
+    flagged = report.flagged
+    print(f"\n{len(report.plans)} statements audited, {len(flagged)} with full scans")
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,35 @@
+"""Rebuild the materialized period rollups.
+
+Usage: python -m backend.database.rollups [USER_ID ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from backend.database.engine import SessionLocal
+from backend.database.models import User
+from backend.services.finance_service import FinanceService
+
+
+async def rebuild_period_rollups(user_ids: list[int] | None = None) -> dict[int, int]:
+    async with SessionLocal() as session:
+        if not user_ids:
+            user_ids = list(await session.scalars(select(User.id).order_by(User.id)))
+    rebuilt: dict[int, int] = {}
+    for user_id in user_ids:
+        async with SessionLocal() as session:
+            rebuilt[user_id] = await FinanceService(session, user_id).rebuild_period_rollups()
+    return rebuilt
+
+
+def main(argv: list[str]) -> None:
+    rebuilt = asyncio.run(rebuild_period_rollups([int(arg) for arg in argv]))
+    for user_id, count in rebuilt.items():
+        print(f"user {user_id}: {count} periods")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
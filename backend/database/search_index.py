@@ -0,0 +1,120 @@
+"""Full-text index over the user-entered text of expenses, income, loans and fixed payments.
+
+SQLite keeps one contentless FTS5 table per source table, maintained by
+triggers so every write path (API, imports, backup restore) stays in sync.
+Each row also carries a ``user_key`` token so a query only walks the
+posting lists of its owner. PostgreSQL uses a GIN index on the
+``to_tsvector`` expression returned by :func:`search_vector`, which the
+planner keeps current on its own.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import DDL, Index, Table, event, func, text
+from sqlalchemy.dialects import postgresql  # noqa: F401  (registers the to_tsvector/ts_rank functions)
+from sqlalchemy.sql.elements import ColumnElement
+
+SEARCH_CONFIG = "simple"
+MAX_SEARCH_TERMS = 8
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSource:
+    kind: str
+    table: str
+    columns: tuple[str, ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+SEARCH_SOURCES = (
+    SearchSource("expense", "expenses", ("description",)),
+    SearchSource("income", "extra_income", ("description",)),
+    SearchSource("loan", "loans", ("person", "description")),
+    SearchSource("fixed_payment", "fixed_payments", ("name",)),
+)
+
+
+def search_terms(query: str) -> list[str]:
+    return [term.lower() for term in _TERM_RE.findall(query)][:MAX_SEARCH_TERMS]
+
+
+def user_key(user_id: int) -> str:
+    return f"u{user_id}"
+
+
+def fts_match(user_id: int, terms: list[str]) -> str:
+    """FTS5 query: every term as a prefix, restricted to the owner's rows."""
+    return f"user_key:{user_key(user_id)} AND " + " AND ".join(f'"{term}"*' for term in terms)
+
+
+def search_query(terms: list[str]) -> ColumnElement:
+    """``to_tsquery`` with every term as a prefix."""
+    return func.to_tsquery(text(f"'{SEARCH_CONFIG}'"), " & ".join(f"{term}:*" for term in terms))
+
+
+def search_vector(*columns) -> ColumnElement:
+    """``to_tsvector`` over the columns, spelled with literals so it matches the GIN index expression."""
+    combined = None
+    for column in columns:
+        part = func.coalesce(column, text("''")) if column.nullable else column
+        combined = part if combined is None else combined.op("||")(text("' '")).op("||")(part)
+    return func.to_tsvector(text(f"'{SEARCH_CONFIG}'"), combined)
+
+
+def sqlite_create_statements(source: SearchSource) -> list[str]:
+    fts = source.fts_table
+    columns = ", ".join(source.columns)
+    new_values = ", ".join(f"new.{column}" for column in source.columns)
+    old_values = ", ".join(f"old.{column}" for column in source.columns)
+    insert_new = f"INSERT INTO {fts}(rowid, user_key, {columns}) VALUES (new.id, 'u' || new.user_id, {new_values});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, user_key, {columns}) "
+        f"VALUES ('delete', old.id, 'u' || old.user_id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"user_key, {columns}, content='', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source.table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source.table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF user_id, {columns} ON {source.table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def sqlite_backfill_statement(source: SearchSource) -> str:
+    columns = ", ".join(source.columns)
+    return (
+        f"INSERT INTO {source.fts_table}(rowid, user_key, {columns}) "
+        f"SELECT id, 'u' || user_id, {columns} FROM {source.table}"
+    )
+
+
+def sqlite_drop_statements(source: SearchSource) -> list[str]:
+    fts = source.fts_table
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def search_index_name(source: SearchSource) -> str:
+    return f"idx_{source.table}_search"
+
+
+def attach_search_index(table: Table, source: SearchSource) -> None:
+    """Declare the dialect's text index on ``table`` so ``create_all``/``drop_all`` manage it."""
+    vector = search_vector(*(table.c[column] for column in source.columns))
+    Index(search_index_name(source), vector, postgresql_using="gin").ddl_if(dialect="postgresql")
+    for statement in sqlite_create_statements(source):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in sqlite_drop_statements(source):
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import math
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from backend.config import settings
-from backend.database.engine import init_db
+from backend.database.engine import init_db, missing_tables
 from backend.database import models  # noqa: F401
+from backend.repositories.description_index import description_index
+from backend.services.auth_cache import auth_identity_cache
+from backend.services.auth_sweeper import auth_sweeper
+from backend.services.cycle_recompute import cycle_recompute_jobs
+from backend.services.dashboard_cache import dashboard_cache
+from backend.services.password_hasher import password_hasher
+from backend.services.rate_limiter import rate_limit_store
+from backend.services.subscription_service import entitlements_cache
 from backend.routers import (
     auth,
     backup,
+    batch,
     categories,
     dashboard,
     debts,
@@ -23,10 +35,12 @@ from backend.routers import (
     income,
     loans,
     savings,
+    search,
     settings as settings_router,
     subscription,
     sync,
 )
+from backend.routers.pagination import NEXT_CURSOR_HEADER
 
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / 'frontend'
 
@@ -37,7 +51,14 @@ async def lifespan(_: FastAPI):
         raise RuntimeError('SECRET_KEY debe definirse con un valor seguro en produccion.')
     if settings.should_bootstrap_schema:
         await init_db()
+    missing = await missing_tables()
+    if missing:
+        raise RuntimeError(f'Faltan tablas en la base de datos ({", ".join(missing)}); ejecuta las migraciones.')
+    auth_sweeper.start()
     yield
+    await auth_sweeper.shutdown()
+    await cycle_recompute_jobs.shutdown()
+    password_hasher.shutdown()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -47,10 +68,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError):
+    # JSON numbers such as 1e400 parse to inf, which the default handler cannot echo back as JSON.
+    errors = [
+        {**error, 'input': str(error['input'])}
+        if isinstance(error.get('input'), float) and not math.isfinite(error['input'])
+        else error
+        for error in exc.errors()
+    ]
+    return await request_validation_exception_handler(request, RequestValidationError(errors, body=exc.body))
+
 app.include_router(auth.router, prefix=settings.api_prefix)
 app.include_router(backup.router, prefix=settings.api_prefix)
+app.include_router(batch.router, prefix=settings.api_prefix)
 app.include_router(categories.router, prefix=settings.api_prefix)
 app.include_router(dashboard.router, prefix=settings.api_prefix)
 app.include_router(debts.router, prefix=settings.api_prefix)
@@ -60,6 +95,7 @@ app.include_router(fixed_payments.router, prefix=settings.api_prefix)
 app.include_router(income.router, prefix=settings.api_prefix)
 app.include_router(loans.router, prefix=settings.api_prefix)
 app.include_router(savings.router, prefix=settings.api_prefix)
+app.include_router(search.router, prefix=settings.api_prefix)
 app.include_router(settings_router.router, prefix=settings.api_prefix)
 app.include_router(subscription.router, prefix=settings.api_prefix)
 app.include_router(sync.router, prefix=settings.api_prefix)
@@ -73,6 +109,22 @@ async def health():
     return {'status': 'ok'}
 
 
+@app.get('/metrics', include_in_schema=False)
+async def metrics():
+    # Cache sizes and hit rates are operator-only; off in production unless METRICS_ENABLED is set.
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Not Found')
+    return {
+        'auth_identity_cache': auth_identity_cache.stats(),
+        'auth_sweeper': auth_sweeper.stats(),
+        'dashboard_cache': dashboard_cache.stats(),
+        'entitlements_cache': entitlements_cache.stats(),
+        'expense_suggest_index': description_index.stats(),
+        'password_hasher': password_hasher.stats(),
+        'rate_limiter': rate_limit_store.stats(),
+    }
+
+
 @app.get('/manifest.json', include_in_schema=False)
 async def manifest():
     return FileResponse(FRONTEND_DIR / 'manifest.json', media_type='application/manifest+json')
@@ -8,7 +8,11 @@ from backend.middleware.auth import (
     get_subscription_use_cases,
     oauth2_scheme,
 )
-from backend.middleware.subscription import enforce_expense_limit, enforce_freemium_expense_limit
+from backend.middleware.subscription import (
+    enforce_expense_limit,
+    enforce_freemium_expense_limit,
+    get_expense_import_quota,
+)
 
 __all__ = [
     'enforce_expense_limit',
@@ -17,6 +21,7 @@ __all__ = [
     'get_backup_use_cases',
     'get_container',
     'get_current_user',
+    'get_expense_import_quota',
     'get_export_use_cases',
     'get_finance_use_cases',
     'get_subscription_use_cases',
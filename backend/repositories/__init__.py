@@ -5,7 +5,9 @@ from backend.repositories.expense_repo import ExpenseRepository
 from backend.repositories.fixed_payment_repo import FixedPaymentRepository
 from backend.repositories.income_repo import IncomeRepository
 from backend.repositories.loan_repo import LoanRepository
+from backend.repositories.rollup_repo import PeriodRollupRepository
 from backend.repositories.savings_repo import SavingsRepository
+from backend.repositories.search_repo import SearchRepository
 from backend.repositories.settings_repo import SettingsRepository
 from backend.repositories.subscription_repo import SubscriptionRepository
 from backend.repositories.user_repo import UserRepository
@@ -18,7 +20,9 @@ __all__ = [
     'FixedPaymentRepository',
     'IncomeRepository',
     'LoanRepository',
+    'PeriodRollupRepository',
     'SavingsRepository',
+    'SearchRepository',
     'SettingsRepository',
     'SubscriptionRepository',
     'UserRepository',
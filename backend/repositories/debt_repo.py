@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.database.models import Debt, DebtPayment, PersonalDebt, PersonalDebtPayment
+from backend.repositories.pagination import KeysetPosition, keyset
 
 
 class DebtRepository:
@@ -113,8 +114,15 @@ class DebtRepository:
         await self.session.flush()
         return item
 
-    async def list_debt_payments(self, debt_id: int) -> list[DebtPayment]:
-        stmt = select(DebtPayment).where(DebtPayment.debt_id == debt_id).order_by(DebtPayment.payment_date.desc(), DebtPayment.id.desc())
+    async def list_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ) -> list[DebtPayment]:
+        stmt = select(DebtPayment).where(DebtPayment.debt_id == debt_id)
+        stmt = keyset(stmt, DebtPayment.payment_date, DebtPayment.id, limit=limit, after=after)
         return list(await self.session.scalars(stmt))
 
     async def delete_debt(self, debt_id: int) -> bool:
@@ -209,8 +217,15 @@ class DebtRepository:
         await self.session.flush()
         return item
 
-    async def list_personal_debt_payments(self, debt_id: int) -> list[PersonalDebtPayment]:
-        stmt = select(PersonalDebtPayment).where(PersonalDebtPayment.personal_debt_id == debt_id).order_by(PersonalDebtPayment.payment_date.desc(), PersonalDebtPayment.id.desc())
+    async def list_personal_debt_payments(
+        self,
+        debt_id: int,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ) -> list[PersonalDebtPayment]:
+        stmt = select(PersonalDebtPayment).where(PersonalDebtPayment.personal_debt_id == debt_id)
+        stmt = keyset(stmt, PersonalDebtPayment.payment_date, PersonalDebtPayment.id, limit=limit, after=after)
         return list(await self.session.scalars(stmt))
 
     async def delete_personal_debt(self, debt_id: int) -> bool:
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from backend.config import get_settings
+
+_PENDING_KEY = "description_index_pending"
+
+IndexVersion = tuple[int, int]
+
+
+def normalize_description(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+@dataclass(slots=True)
+class DescriptionUse:
+    expense_id: int
+    description: str
+    amount: float
+    date: date
+    category_id: int | None
+    uses: int = 1
+
+
+@dataclass(slots=True)
+class DescriptionSuggestion:
+    description: str
+    uses: int
+    amount: float
+    category_id: int | None
+    last_date: date
+
+
+class UserDescriptionIndex:
+    """Sorted normalized descriptions of one user, with use counts and the latest expense."""
+
+    def __init__(self, uses: list[DescriptionUse]) -> None:
+        self._latest: dict[str, DescriptionUse] = {}
+        self._uses: dict[str, int] = {}
+        for use in uses:
+            self._merge(normalize_description(use.description), use)
+        self._keys = sorted(self._latest)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _merge(self, key: str, use: DescriptionUse) -> bool:
+        if not key:
+            return False
+        is_new = key not in self._latest
+        self._uses[key] = self._uses.get(key, 0) + use.uses
+        if is_new or use.expense_id > self._latest[key].expense_id:
+            self._latest[key] = use
+        return is_new
+
+    def add(self, use: DescriptionUse) -> None:
+        key = normalize_description(use.description)
+        if self._merge(key, use):
+            insort(self._keys, key)
+
+    def suggest(self, prefix: str, limit: int) -> list[DescriptionSuggestion]:
+        key = normalize_description(prefix)
+        if not key:
+            return []
+        matches = []
+        for index in range(bisect_left(self._keys, key), len(self._keys)):
+            candidate = self._keys[index]
+            if not candidate.startswith(key):
+                break
+            matches.append(candidate)
+        best = heapq.nsmallest(
+            limit,
+            matches,
+            key=lambda item: (-self._uses[item], -self._latest[item].expense_id),
+        )
+        return [
+            DescriptionSuggestion(
+                description=self._latest[item].description,
+                uses=self._uses[item],
+                amount=self._latest[item].amount,
+                category_id=self._latest[item].category_id,
+                last_date=self._latest[item].date,
+            )
+            for item in best
+        ]
+
+
+class DescriptionIndexCache:
+    """LRU of per-user description indexes, kept current by committed expense writes.
+
+    Repositories call ``record_use``/``record_invalidation`` with their session;
+    the change is held on the session and only applied once the outermost
+    transaction commits, so rolled-back writes (including savepoints) never
+    leak into suggestions. Builders capture ``version(user_id)`` before reading
+    and ``put`` refuses the index if a commit landed in between.
+    """
+
+    def __init__(self, *, max_users: int) -> None:
+        self.max_users = max(0, max_users)
+        self._indexes: OrderedDict[int, UserDescriptionIndex] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        self._generation = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_users > 0
+
+    def _current(self, user_id: int) -> IndexVersion:
+        return self._generation, self._versions.get(user_id, 0)
+
+    def version(self, user_id: int) -> IndexVersion:
+        with self._lock:
+            return self._current(user_id)
+
+    def put(self, user_id: int, version: IndexVersion, index: UserDescriptionIndex) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if version != self._current(user_id):
+                return
+            self._indexes[user_id] = index
+            self._indexes.move_to_end(user_id)
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+                self.evictions += 1
+
+    def suggest(self, user_id: int, prefix: str, limit: int) -> list[DescriptionSuggestion] | None:
+        """Suggestions from the cached index, or ``None`` if the user's index is not loaded."""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                self.misses += 1
+                return None
+            self._indexes.move_to_end(user_id)
+            self.hits += 1
+            return index.suggest(prefix, limit)
+
+    def _apply(self, changes: list[tuple[int, DescriptionUse | None]]) -> None:
+        with self._lock:
+            for user_id, use in changes:
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+                index = self._indexes.get(user_id)
+                if index is None:
+                    continue
+                if use is None:
+                    del self._indexes[user_id]
+                else:
+                    index.add(use)
+
+    def clear(self) -> None:
+        """Drop every index and refuse any build that started before this call."""
+        with self._lock:
+            self._indexes.clear()
+            self._versions.clear()
+            self._generation += 1
+
+    def record_use(self, session: Session, user_id: int, use: DescriptionUse) -> None:
+        _pending(session).append((_current_transaction(session), user_id, use))
+
+    def record_invalidation(self, session: Session, user_id: int) -> None:
+        _pending(session).append((_current_transaction(session), user_id, None))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "users": len(self._indexes),
+                "max_users": self.max_users,
+                "descriptions": sum(len(index) for index in self._indexes.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _pending(session: Session) -> list:
+    return session.info.setdefault(_PENDING_KEY, [])
+
+
+def _current_transaction(session: Session) -> SessionTransaction | None:
+    return session.get_nested_transaction() or session.get_transaction()
+
+
+def _within(transaction: SessionTransaction | None, ancestor: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    if session.get_nested_transaction() is not None:
+        return  # savepoint released; the outer transaction may still roll back
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        description_index._apply([(user_id, use) for _transaction, user_id, use in pending])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_savepoint(session: Session, previous_transaction: SessionTransaction) -> None:
+    pending = session.info.get(_PENDING_KEY)
+    if pending and previous_transaction.nested:
+        pending[:] = [item for item in pending if not _within(item[0], previous_transaction)]
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+description_index = DescriptionIndexCache(max_users=get_settings().expense_suggest_cache_users)
@@ -1,17 +1,61 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, case, func, insert, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from backend.database.models import Expense, ExpenseCategory
+from backend.repositories.description_index import DescriptionUse, description_index
+from backend.repositories.pagination import KeysetPosition, keyset
+from backend.repositories.rollup_repo import PeriodKey, PeriodRollupRepository
+
+
+@dataclass(slots=True)
+class ExpenseRangeSummary:
+    total: float
+    total_salary: float
+    count: int
+    day_count: int
+
+
+@dataclass(slots=True)
+class ExpenseRow:
+    id: int
+    user_id: int
+    amount: float
+    description: str
+    date: date
+    quincenal_cycle: int
+    status: str
+    category_ids: list[int]
+
+
+def _category_ids(value: object) -> list[int]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [int(item) for item in value.split(",") if item]
+    return [int(item) for item in value]
+
+
+@dataclass(slots=True)
+class RecentExpense:
+    id: int
+    date: date
+    description: str
+    amount: float
+    category_ids: list[int] = field(default_factory=list)
 
 
 class ExpenseRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.rollups = PeriodRollupRepository(session)
 
     async def create(
         self,
@@ -23,6 +67,7 @@ class ExpenseRepository:
         quincenal_cycle: int,
         category_ids: list[int],
         status: str = "pending",
+        period: PeriodKey | None = None,
     ) -> Expense:
         expense = Expense(
             user_id=user_id,
@@ -37,13 +82,71 @@ class ExpenseRepository:
         for category_id in category_ids:
             self.session.add(ExpenseCategory(expense_id=expense.id, category_id=category_id))
         await self.session.flush()
+        description_index.record_use(
+            self.session.sync_session,
+            user_id,
+            DescriptionUse(
+                expense_id=expense.id,
+                description=description,
+                amount=float(amount),
+                date=date_value,
+                category_id=category_ids[0] if category_ids else None,
+            ),
+        )
+        if period is not None:
+            await self.rollups.apply_expense(
+                user_id, period, amount=amount, status=status, category_ids=category_ids
+            )
         return await self.get_by_id(expense.id)
 
+    async def bulk_create(self, user_id: int, rows: list[dict[str, object]]) -> list[int]:
+        """Insert many expenses and their category links with two executemany statements."""
+        if not rows:
+            return []
+        result = await self.session.execute(
+            insert(Expense).returning(Expense.id, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": user_id,
+                    "amount": row["amount"],
+                    "description": row["description"],
+                    "date": row["date"],
+                    "quincenal_cycle": row["quincenal_cycle"],
+                    "status": row["status"],
+                }
+                for row in rows
+            ],
+        )
+        expense_ids = list(result.scalars())
+        links = [
+            {"expense_id": expense_id, "category_id": category_id}
+            for expense_id, row in zip(expense_ids, rows)
+            for category_id in row["category_ids"]
+        ]
+        if links:
+            await self.session.execute(insert(ExpenseCategory), links)
+        for expense_id, row in zip(expense_ids, rows):
+            description_index.record_use(
+                self.session.sync_session,
+                user_id,
+                DescriptionUse(
+                    expense_id=expense_id,
+                    description=row["description"],
+                    amount=float(row["amount"]),
+                    date=row["date"],
+                    category_id=row["category_ids"][0] if row["category_ids"] else None,
+                ),
+            )
+        return expense_ids
+
     async def list_by_range(
         self,
         user_id: int,
         start_date: date,
         end_date: date,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
     ) -> list[Expense]:
         stmt = (
             select(Expense)
@@ -56,10 +159,91 @@ class ExpenseRepository:
                 Expense.date >= start_date,
                 Expense.date <= end_date,
             )
-            .order_by(Expense.date.desc(), Expense.id.desc())
         )
+        stmt = keyset(stmt, Expense.date, Expense.id, limit=limit, after=after)
         return list(await self.session.scalars(stmt))
 
+    async def list_rows_by_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ) -> list[ExpenseRow]:
+        """Read-only variant of ``list_by_range``: one Core query, no ORM identity map.
+
+        Category ids are folded into each row with ``array_agg`` on PostgreSQL and
+        ``group_concat`` elsewhere.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            category_ids = func.array_agg(aggregate_order_by(ExpenseCategory.category_id, ExpenseCategory.id)).filter(
+                ExpenseCategory.category_id.is_not(None)
+            )
+        else:
+            category_ids = func.group_concat(ExpenseCategory.category_id)
+        stmt = (
+            select(
+                Expense.id,
+                Expense.user_id,
+                Expense.amount,
+                Expense.description,
+                Expense.date,
+                Expense.quincenal_cycle,
+                Expense.status,
+                category_ids.label("category_ids"),
+            )
+            .outerjoin(ExpenseCategory, ExpenseCategory.expense_id == Expense.id)
+            .where(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
+            )
+            .group_by(Expense.id)
+        )
+        stmt = keyset(stmt, Expense.date, Expense.id, limit=limit, after=after)
+        return [
+            ExpenseRow(
+                id=row_id,
+                user_id=row_user_id,
+                amount=float(amount),
+                description=description,
+                date=row_date,
+                quincenal_cycle=quincenal_cycle,
+                status=status,
+                category_ids=_category_ids(categories),
+            )
+            for row_id, row_user_id, amount, description, row_date, quincenal_cycle, status, categories in await self.session.execute(stmt)
+        ]
+
+    async def stream_by_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Expense]:
+        """Yield expenses newest first through a server-side cursor, ``batch_size`` rows at a time."""
+        stmt = (
+            select(Expense)
+            .options(selectinload(Expense.expense_categories), raiseload(Expense.categories))
+            .where(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        stmt = keyset(stmt, Expense.date, Expense.id)
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for item in result:
+                yield item
+        finally:
+            await result.close()
+
     async def get_by_id(self, expense_id: int) -> Expense | None:
         stmt = (
             select(Expense)
@@ -82,10 +266,17 @@ class ExpenseRepository:
         quincenal_cycle: int | None = None,
         status: str | None = None,
         category_ids: list[int] | None = None,
+        period: PeriodKey | None = None,
+        previous_period: PeriodKey | None = None,
     ) -> Expense | None:
         expense = await self.get_by_id(expense_id)
         if expense is None:
             return None
+        previous = (
+            expense.amount,
+            expense.status,
+            [link.category_id for link in expense.expense_categories],
+        )
         if amount is not None:
             expense.amount = amount
         if description is not None:
@@ -102,19 +293,207 @@ class ExpenseRepository:
             for category_id in category_ids:
                 expense.expense_categories.append(ExpenseCategory(category_id=category_id))
         await self.session.flush()
+        description_index.record_invalidation(self.session.sync_session, expense.user_id)
+        if category_ids is not None:
+            # ``categories`` maps the same link table; drop the stale copy so a later
+            # delete in this session does not try to remove links that are gone.
+            self.session.expire(expense, ["categories"])
+        if period is not None:
+            previous_amount, previous_status, previous_category_ids = previous
+            await self.rollups.apply_expense(
+                expense.user_id,
+                previous_period or period,
+                amount=previous_amount,
+                status=previous_status,
+                category_ids=previous_category_ids,
+                sign=-1,
+            )
+            await self.rollups.apply_expense(
+                expense.user_id,
+                period,
+                amount=expense.amount,
+                status=expense.status,
+                category_ids=[link.category_id for link in expense.expense_categories],
+            )
         return await self.get_by_id(expense_id)
 
-    async def delete(self, expense_id: int) -> bool:
+    async def delete(self, expense_id: int, *, period: PeriodKey | None = None) -> bool:
         expense = await self.get_by_id(expense_id)
         if expense is None:
             return False
+        if period is not None:
+            await self.rollups.apply_expense(
+                expense.user_id,
+                period,
+                amount=expense.amount,
+                status=expense.status,
+                category_ids=[link.category_id for link in expense.expense_categories],
+                sign=-1,
+            )
         await self.session.delete(expense)
         await self.session.flush()
+        description_index.record_invalidation(self.session.sync_session, expense.user_id)
         return True
 
+    async def list_description_uses(self, user_id: int) -> list[DescriptionUse]:
+        """One row per distinct description: how often it was used and the latest expense using it."""
+        latest = (
+            select(
+                Expense.description,
+                func.count(Expense.id).label("uses"),
+                func.max(Expense.id).label("last_id"),
+            )
+            .where(Expense.user_id == user_id)
+            .group_by(Expense.description)
+            .subquery()
+        )
+        first_category = (
+            select(ExpenseCategory.category_id)
+            .where(ExpenseCategory.expense_id == latest.c.last_id)
+            .order_by(ExpenseCategory.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(
+            latest.c.last_id,
+            latest.c.description,
+            latest.c.uses,
+            Expense.amount,
+            Expense.date,
+            first_category,
+        ).join(Expense, Expense.id == latest.c.last_id)
+        return [
+            DescriptionUse(
+                expense_id=last_id,
+                description=description,
+                amount=float(amount),
+                date=date_value,
+                category_id=category_id,
+                uses=uses,
+            )
+            for last_id, description, uses, amount, date_value, category_id in await self.session.execute(stmt)
+        ]
+
+    async def count_by_range(self, user_id: int, start_date: date, end_date: date) -> int:
+        stmt = select(func.count(Expense.id)).where(
+            Expense.user_id == user_id,
+            Expense.date >= start_date,
+            Expense.date <= end_date,
+        )
+        return int(await self.session.scalar(stmt) or 0)
+
+    async def count_by_user(self, user_id: int) -> int:
+        stmt = select(func.count(Expense.id)).where(Expense.user_id == user_id)
+        return int(await self.session.scalar(stmt) or 0)
+
+    async def list_cycle_batch(self, user_id: int, *, after_id: int = 0, limit: int = 500) -> list[tuple[int, date, int]]:
+        stmt = (
+            select(Expense.id, Expense.date, Expense.quincenal_cycle)
+            .where(Expense.user_id == user_id, Expense.id > after_id)
+            .order_by(Expense.id)
+            .limit(limit)
+        )
+        return [(row.id, row.date, row.quincenal_cycle) for row in await self.session.execute(stmt)]
+
+    async def set_cycles(self, changes: list[tuple[int, date, int]]) -> None:
+        """Bulk-update cycles; rows whose date changed since they were read are skipped."""
+        if not changes:
+            return
+        stmt = (
+            update(Expense.__table__)
+            .where(
+                Expense.__table__.c.id == bindparam("expense_id"),
+                Expense.__table__.c.date == bindparam("expense_date"),
+            )
+            .values(quincenal_cycle=bindparam("cycle"))
+        )
+        await self.session.execute(
+            stmt,
+            [{"expense_id": expense_id, "expense_date": value, "cycle": cycle} for expense_id, value, cycle in changes],
+        )
+
     async def count_category_usage(self, category_id: int) -> int:
         stmt = select(func.count()).select_from(ExpenseCategory).where(
             ExpenseCategory.category_id == category_id
         )
         return int(await self.session.scalar(stmt) or 0)
 
+    async def summarize_range(self, user_id: int, start_date: date, end_date: date) -> ExpenseRangeSummary:
+        is_savings = func.lower(func.trim(Expense.status)) == "completed_savings"
+        stmt = select(
+            func.coalesce(func.sum(Expense.amount), 0.0),
+            func.coalesce(func.sum(case((is_savings, 0.0), else_=Expense.amount)), 0.0),
+            func.count(Expense.id),
+            func.count(func.distinct(Expense.date)),
+        ).where(
+            Expense.user_id == user_id,
+            Expense.date >= start_date,
+            Expense.date <= end_date,
+        )
+        total, total_salary, count, day_count = (await self.session.execute(stmt)).one()
+        return ExpenseRangeSummary(
+            total=float(total or 0),
+            total_salary=float(total_salary or 0),
+            count=int(count or 0),
+            day_count=int(day_count or 0),
+        )
+
+    async def sum_by_category(self, user_id: int, start_date: date, end_date: date) -> dict[int, float]:
+        stmt = (
+            select(ExpenseCategory.category_id, func.sum(Expense.amount))
+            .join(Expense, Expense.id == ExpenseCategory.expense_id)
+            .where(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
+            )
+            .group_by(ExpenseCategory.category_id)
+            .order_by(ExpenseCategory.category_id)
+        )
+        return {int(category_id): float(total or 0) for category_id, total in await self.session.execute(stmt)}
+
+    async def list_recent(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int = 20,
+    ) -> list[RecentExpense]:
+        stmt = (
+            select(Expense.id, Expense.date, Expense.description, Expense.amount)
+            .where(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
+            )
+            .order_by(Expense.date.desc(), Expense.id.desc())
+            .limit(limit)
+        )
+        items = [
+            RecentExpense(id=row.id, date=row.date, description=row.description, amount=float(row.amount))
+            for row in await self.session.execute(stmt)
+        ]
+        if not items:
+            return items
+        by_id = {item.id: item for item in items}
+        links = select(ExpenseCategory.expense_id, ExpenseCategory.category_id).where(
+            ExpenseCategory.expense_id.in_(by_id)
+        ).order_by(ExpenseCategory.id)
+        for expense_id, category_id in await self.session.execute(links):
+            by_id[expense_id].category_ids.append(category_id)
+        return items
+
+    async def list_dates(self, user_id: int, start_date: date, end_date: date) -> list[date]:
+        """Distinct days with at least one expense, in order."""
+        stmt = (
+            select(Expense.date)
+            .where(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
+            )
+            .distinct()
+            .order_by(Expense.date)
+        )
+        return list(await self.session.scalars(stmt))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database.models import FixedPayment, FixedPaymentRecord
@@ -114,6 +114,67 @@ class FixedPaymentRepository:
             return default_status
         return record.status.strip().lower()
 
+    async def get_record_statuses(
+        self,
+        fixed_payment_ids: list[int],
+        year: int,
+        month: int,
+        cycle: int,
+    ) -> dict[int, str]:
+        if not fixed_payment_ids:
+            return {}
+        latest = (
+            select(func.max(FixedPaymentRecord.id).label("record_id"))
+            .where(
+                FixedPaymentRecord.fixed_payment_id.in_(fixed_payment_ids),
+                FixedPaymentRecord.year == year,
+                FixedPaymentRecord.month == month,
+                FixedPaymentRecord.quincenal_cycle == cycle,
+            )
+            .group_by(FixedPaymentRecord.fixed_payment_id)
+            .subquery()
+        )
+        stmt = select(FixedPaymentRecord.fixed_payment_id, FixedPaymentRecord.status).join(
+            latest, FixedPaymentRecord.id == latest.c.record_id
+        )
+        return {
+            payment_id: status.strip().lower()
+            for payment_id, status in await self.session.execute(stmt)
+            if status
+        }
+
+    async def get_record_statuses_for_year(
+        self,
+        fixed_payment_ids: list[int],
+        year: int,
+    ) -> dict[tuple[int, int], dict[int, str]]:
+        if not fixed_payment_ids:
+            return {}
+        latest = (
+            select(func.max(FixedPaymentRecord.id).label("record_id"))
+            .where(
+                FixedPaymentRecord.fixed_payment_id.in_(fixed_payment_ids),
+                FixedPaymentRecord.year == year,
+            )
+            .group_by(
+                FixedPaymentRecord.fixed_payment_id,
+                FixedPaymentRecord.month,
+                FixedPaymentRecord.quincenal_cycle,
+            )
+            .subquery()
+        )
+        stmt = select(
+            FixedPaymentRecord.month,
+            FixedPaymentRecord.quincenal_cycle,
+            FixedPaymentRecord.fixed_payment_id,
+            FixedPaymentRecord.status,
+        ).join(latest, FixedPaymentRecord.id == latest.c.record_id)
+        out: dict[tuple[int, int], dict[int, str]] = {}
+        for month, cycle, payment_id, status in await self.session.execute(stmt):
+            if status:
+                out.setdefault((month, cycle), {})[payment_id] = status.strip().lower()
+        return out
+
     async def set_record_status(
         self,
         fixed_payment_id: int,
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import date
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database.models import ExtraIncome
+from backend.repositories.pagination import KeysetPosition, keyset
+from backend.repositories.rollup_repo import PeriodKey, PeriodRollupRepository
 
 
 class IncomeRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.rollups = PeriodRollupRepository(session)
 
     async def create(
         self,
@@ -20,6 +24,7 @@ class IncomeRepository:
         description: str,
         date_value: date,
         income_type: str = "bonus",
+        period: PeriodKey | None = None,
     ) -> ExtraIncome:
         income = ExtraIncome(
             user_id=user_id,
@@ -30,13 +35,39 @@ class IncomeRepository:
         )
         self.session.add(income)
         await self.session.flush()
+        if period is not None:
+            await self.rollups.apply_income(user_id, period, amount=amount)
         await self.session.refresh(income)
         return income
 
     async def get_by_id(self, income_id: int) -> ExtraIncome | None:
         return await self.session.get(ExtraIncome, income_id)
 
-    async def list_by_range(self, user_id: int, start_date: date, end_date: date) -> list[ExtraIncome]:
+    async def list_by_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ) -> list[ExtraIncome]:
+        stmt = select(ExtraIncome).where(
+            ExtraIncome.user_id == user_id,
+            ExtraIncome.date >= start_date,
+            ExtraIncome.date <= end_date,
+        )
+        stmt = keyset(stmt, ExtraIncome.date, ExtraIncome.id, limit=limit, after=after)
+        return list(await self.session.scalars(stmt))
+
+    async def stream_by_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        *,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ExtraIncome]:
         stmt = (
             select(ExtraIncome)
             .where(
@@ -44,9 +75,15 @@ class IncomeRepository:
                 ExtraIncome.date >= start_date,
                 ExtraIncome.date <= end_date,
             )
-            .order_by(ExtraIncome.date.desc(), ExtraIncome.id.desc())
+            .execution_options(yield_per=batch_size)
         )
-        return list(await self.session.scalars(stmt))
+        stmt = keyset(stmt, ExtraIncome.date, ExtraIncome.id)
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for item in result:
+                yield item
+        finally:
+            await result.close()
 
     async def get_total_by_range(self, user_id: int, start_date: date, end_date: date) -> float:
         stmt = select(func.coalesce(func.sum(ExtraIncome.amount), 0)).where(
@@ -63,10 +100,13 @@ class IncomeRepository:
         amount: float | None = None,
         description: str | None = None,
         date_value: date | None = None,
+        period: PeriodKey | None = None,
+        previous_period: PeriodKey | None = None,
     ) -> ExtraIncome | None:
         income = await self.get_by_id(income_id)
         if income is None:
             return None
+        previous_amount = income.amount
         if amount is not None:
             income.amount = amount
         if description is not None:
@@ -74,12 +114,17 @@ class IncomeRepository:
         if date_value is not None:
             income.date = date_value
         await self.session.flush()
+        if period is not None:
+            await self.rollups.apply_income(income.user_id, previous_period or period, amount=previous_amount, sign=-1)
+            await self.rollups.apply_income(income.user_id, period, amount=income.amount)
         return income
 
-    async def delete(self, income_id: int) -> bool:
+    async def delete(self, income_id: int, *, period: PeriodKey | None = None) -> bool:
         income = await self.get_by_id(income_id)
         if income is None:
             return False
+        if period is not None:
+            await self.rollups.apply_income(income.user_id, period, amount=income.amount, sign=-1)
         await self.session.delete(income)
         await self.session.flush()
         return True
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.database.models import Loan
+from backend.repositories.pagination import KeysetPosition, keyset
 
 
 class LoanRepository:
@@ -39,11 +40,18 @@ class LoanRepository:
     async def get_by_id(self, loan_id: int) -> Loan | None:
         return await self.session.get(Loan, loan_id)
 
-    async def list_by_user(self, user_id: int, *, include_paid: bool = False) -> list[Loan]:
+    async def list_by_user(
+        self,
+        user_id: int,
+        *,
+        include_paid: bool = False,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ) -> list[Loan]:
         stmt = select(Loan).where(Loan.user_id == user_id)
         if not include_paid:
             stmt = stmt.where(Loan.is_paid.is_(False))
-        stmt = stmt.order_by(Loan.date.desc(), Loan.id.desc())
+        stmt = keyset(stmt, Loan.date, Loan.id, limit=limit, after=after)
         return list(await self.session.scalars(stmt))
 
     async def update(
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import date
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+KeysetPosition = tuple[date, int]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(position: KeysetPosition) -> str:
+    value, item_id = position
+    raw = f"{value.isoformat()}|{item_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> KeysetPosition:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        value, item_id = raw.split("|", 1)
+        return date.fromisoformat(value), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor.") from exc
+
+
+def keyset(
+    stmt: Select,
+    date_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    *,
+    limit: int | None = None,
+    after: KeysetPosition | None = None,
+) -> Select:
+    """Order newest first by ``(date, id)`` and resume strictly after ``after``."""
+    if after is not None:
+        value, item_id = after
+        stmt = stmt.where(or_(date_column < value, and_(date_column == value, id_column < item_id)))
+    stmt = stmt.order_by(date_column.desc(), id_column.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
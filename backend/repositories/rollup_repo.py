@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models import (
+    Expense,
+    ExpenseCategory,
+    ExtraIncome,
+    PeriodCategoryRollup,
+    PeriodRollup,
+    User,
+)
+
+PeriodKey = tuple[int, int, int]
+
+
+def is_savings_status(status: str | None) -> bool:
+    return str(status or "").strip().lower() == "completed_savings"
+
+
+@dataclass(slots=True)
+class PeriodTotals:
+    year: int
+    month: int
+    cycle: int
+    expense_salary_total: float = 0.0
+    expense_savings_total: float = 0.0
+    expense_count: int = 0
+    extra_income_total: float = 0.0
+    category_totals: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def expense_total(self) -> float:
+        return self.expense_salary_total + self.expense_savings_total
+
+
+class PeriodRollupRepository:
+    """Per-period expense/income totals kept in step with every write.
+
+    Deltas are applied with ``INSERT ... ON CONFLICT DO UPDATE`` so concurrent
+    writers for the same period add up instead of overwriting each other.
+    Writers and ``replace_for_user`` take ``lock_user`` first, so a rebuild
+    never replaces rows that a concurrent write has just adjusted.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def lock_user(self, user_id: int) -> None:
+        """Hold the user's row lock until the transaction ends.
+
+        Only PostgreSQL needs it; SQLite already serializes writers, and
+        ``replace_for_user`` writes before it reads.
+        """
+        if self.session.get_bind().dialect.name != "postgresql":
+            return
+        await self.session.execute(select(User.id).where(User.id == user_id).with_for_update())
+
+    def _insert(self, table):
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql_insert(table)
+        return sqlite_insert(table)
+
+    async def _add_period(
+        self,
+        user_id: int,
+        period: PeriodKey,
+        *,
+        salary: float = 0.0,
+        savings: float = 0.0,
+        count: int = 0,
+        income: float = 0.0,
+    ) -> None:
+        year, month, cycle = period
+        table = PeriodRollup.__table__
+        stmt = self._insert(table).values(
+            user_id=user_id,
+            year=year,
+            month=month,
+            cycle=cycle,
+            expense_salary_total=salary,
+            expense_savings_total=savings,
+            expense_count=count,
+            extra_income_total=income,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "year", "month", "cycle"],
+            set_={
+                "expense_salary_total": table.c.expense_salary_total + stmt.excluded.expense_salary_total,
+                "expense_savings_total": table.c.expense_savings_total + stmt.excluded.expense_savings_total,
+                "expense_count": table.c.expense_count + stmt.excluded.expense_count,
+                "extra_income_total": table.c.extra_income_total + stmt.excluded.extra_income_total,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def _add_categories(self, user_id: int, period: PeriodKey, totals: dict[int, float]) -> None:
+        if not totals:
+            return
+        year, month, cycle = period
+        table = PeriodCategoryRollup.__table__
+        stmt = self._insert(table).values(
+            [
+                {
+                    "user_id": user_id,
+                    "year": year,
+                    "month": month,
+                    "cycle": cycle,
+                    "category_id": category_id,
+                    "total": total,
+                }
+                for category_id, total in totals.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "year", "month", "cycle", "category_id"],
+            set_={"total": table.c.total + stmt.excluded.total},
+        )
+        await self.session.execute(stmt)
+
+    async def apply_expense(
+        self,
+        user_id: int,
+        period: PeriodKey,
+        *,
+        amount: float,
+        status: str | None,
+        category_ids: list[int],
+        sign: int = 1,
+    ) -> None:
+        delta = float(amount or 0) * sign
+        await self.lock_user(user_id)
+        if is_savings_status(status):
+            await self._add_period(user_id, period, savings=delta, count=sign)
+        else:
+            await self._add_period(user_id, period, salary=delta, count=sign)
+        await self._add_categories(user_id, period, {category_id: delta for category_id in dict.fromkeys(category_ids)})
+
+    async def apply_income(self, user_id: int, period: PeriodKey, *, amount: float, sign: int = 1) -> None:
+        await self.lock_user(user_id)
+        await self._add_period(user_id, period, income=float(amount or 0) * sign)
+
+    async def apply_totals(self, user_id: int, periods: list[PeriodTotals]) -> None:
+        await self.lock_user(user_id)
+        for item in periods:
+            period = (item.year, item.month, item.cycle)
+            await self._add_period(
+                user_id,
+                period,
+                salary=item.expense_salary_total,
+                savings=item.expense_savings_total,
+                count=item.expense_count,
+                income=item.extra_income_total,
+            )
+            await self._add_categories(user_id, period, item.category_totals)
+
+    async def delete_category(self, user_id: int, category_id: int) -> None:
+        """Drop a category's per-period rows; callers ensure no expense still uses it."""
+        await self.session.execute(
+            delete(PeriodCategoryRollup).where(
+                PeriodCategoryRollup.user_id == user_id,
+                PeriodCategoryRollup.category_id == category_id,
+            )
+        )
+
+    async def list_by_user(self, user_id: int, year: int | None = None) -> list[PeriodTotals]:
+        stmt = select(PeriodRollup).where(PeriodRollup.user_id == user_id)
+        category_stmt = select(PeriodCategoryRollup).where(PeriodCategoryRollup.user_id == user_id)
+        if year is not None:
+            stmt = stmt.where(PeriodRollup.year == year)
+            category_stmt = category_stmt.where(PeriodCategoryRollup.year == year)
+        stmt = stmt.order_by(PeriodRollup.year, PeriodRollup.month, PeriodRollup.cycle)
+        category_stmt = category_stmt.order_by(PeriodCategoryRollup.category_id)
+        out: dict[PeriodKey, PeriodTotals] = {}
+        for row in await self.session.scalars(stmt):
+            out[(row.year, row.month, row.cycle)] = PeriodTotals(
+                year=row.year,
+                month=row.month,
+                cycle=row.cycle,
+                expense_salary_total=float(row.expense_salary_total or 0),
+                expense_savings_total=float(row.expense_savings_total or 0),
+                expense_count=int(row.expense_count or 0),
+                extra_income_total=float(row.extra_income_total or 0),
+            )
+        for row in await self.session.scalars(category_stmt):
+            totals = out.get((row.year, row.month, row.cycle))
+            if totals is not None:
+                totals.category_totals[row.category_id] = float(row.total or 0)
+        return list(out.values())
+
+    async def compute_for_user(
+        self,
+        user_id: int,
+        periods_for_dates: Callable[[list[date]], list[PeriodKey]],
+    ) -> list[PeriodTotals]:
+        """Aggregate a user's full history, mapping all dates in one batch."""
+        out: dict[PeriodKey, PeriodTotals] = {}
+
+        def bucket(key: PeriodKey) -> PeriodTotals:
+            if key not in out:
+                out[key] = PeriodTotals(year=key[0], month=key[1], cycle=key[2])
+            return out[key]
+
+        links: dict[int, list[int]] = defaultdict(list)
+        link_stmt = (
+            select(ExpenseCategory.expense_id, ExpenseCategory.category_id)
+            .join(Expense, Expense.id == ExpenseCategory.expense_id)
+            .where(Expense.user_id == user_id)
+            .order_by(ExpenseCategory.id)
+        )
+        for expense_id, category_id in await self.session.execute(link_stmt):
+            links[expense_id].append(category_id)
+
+        expense_stmt = select(Expense.id, Expense.date, Expense.amount, Expense.status).where(Expense.user_id == user_id)
+        expenses = (await self.session.execute(expense_stmt)).all()
+        income_stmt = select(ExtraIncome.date, ExtraIncome.amount).where(ExtraIncome.user_id == user_id)
+        income = (await self.session.execute(income_stmt)).all()
+        keys = periods_for_dates([row.date for row in expenses] + [row.date for row in income])
+
+        for (expense_id, _, amount, status), key in zip(expenses, keys):
+            totals = bucket(key)
+            amount = float(amount or 0)
+            if is_savings_status(status):
+                totals.expense_savings_total += amount
+            else:
+                totals.expense_salary_total += amount
+            totals.expense_count += 1
+            for category_id in dict.fromkeys(links.get(expense_id, ())):
+                totals.category_totals[category_id] = totals.category_totals.get(category_id, 0.0) + amount
+
+        for (_, amount), key in zip(income, keys[len(expenses):]):
+            bucket(key).extra_income_total += float(amount or 0)
+        return [out[key] for key in sorted(out)]
+
+    async def replace_for_user(
+        self,
+        user_id: int,
+        periods_for_dates: Callable[[list[date]], list[PeriodKey]],
+    ) -> list[PeriodTotals]:
+        """Recompute a user's rollups from scratch.
+
+        The old rows are deleted before the history is read: on SQLite that
+        opens the write transaction, so no other write can commit between the
+        read and the insert; on PostgreSQL ``lock_user`` does the same.
+        """
+        await self.lock_user(user_id)
+        await self.session.execute(delete(PeriodCategoryRollup).where(PeriodCategoryRollup.user_id == user_id))
+        await self.session.execute(delete(PeriodRollup).where(PeriodRollup.user_id == user_id))
+        periods = await self.compute_for_user(user_id, periods_for_dates)
+        if not periods:
+            return periods
+        await self.session.execute(
+            insert(PeriodRollup),
+            [
+                {
+                    "user_id": user_id,
+                    "year": item.year,
+                    "month": item.month,
+                    "cycle": item.cycle,
+                    "expense_salary_total": item.expense_salary_total,
+                    "expense_savings_total": item.expense_savings_total,
+                    "expense_count": item.expense_count,
+                    "extra_income_total": item.extra_income_total,
+                }
+                for item in periods
+            ],
+        )
+        category_rows = [
+            {
+                "user_id": user_id,
+                "year": item.year,
+                "month": item.month,
+                "cycle": item.cycle,
+                "category_id": category_id,
+                "total": total,
+            }
+            for item in periods
+            for category_id, total in item.category_totals.items()
+        ]
+        if category_rows:
+            await self.session.execute(insert(PeriodCategoryRollup), category_rows)
+        return periods
@@ -34,6 +34,14 @@ class SavingsRepository:
         )
         return await self.session.scalar(stmt)
 
+    async def list_by_year(self, user_id: int, year: int) -> list[Savings]:
+        stmt = (
+            select(Savings)
+            .where(Savings.user_id == user_id, Savings.year == year)
+            .order_by(Savings.month, Savings.quincenal_cycle)
+        )
+        return list(await self.session.scalars(stmt))
+
     async def record_savings(
         self,
         user_id: int,
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Date, String, cast, column, func, literal_column, null, select, table, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models import Expense, ExtraIncome, FixedPayment, Loan
+from backend.database.search_index import (
+    SEARCH_SOURCES,
+    SearchSource,
+    fts_match,
+    search_query,
+    search_terms,
+    search_vector,
+)
+
+_MODELS = {
+    "expense": Expense,
+    "income": ExtraIncome,
+    "loan": Loan,
+    "fixed_payment": FixedPayment,
+}
+
+
+@dataclass(slots=True)
+class SearchHit:
+    kind: str
+    id: int
+    title: str
+    detail: str | None
+    amount: float
+    date: date | None
+    rank: float
+
+
+class SearchRepository:
+    """Ranked full-text search over a user's expenses, income, loans and fixed payments.
+
+    Lower ``rank`` is a better match on both backends: SQLite's ``bm25`` is
+    already negative-is-better and PostgreSQL's ``ts_rank`` is negated.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _select(self, source: SearchSource, user_id: int, terms: list[str], postgres: bool):
+        source_table = _MODELS[source.kind].__table__
+        title = source_table.c[source.columns[0]]
+        detail = source_table.c[source.columns[1]] if len(source.columns) > 1 else cast(null(), String)
+        date_column = source_table.c.date if "date" in source_table.c else cast(null(), Date)
+        columns = [
+            literal_column(f"'{source.kind}'").label("kind"),
+            source_table.c.id.label("id"),
+            title.label("title"),
+            detail.label("detail"),
+            source_table.c.amount.label("amount"),
+            date_column.label("date"),
+        ]
+        if postgres:
+            vector = search_vector(*(source_table.c[name] for name in source.columns))
+            query = search_query(terms)
+            stmt = select(*columns, (-func.ts_rank(vector, query)).label("rank")).where(vector.bool_op("@@")(query))
+        else:
+            fts = table(source.fts_table, column("rowid"))
+            match = literal_column(source.fts_table)
+            # Weight 0 for the user_key column so only the text columns score.
+            rank = func.bm25(match, 0.0, *(1.0 for _ in source.columns))
+            stmt = (
+                select(*columns, rank.label("rank"))
+                .select_from(fts)
+                .join(source_table, source_table.c.id == fts.c.rowid)
+                .where(match.match(fts_match(user_id, terms)))
+            )
+        stmt = stmt.where(source_table.c.user_id == user_id)
+        if "is_active" in source_table.c:
+            stmt = stmt.where(source_table.c.is_active.is_(True))
+        return stmt
+
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SearchHit]:
+        terms = search_terms(query)
+        sources = [source for source in SEARCH_SOURCES if kinds is None or source.kind in kinds]
+        if not terms or not sources:
+            return []
+        postgres = self.session.get_bind().dialect.name == "postgresql"
+        hits = union_all(*(self._select(source, user_id, terms, postgres) for source in sources)).subquery()
+        stmt = select(hits).order_by(hits.c.rank, hits.c.kind, hits.c.id.desc()).limit(limit).offset(offset)
+        return [
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                title=row.title,
+                detail=row.detail,
+                amount=float(row.amount or 0),
+                date=row.date,
+                rank=float(row.rank or 0),
+            )
+            for row in await self.session.execute(stmt)
+        ]
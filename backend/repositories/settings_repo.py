@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import Date, Float, String, cast, literal, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database.models import (
@@ -15,6 +16,37 @@ from backend.database.models import (
 )
 
 
+@dataclass(slots=True)
+class UserFinanceContext:
+    user_id: int
+    period_mode: str = "quincenal"
+    salary: float = 0.0
+    settings: dict[str, str] = field(default_factory=dict)
+    salary_overrides: dict[tuple[int, int, int], float] = field(default_factory=dict)
+    custom_quincenas: dict[tuple[int, int, int], tuple[date, date]] = field(default_factory=dict)
+
+    def get_setting(self, key: str, default_value: str = "") -> str:
+        return self.settings.get(key, default_value)
+
+    @property
+    def quincenal_paydays(self) -> tuple[int, int]:
+        day1 = int(self.get_setting("quincenal_pay_day_1", "1") or 1)
+        day2 = int(self.get_setting("quincenal_pay_day_2", "16") or 16)
+        if day1 == day2:
+            day2 = 15 if day1 == 16 else 16
+        return day1, day2
+
+    @property
+    def monthly_pay_day(self) -> int:
+        return int(self.get_setting("monthly_pay_day", "1") or 1)
+
+    def salary_override(self, year: int, month: int, cycle: int) -> float | None:
+        return self.salary_overrides.get((year, month, cycle))
+
+    def custom_quincena(self, year: int, month: int, cycle: int) -> tuple[date, date] | None:
+        return self.custom_quincenas.get((year, month, cycle))
+
+
 class SettingsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -231,3 +263,52 @@ class SettingsRepository:
         await self.session.delete(record)
         await self.session.flush()
         return True
+
+    async def load_finance_context(self, user_id: int) -> UserFinanceContext:
+        context = UserFinanceContext(user_id=user_id)
+        scalars_stmt = union_all(
+            select(literal("setting", String), UserSetting.setting_key, UserSetting.setting_value).where(
+                UserSetting.user_id == user_id
+            ),
+            select(literal("period_mode", String), literal("", String), UserPeriodMode.mode).where(
+                UserPeriodMode.user_id == user_id
+            ),
+            select(literal("salary", String), literal("", String), cast(UserSalary.amount, String)).where(
+                UserSalary.user_id == user_id
+            ),
+        )
+        for kind, key, value in await self.session.execute(scalars_stmt):
+            if kind == "setting":
+                context.settings[key] = value
+            elif kind == "period_mode":
+                context.period_mode = "mensual" if str(value).lower() == "mensual" else "quincenal"
+            elif kind == "salary":
+                context.salary = float(value or 0)
+
+        periods_stmt = union_all(
+            select(
+                literal("override", String),
+                SalaryOverride.year,
+                SalaryOverride.month,
+                SalaryOverride.cycle,
+                SalaryOverride.amount,
+                cast(null(), Date),
+                cast(null(), Date),
+            ).where(SalaryOverride.user_id == user_id),
+            select(
+                literal("custom", String),
+                CustomQuincena.year,
+                CustomQuincena.month,
+                CustomQuincena.cycle,
+                cast(null(), Float),
+                CustomQuincena.start_date,
+                CustomQuincena.end_date,
+            ).where(CustomQuincena.user_id == user_id),
+        )
+        for kind, year, month, cycle, amount, start_date, end_date in await self.session.execute(periods_stmt):
+            key = (int(year), int(month), int(cycle))
+            if kind == "override":
+                context.salary_overrides[key] = float(amount)
+            else:
+                context.custom_quincenas[key] = (start_date, end_date)
+        return context
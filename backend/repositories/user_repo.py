@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database.models import User
@@ -42,6 +42,13 @@ class UserRepository:
         statement = select(User).where(User.email == email)
         return (await self.session.scalars(statement)).first()
 
+    async def list_username_variants(self, base: str) -> set[str]:
+        """``base`` and every ``base-...`` username that already exists."""
+        statement = select(User.username).where(
+            or_(User.username == base, User.username.startswith(f'{base}-', autoescape=True))
+        )
+        return set((await self.session.scalars(statement)).all())
+
     async def list_active(self) -> list[User]:
         statement = select(User).where(User.is_active.is_(True)).order_by(User.id)
         return list((await self.session.scalars(statement)).all())
@@ -78,5 +85,16 @@ class UserRepository:
         if user is None:
             return False
         user.is_active = False
+        user.token_epoch += 1
         await self.session.flush()
         return True
+
+    async def bump_token_epoch(self, user_id: int, *, expected: int) -> bool:
+        """Revoke every access token issued at ``expected``; ``False`` if the epoch already moved on."""
+        statement = (
+            update(User)
+            .where(User.id == user_id, User.token_epoch == expected)
+            .values(token_epoch=User.token_epoch + 1)
+        )
+        result = await self.session.execute(statement)
+        return bool(result.rowcount)
@@ -1,6 +1,7 @@
 from backend.routers import (
     auth,
     backup,
+    batch,
     categories,
     dashboard,
     debts,
@@ -10,6 +11,7 @@ from backend.routers import (
     income,
     loans,
     savings,
+    search,
     settings,
     subscription,
     sync,
@@ -18,6 +20,7 @@ from backend.routers import (
 __all__ = [
     'auth',
     'backup',
+    'batch',
     'categories',
     'dashboard',
     'debts',
@@ -27,6 +30,7 @@ __all__ = [
     'income',
     'loans',
     'savings',
+    'search',
     'settings',
     'subscription',
 ]
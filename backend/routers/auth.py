@@ -37,7 +37,7 @@ def to_user_read(user) -> UserRead:
         id=user.id,
         username=user.username,
         email=user.email,
-        pin_enabled=bool(getattr(user, 'pin_hash', None) or getattr(user, 'pin_enabled', False)),
+        pin_enabled=bool(getattr(user, 'pin_hash', None) or getattr(user, 'pin_length', 0) or getattr(user, 'pin_enabled', False)),
     )
 
 
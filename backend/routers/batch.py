@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from backend.config import get_settings
+from backend.middleware import get_expense_import_quota, get_finance_use_cases
+from backend.routers import expenses, fixed_payments, income
+from backend.schemas.batch import BatchOperation, BatchOperationResult, BatchRequest, BatchResponse
+from backend.schemas.expense import ExpenseCreate, ExpenseUpdate
+from backend.schemas.fixed_payment import FixedPaymentCreate, FixedPaymentUpdate
+from backend.schemas.income import IncomeCreate, IncomeUpdate
+from backend.schemas.loan import LoanCreate, LoanRead, LoanUpdate
+from backend.schemas.savings import SavingsGoalCreate, SavingsGoalRead, SavingsGoalUpdate
+from backend.services.finance_service import FinanceError
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+Handler = Callable[[Any, int | None, Any], Awaitable[BaseModel | None]]
+
+
+def _missing_fields(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+async def _create_expense(uc, _id: int | None, payload: ExpenseCreate) -> BaseModel:
+    item = await uc.expenses.create(
+        amount=payload.amount,
+        description=payload.description,
+        category_id=payload.category_id,
+        date_value=payload.date,
+        source=payload.source,
+    )
+    return expenses.to_read(item)
+
+
+async def _update_expense(uc, item_id: int, payload: ExpenseUpdate) -> BaseModel:
+    if payload.amount is None or not payload.description or payload.category_id is None or payload.date is None:
+        raise _missing_fields("Para actualizar un gasto se requieren amount, description, category_id y date.")
+    item = await uc.expenses.update(
+        item_id,
+        amount=payload.amount,
+        description=payload.description,
+        category_id=payload.category_id,
+        date_value=payload.date,
+    )
+    return expenses.to_read(item)
+
+
+async def _create_income(uc, _id: int | None, payload: IncomeCreate) -> BaseModel:
+    return income.to_read(await uc.income.create(amount=payload.amount, description=payload.description, date_value=payload.date))
+
+
+async def _update_income(uc, item_id: int, payload: IncomeUpdate) -> BaseModel:
+    if payload.amount is None or not payload.description or payload.date is None:
+        raise _missing_fields("Para actualizar un ingreso se requieren amount, description y date.")
+    item = await uc.income.update(item_id, amount=payload.amount, description=payload.description, date_value=payload.date)
+    return income.to_read(item)
+
+
+async def _create_fixed_payment(uc, _id: int | None, payload: FixedPaymentCreate) -> BaseModel:
+    item = await uc.fixed_payments.create(
+        name=payload.name,
+        amount=payload.amount,
+        due_day=payload.due_day,
+        category_id=payload.category_id,
+        no_fixed_date=payload.no_fixed_date,
+    )
+    return fixed_payments.to_read(item)
+
+
+async def _update_fixed_payment(uc, item_id: int, payload: FixedPaymentUpdate) -> BaseModel:
+    if not payload.name or payload.amount is None or payload.due_day is None:
+        raise _missing_fields("Para actualizar un pago fijo se requieren name, amount y due_day.")
+    item = await uc.fixed_payments.update(
+        item_id,
+        name=payload.name,
+        amount=payload.amount,
+        due_day=payload.due_day,
+        category_id=payload.category_id,
+        no_fixed_date=payload.no_fixed_date,
+    )
+    return fixed_payments.to_read(item)
+
+
+async def _create_loan(uc, _id: int | None, payload: LoanCreate) -> BaseModel:
+    item = await uc.loans.create(
+        person=payload.person,
+        amount=payload.amount,
+        description=payload.description,
+        date_value=payload.date,
+        deduction_type=payload.deduction_type,
+    )
+    return LoanRead.model_validate(item)
+
+
+async def _update_loan(uc, item_id: int, payload: LoanUpdate) -> BaseModel:
+    if payload.person is None or payload.amount is None or payload.date is None or payload.deduction_type is None:
+        raise _missing_fields("person, amount, date y deduction_type son requeridos.")
+    item = await uc.loans.update(
+        item_id,
+        person=payload.person,
+        amount=payload.amount,
+        description=payload.description,
+        date_value=payload.date,
+        deduction_type=payload.deduction_type,
+    )
+    return LoanRead.model_validate(item)
+
+
+async def _create_goal(uc, _id: int | None, payload: SavingsGoalCreate) -> BaseModel:
+    return SavingsGoalRead.model_validate(await uc.savings.create_goal(payload.name, payload.target_amount))
+
+
+async def _update_goal(uc, item_id: int, payload: SavingsGoalUpdate) -> BaseModel:
+    if not payload.name or payload.target_amount is None:
+        raise _missing_fields("Para actualizar una meta se requieren name y target_amount.")
+    return SavingsGoalRead.model_validate(await uc.savings.update_goal(item_id, payload.name, payload.target_amount))
+
+
+# Each operation calls the same use case, with the same required fields and
+# read model, as its standalone endpoint; FinanceError maps to 400 on create
+# and 404 otherwise, as those endpoints do.
+OPERATIONS: dict[tuple[str, str], tuple[type[BaseModel] | None, Handler]] = {
+    ("expense", "create"): (ExpenseCreate, _create_expense),
+    ("expense", "update"): (ExpenseUpdate, _update_expense),
+    ("expense", "delete"): (None, lambda uc, item_id, _payload: uc.expenses.delete(item_id)),
+    ("income", "create"): (IncomeCreate, _create_income),
+    ("income", "update"): (IncomeUpdate, _update_income),
+    ("income", "delete"): (None, lambda uc, item_id, _payload: uc.income.delete(item_id)),
+    ("fixed_payment", "create"): (FixedPaymentCreate, _create_fixed_payment),
+    ("fixed_payment", "update"): (FixedPaymentUpdate, _update_fixed_payment),
+    ("fixed_payment", "delete"): (None, lambda uc, item_id, _payload: uc.fixed_payments.delete(item_id)),
+    ("loan", "create"): (LoanCreate, _create_loan),
+    ("loan", "update"): (LoanUpdate, _update_loan),
+    ("loan", "delete"): (None, lambda uc, item_id, _payload: uc.loans.delete(item_id)),
+    ("savings_goal", "create"): (SavingsGoalCreate, _create_goal),
+    ("savings_goal", "update"): (SavingsGoalUpdate, _update_goal),
+    ("savings_goal", "delete"): (None, lambda uc, item_id, _payload: uc.savings.delete_goal(item_id)),
+}
+
+SUCCESS_STATUS = {
+    "create": status.HTTP_201_CREATED,
+    "update": status.HTTP_200_OK,
+    "delete": status.HTTP_204_NO_CONTENT,
+}
+
+
+class BatchAborted(Exception):
+    pass
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors())
+
+
+def _result(index: int, op: BatchOperation, status_code: int, *, data: dict[str, Any] | None = None, error: str | None = None) -> BatchOperationResult:
+    return BatchOperationResult(
+        index=index,
+        resource=op.resource,
+        action=op.action,
+        status=status_code,
+        ok=error is None,
+        data=data,
+        error=error,
+    )
+
+
+async def _run_operation(uc, index: int, op: BatchOperation, *, isolated: bool) -> BatchOperationResult:
+    schema, handler = OPERATIONS[(op.resource, op.action)]
+    try:
+        if op.action != "create" and op.id is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="id es requerido para update y delete.")
+        payload = schema.model_validate(op.data) if schema is not None else None
+        async with uc.batch.operation(isolated=isolated):
+            item = await handler(uc, op.id, payload)
+    except ValidationError as exc:
+        return _result(index, op, status.HTTP_422_UNPROCESSABLE_ENTITY, error=_validation_message(exc))
+    except HTTPException as exc:
+        return _result(index, op, exc.status_code, error=str(exc.detail))
+    except FinanceError as exc:
+        status_code = status.HTTP_400_BAD_REQUEST if op.action == "create" else status.HTTP_404_NOT_FOUND
+        return _result(index, op, status_code, error=str(exc))
+    except IntegrityError:
+        return _result(index, op, status.HTTP_409_CONFLICT, error="La operacion viola una restriccion de datos.")
+    data = item.model_dump(mode="json") if isinstance(item, BaseModel) else None
+    return _result(index, op, SUCCESS_STATUS[op.action], data=data)
+
+
+async def _counts_against_quota(uc, op: BatchOperation) -> bool:
+    # Same rule as the import quota: only expenses dated in the current period count.
+    if (op.resource, op.action) != ("expense", "create"):
+        return False
+    try:
+        payload = ExpenseCreate.model_validate(op.data)
+    except ValidationError:
+        return False
+    return await uc.expenses.in_current_period(payload.date)
+
+
+@router.post("", response_model=BatchResponse)
+async def run_batch(
+    payload: BatchRequest,
+    quota=Depends(get_expense_import_quota),
+    uc=Depends(get_finance_use_cases),
+):
+    max_operations = get_settings().batch_max_operations
+    if len(payload.operations) > max_operations:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Un lote admite como maximo {max_operations} operaciones.",
+        )
+    results: list[BatchOperationResult] = []
+    committed = True
+    try:
+        async with uc.batch.transaction():
+            for index, op in enumerate(payload.operations):
+                counted = quota is not None and await _counts_against_quota(uc, op)
+                if counted and quota <= 0:
+                    result = _result(
+                        index,
+                        op,
+                        status.HTTP_403_FORBIDDEN,
+                        error="Plan free excedio el limite de gastos para este periodo.",
+                    )
+                else:
+                    result = await _run_operation(uc, index, op, isolated=not payload.atomic)
+                    if result.ok and counted:
+                        quota -= 1
+                results.append(result)
+                if payload.atomic and not result.ok:
+                    raise BatchAborted
+    except BatchAborted:
+        committed = False
+        failed = results[-1]
+        for result in results[:-1]:
+            result.ok, result.status, result.data = False, status.HTTP_424_FAILED_DEPENDENCY, None
+            result.error = f"Revertida: la operacion {failed.index} del lote fallo."
+        for index, op in enumerate(payload.operations[len(results):], start=len(results)):
+            results.append(
+                _result(
+                    index,
+                    op,
+                    status.HTTP_424_FAILED_DEPENDENCY,
+                    error=f"No ejecutada: la operacion {failed.index} del lote fallo.",
+                )
+            )
+    return BatchResponse(committed=committed, results=results)
@@ -5,7 +5,7 @@ from dataclasses import asdict
 from fastapi import APIRouter, Depends
 
 from backend.middleware import get_finance_use_cases
-from backend.schemas.dashboard import DashboardRead
+from backend.schemas.dashboard import DashboardRead, YearOverviewResponse
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -21,3 +21,11 @@ async def get_dashboard(
     payload = asdict(data)
     payload["quincena_range"] = [data.quincena_range.start, data.quincena_range.end]
     return DashboardRead(**payload)
+
+
+@router.get("/year", response_model=YearOverviewResponse)
+async def get_year_overview(
+    year: int | None = None,
+    uc=Depends(get_finance_use_cases),
+):
+    return YearOverviewResponse(**asdict(await uc.dashboard.year(year=year)))
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from backend.middleware import get_finance_use_cases
+from backend.routers.pagination import PageParams, page_params
 from backend.schemas.debt import (
     DebtCreate,
     DebtListResponse,
@@ -71,12 +72,17 @@ async def add_debt_payment(debt_id: int, payload: DebtPaymentCreate, uc=Depends(
 
 
 @router.get('/debts/{debt_id}/payments', response_model=list[DebtPaymentRead])
-async def list_debt_payments(debt_id: int, uc=Depends(get_finance_use_cases)):
+async def list_debt_payments(
+    debt_id: int,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    uc=Depends(get_finance_use_cases),
+):
     try:
-        items = await uc.debts.list_payments(debt_id)
+        items = await uc.debts.list_payments(debt_id, limit=page.fetch_limit, after=page.after)
     except FinanceError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return [DebtPaymentRead.model_validate(item) for item in items]
+    return [DebtPaymentRead.model_validate(item) for item in page.finish(items, response, date_field="payment_date")]
 
 
 @router.get('/personal-debts', response_model=PersonalDebtListResponse)
@@ -133,9 +139,14 @@ async def add_personal_payment(debt_id: int, payload: PersonalDebtPaymentCreate,
 
 
 @router.get('/personal-debts/{debt_id}/payments', response_model=list[PersonalDebtPaymentRead])
-async def list_personal_payments(debt_id: int, uc=Depends(get_finance_use_cases)):
+async def list_personal_payments(
+    debt_id: int,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    uc=Depends(get_finance_use_cases),
+):
     try:
-        items = await uc.personal_debts.list_payments(debt_id)
+        items = await uc.personal_debts.list_payments(debt_id, limit=page.fetch_limit, after=page.after)
     except FinanceError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return [PersonalDebtPaymentRead.model_validate(item) for item in items]
+    return [PersonalDebtPaymentRead.model_validate(item) for item in page.finish(items, response, date_field="payment_date")]
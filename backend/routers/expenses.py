@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from backend.middleware import enforce_freemium_expense_limit, get_finance_use_cases
-from backend.schemas.expense import ExpenseCreate, ExpenseRead, ExpenseUpdate
+from backend.middleware import enforce_freemium_expense_limit, get_expense_import_quota, get_finance_use_cases
+from backend.routers.pagination import PageParams, page_params
+from backend.routers.streaming import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
+from backend.schemas.expense import (
+    ExpenseCreate,
+    ExpenseImportResponse,
+    ExpenseRead,
+    ExpenseSuggestionRead,
+    ExpenseUpdate,
+)
+from backend.services.expense_import import ExpenseImportFormatError, parse_expense_import
 from backend.services.finance_service import FinanceError
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
@@ -23,9 +33,29 @@ def to_read(expense) -> ExpenseRead:
     )
 
 
-@router.get("", response_model=list[ExpenseRead])
-async def list_expenses(start: date, end: date, uc=Depends(get_finance_use_cases)):
-    return [to_read(item) for item in await uc.expenses.list(start, end)]
+@router.get("", response_model=list[ExpenseRead], responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def list_expenses(
+    start: date,
+    end: date,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    uc=Depends(get_finance_use_cases),
+):
+    if wants_ndjson(request):
+        return ndjson_response(uc.expenses.stream(start, end), to_read)
+    items = await uc.expenses.list(start, end, limit=page.fetch_limit, after=page.after)
+    return [to_read(item) for item in page.finish(items, response)]
+
+
+@router.get("/suggest", response_model=list[ExpenseSuggestionRead])
+async def suggest_expenses(
+    prefix: str = Query(min_length=1, max_length=255),
+    limit: int = Query(default=8, ge=1, le=50),
+    uc=Depends(get_finance_use_cases),
+):
+    items = await uc.expenses.suggest(prefix, limit=limit)
+    return [ExpenseSuggestionRead.model_validate(item) for item in items]
 
 
 @router.post("", response_model=ExpenseRead, status_code=status.HTTP_201_CREATED)
@@ -47,6 +77,30 @@ async def create_expense(
     return to_read(item)
 
 
+@router.post("/import", response_model=ExpenseImportResponse)
+async def import_expenses(
+    request: Request,
+    quota=Depends(get_expense_import_quota),
+    uc=Depends(get_finance_use_cases),
+):
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Debes adjuntar un archivo CSV o JSON.")
+        content = await upload.read()
+        content_type = upload.content_type or ("text/csv" if (upload.filename or "").lower().endswith(".csv") else "")
+    else:
+        content = await request.body()
+    try:
+        rows = parse_expense_import(content, content_type)
+        result = await uc.expenses.import_rows(rows, current_period_quota=quota)
+    except (ExpenseImportFormatError, FinanceError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return ExpenseImportResponse(**asdict(result))
+
+
 @router.put("/{expense_id}", response_model=ExpenseRead)
 async def update_expense(expense_id: int, payload: ExpenseUpdate, uc=Depends(get_finance_use_cases)):
     if payload.amount is None or not payload.description or payload.category_id is None or payload.date is None:
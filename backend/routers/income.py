@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
 
 from backend.middleware import get_finance_use_cases
+from backend.routers.pagination import PageParams, page_params
+from backend.routers.streaming import NDJSON_MEDIA_TYPE, ndjson_response, wants_ndjson
 from backend.schemas.income import IncomeCreate, IncomeRead, IncomeUpdate, SalaryOverrideDelete, SalaryOverrideRequest, SalaryRead, SalaryUpdate
 from backend.services.finance_service import FinanceError
 
@@ -48,9 +50,19 @@ async def delete_salary_override(payload: SalaryOverrideDelete = Body(...), uc=D
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.get("/income", response_model=list[IncomeRead])
-async def list_income(start: date, end: date, uc=Depends(get_finance_use_cases)):
-    return [to_read(item) for item in await uc.income.list(start, end)]
+@router.get("/income", response_model=list[IncomeRead], responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}})
+async def list_income(
+    start: date,
+    end: date,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    uc=Depends(get_finance_use_cases),
+):
+    if wants_ndjson(request):
+        return ndjson_response(uc.income.stream(start, end), to_read)
+    items = await uc.income.list(start, end, limit=page.fetch_limit, after=page.after)
+    return [to_read(item) for item in page.finish(items, response)]
 
 
 @router.post("/income", response_model=IncomeRead, status_code=status.HTTP_201_CREATED)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from backend.middleware import get_finance_use_cases
+from backend.routers.pagination import PageParams, page_params
 from backend.schemas.loan import LoanCreate, LoanPayResponse, LoanRead, LoanUpdate
 from backend.services.finance_service import FinanceError
 
@@ -10,8 +11,14 @@ router = APIRouter(prefix='/loans', tags=['loans'])
 
 
 @router.get('', response_model=list[LoanRead])
-async def list_loans(include_paid: bool = False, uc=Depends(get_finance_use_cases)):
-    return [LoanRead.model_validate(item) for item in await uc.loans.list(include_paid=include_paid)]
+async def list_loans(
+    response: Response,
+    include_paid: bool = False,
+    page: PageParams = Depends(page_params),
+    uc=Depends(get_finance_use_cases),
+):
+    items = await uc.loans.list(include_paid=include_paid, limit=page.fetch_limit, after=page.after)
+    return [LoanRead.model_validate(item) for item in page.finish(items, response)]
 
 
 @router.post('', response_model=LoanRead, status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from fastapi import HTTPException, Query, Response, status
+
+from backend.config import get_settings
+from backend.repositories.pagination import InvalidCursorError, KeysetPosition, decode_cursor, encode_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class PageParams:
+    limit: int | None
+    after: KeysetPosition | None
+
+    @property
+    def fetch_limit(self) -> int | None:
+        # One extra row tells us whether another page exists.
+        return None if self.limit is None else self.limit + 1
+
+    def finish(self, items: Sequence[T], response: Response, *, date_field: str = "date") -> list[T]:
+        items = list(items)
+        if self.limit is None or len(items) <= self.limit:
+            return items
+        items = items[: self.limit]
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor((getattr(last, date_field), last.id))
+        return items
+
+
+def page_params(
+    limit: int | None = Query(default=None, ge=1),
+    cursor: str | None = Query(default=None),
+) -> PageParams:
+    max_size = get_settings().list_page_max_size
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor invalido.") from exc
+        limit = limit or max_size
+    if limit is not None:
+        limit = min(limit, max_size)
+    return PageParams(limit=limit, after=after)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+
+from backend.middleware import get_finance_use_cases
+from backend.schemas.search import SearchKind, SearchResponse, SearchResultRead
+
+router = APIRouter(prefix='/search', tags=['search'])
+
+
+@router.get('', response_model=SearchResponse)
+async def search(
+    q: str = Query(min_length=1, max_length=200),
+    kind: list[SearchKind] | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    uc=Depends(get_finance_use_cases),
+):
+    items = await uc.search.search(q, kinds=kind, limit=limit + 1, offset=offset)
+    return SearchResponse(
+        query=q,
+        results=[SearchResultRead.model_validate(item) for item in items[:limit]],
+        next_offset=offset + limit if len(items) > limit else None,
+    )
@@ -3,7 +3,13 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 
 from backend.middleware import get_finance_use_cases
-from backend.schemas.settings import CustomQuincenaRead, CustomQuincenaUpdate, SettingsRead, SettingsUpdate
+from backend.schemas.settings import (
+    CustomQuincenaRead,
+    CustomQuincenaUpdate,
+    CycleRecomputeRead,
+    SettingsRead,
+    SettingsUpdate,
+)
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
@@ -28,6 +34,17 @@ async def update_settings(payload: SettingsUpdate, uc=Depends(get_finance_use_ca
     )
 
 
+@router.get("/cycle-recompute", response_model=CycleRecomputeRead)
+async def get_cycle_recompute(uc=Depends(get_finance_use_cases)):
+    status = await uc.settings.get_cycle_recompute_status()
+    return CycleRecomputeRead(**status) if status is not None else CycleRecomputeRead(status="idle")
+
+
+@router.post("/cycle-recompute", response_model=CycleRecomputeRead, status_code=202)
+async def start_cycle_recompute(uc=Depends(get_finance_use_cases)):
+    return CycleRecomputeRead(**await uc.settings.start_cycle_recompute())
+
+
 @router.get("/quincena", response_model=CustomQuincenaRead)
 async def get_custom_quincena(year: int, month: int, cycle: int, uc=Depends(get_finance_use_cases)):
     start_date, end_date = await uc.settings.get_custom_quincena(year, month, cycle)
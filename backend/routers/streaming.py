@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from typing import TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(items: AsyncIterator[T], to_read: Callable[[T], BaseModel]) -> StreamingResponse:
+    """Serialize rows one at a time as they come off the cursor, flushing in ~64 KiB chunks.
+
+    ``items`` usually reads through the request's ``get_db`` session, which
+    FastAPI (>= 0.118) keeps open until the response has been sent.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        async for item in items:
+            buffer += to_read(item).model_dump_json().encode()
+            buffer += b"\n"
+            if len(buffer) >= CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -1,7 +1,8 @@
 from backend.schemas.auth import LoginRequest, PinLoginRequest, RegisterRequest, TokenResponse, UserRead
 from backend.schemas.backup import BackupCreateResponse, BackupItem, BackupRestoreRequest, BackupRestoreResponse
+from backend.schemas.batch import BatchOperation, BatchOperationResult, BatchRequest, BatchResponse
 from backend.schemas.category import CategoryCreate, CategoryRead, CategoryUpdate
-from backend.schemas.dashboard import DashboardResponse
+from backend.schemas.dashboard import DashboardResponse, PeriodSummaryRead, YearOverviewResponse
 from backend.schemas.debt import (
     DebtCreate,
     DebtListResponse,
@@ -16,13 +17,13 @@ from backend.schemas.debt import (
     PersonalDebtRead,
     PersonalDebtSummary,
 )
-from backend.schemas.expense import ExpenseCreate, ExpenseRead, ExpenseUpdate
+from backend.schemas.expense import ExpenseCreate, ExpenseImportResponse, ExpenseRead, ExpenseUpdate
 from backend.schemas.export import BackupRead, CheckoutResponse, ExportInfo, SubscriptionStatusRead, WebhookResponse
 from backend.schemas.fixed_payment import FixedPaymentCreate, FixedPaymentRead, FixedPaymentToggleRequest, FixedPaymentUpdate
 from backend.schemas.income import IncomeCreate, IncomeRead, IncomeUpdate, SalaryOverrideRequest, SalaryResponse, SalaryUpdateRequest
 from backend.schemas.loan import LoanCreate, LoanPayResponse, LoanRead, LoanUpdate
 from backend.schemas.savings import SavingsActionRequest, SavingsGoalCreate, SavingsGoalRead, SavingsGoalUpdate, SavingsSummary, WithdrawResponse
-from backend.schemas.settings import CustomQuincenaRequest, CustomQuincenaResponse, SettingsResponse, SettingsUpdate
+from backend.schemas.settings import CustomQuincenaRequest, CustomQuincenaResponse, CycleRecomputeResponse, SettingsResponse, SettingsUpdate
 from backend.schemas.subscription import (
     SubscriptionCheckoutResponse,
     SubscriptionStatusResponse,
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+BatchResource = Literal["expense", "income", "fixed_payment", "loan", "savings_goal"]
+BatchAction = Literal["create", "update", "delete"]
+
+
+class BatchOperation(BaseModel):
+    resource: BatchResource
+    action: BatchAction
+    id: int | None = Field(default=None, gt=0)
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(min_length=1)
+    atomic: bool = False
+
+
+class BatchOperationResult(BaseModel):
+    index: int
+    resource: BatchResource
+    action: BatchAction
+    status: int
+    ok: bool
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class BatchResponse(BaseModel):
+    committed: bool
+    results: list[BatchOperationResult]
@@ -43,4 +43,34 @@ class DashboardResponse(BaseModel):
     period_title: str
 
 
+class PeriodSummaryRead(BaseModel):
+    year: int
+    month: int
+    cycle: int
+    start_date: date
+    end_date: date
+    period_title: str
+    salary: float
+    extra_income: float
+    period_savings: float
+    dinero_inicial: float
+    total_expenses: float
+    total_expenses_salary: float
+    total_expenses_savings: float
+    total_fixed: float
+    dinero_disponible: float
+    avg_daily: float
+    expense_count: int
+    fixed_count: int
+    cat_totals: dict[str, float]
+
+
+class YearOverviewResponse(BaseModel):
+    year: int
+    period_mode: str
+    total_savings: float
+    total_loans: float
+    periods: list[PeriodSummaryRead]
+
+
 DashboardRead = DashboardResponse
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from datetime import date as date_cls
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExpenseCreate(BaseModel):
-    amount: float = Field(gt=0)
+    amount: float = Field(gt=0, allow_inf_nan=False)
     description: str = Field(min_length=1, max_length=255)
     date: date_cls
     category_id: int = Field(gt=0)
@@ -14,7 +14,7 @@ class ExpenseCreate(BaseModel):
 
 
 class ExpenseUpdate(BaseModel):
-    amount: float | None = Field(default=None, gt=0)
+    amount: float | None = Field(default=None, gt=0, allow_inf_nan=False)
     description: str | None = Field(default=None, min_length=1, max_length=255)
     date: date_cls | None = None
     category_id: int | None = Field(default=None, gt=0)
@@ -29,3 +29,24 @@ class ExpenseRead(BaseModel):
     quincenal_cycle: int
     status: str
     category_ids: list[int]
+
+
+class ExpenseSuggestionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    description: str
+    uses: int
+    amount: float
+    category_id: int | None = None
+    last_date: date_cls
+
+
+class ExpenseImportRowErrorRead(BaseModel):
+    row: int
+    message: str
+
+
+class ExpenseImportResponse(BaseModel):
+    imported: int
+    expense_ids: list[int]
+    errors: list[ExpenseImportRowErrorRead]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import date as date_cls
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+SearchKind = Literal["expense", "income", "loan", "fixed_payment"]
+
+
+class SearchResultRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    kind: SearchKind
+    id: int
+    title: str
+    detail: str | None = None
+    amount: float
+    date: date_cls | None = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: list[SearchResultRead]
+    next_offset: int | None = None
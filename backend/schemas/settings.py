@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date as date_cls
+from datetime import date as date_cls, datetime
 
 from pydantic import BaseModel, Field
 
@@ -41,6 +41,18 @@ class CustomQuincenaResponse(BaseModel):
     end_date: date_cls
 
 
+class CycleRecomputeResponse(BaseModel):
+    status: str
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    progress: float = 0.0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
 SettingsRead = SettingsResponse
+CycleRecomputeRead = CycleRecomputeResponse
 CustomQuincenaRead = CustomQuincenaResponse
 CustomQuincenaUpdate = CustomQuincenaRequest
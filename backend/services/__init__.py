@@ -1,6 +1,6 @@
 from backend.services.auth_service import AuthError, AuthResult, AuthService
 from backend.services.finance_service import FinanceError, FinanceService, FixedPaymentStatus
-from backend.services.period_service import PeriodBounds, PeriodService
+from backend.services.period_service import PeriodBounds, PeriodCalendar, PeriodService
 
 __all__ = [
     "AuthError",
@@ -10,5 +10,6 @@ __all__ = [
     "FinanceService",
     "FixedPaymentStatus",
     "PeriodBounds",
+    "PeriodCalendar",
     "PeriodService",
 ]
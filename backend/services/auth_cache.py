@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+from backend.config import get_settings
+
+IdentityVersion = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class AuthIdentity:
+    """What an authenticated request needs to know about its user."""
+
+    id: int
+    username: str
+    email: str | None
+    pin_length: int
+    is_active: bool
+
+
+class AuthIdentityCache:
+    """In-process LRU of resolved access tokens, keyed by the token's SHA-256.
+
+    Entries live for at most ``ttl_seconds`` and never past the session's own
+    expiry. Flows that end sessions or change the user (logout, refresh,
+    profile updates, deactivation) call ``evict_user``; resolvers capture
+    ``version(user_id)`` before reading the database so a lookup that raced
+    with an eviction is not stored. Other workers only see the change once
+    their entry expires, which is what bounds the TTL.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, AuthIdentity]] = OrderedDict()
+        self._tokens_by_user: dict[int, set[str]] = {}
+        self._versions: dict[int, int] = {}
+        self._generation = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _current(self, user_id: int) -> IdentityVersion:
+        return self._generation, self._versions.get(user_id, 0)
+
+    def _drop(self, token_hash: str) -> None:
+        _expires_at, identity = self._entries.pop(token_hash)
+        tokens = self._tokens_by_user.get(identity.id)
+        if tokens is not None:
+            tokens.discard(token_hash)
+            if not tokens:
+                del self._tokens_by_user[identity.id]
+
+    def version(self, user_id: int) -> IdentityVersion:
+        with self._lock:
+            return self._current(user_id)
+
+    def get(self, token_hash: str) -> AuthIdentity | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+            expires_at, identity = entry
+            if expires_at <= monotonic():
+                self._drop(token_hash)
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(token_hash)
+            return identity
+
+    def put(
+        self,
+        token_hash: str,
+        version: IdentityVersion,
+        identity: AuthIdentity,
+        *,
+        valid_for_seconds: float,
+    ) -> None:
+        lifetime = min(self.ttl_seconds, valid_for_seconds)
+        if not self.enabled or lifetime <= 0:
+            return
+        with self._lock:
+            if version != self._current(identity.id):
+                return
+            if token_hash in self._entries:
+                self._drop(token_hash)
+            self._entries[token_hash] = (monotonic() + lifetime, identity)
+            self._tokens_by_user.setdefault(identity.id, set()).add(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def evict_user(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            for token_hash in list(self._tokens_by_user.get(user_id, ())):
+                self._drop(token_hash)
+
+    def clear(self) -> None:
+        """Drop every entry and refuse any lookup that started before this call."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self._versions.clear()
+            self._generation += 1
+
+    def observe(self, *, hit: bool, seconds: float) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.hit_seconds += seconds
+            else:
+                self.misses += 1
+                self.miss_seconds += seconds
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "avg_hit_ms": round(self.hit_seconds * 1000 / self.hits, 3) if self.hits else 0.0,
+                "avg_miss_ms": round(self.miss_seconds * 1000 / self.misses, 3) if self.misses else 0.0,
+            }
+
+
+_settings = get_settings()
+auth_identity_cache = AuthIdentityCache(
+    max_entries=_settings.auth_identity_cache_size,
+    ttl_seconds=_settings.auth_identity_cache_ttl_seconds,
+)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import secrets
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import TypeVar
 
-import bcrypt
 import httpx
 from jose import JWTError, jwt
 from sqlalchemy import delete, select
@@ -17,6 +19,8 @@ from backend.repositories.category_repo import CategoryRepository
 from backend.repositories.settings_repo import SettingsRepository
 from backend.repositories.subscription_repo import SubscriptionRepository
 from backend.repositories.user_repo import UserRepository
+from backend.services.auth_cache import AuthIdentity, auth_identity_cache
+from backend.services.password_hasher import PasswordHasherBusy, password_hasher
 
 DEFAULT_CATEGORIES = [
     'Comida',
@@ -29,6 +33,8 @@ DEFAULT_CATEGORIES = [
 
 settings = get_settings()
 
+T = TypeVar('T')
+
 
 class AuthError(Exception):
     def __init__(self, message: str, *, status_code: int = 400) -> None:
@@ -63,14 +69,16 @@ class AuthService:
         self.settings_repo = SettingsRepository(session)
         self.subscription_repo = SubscriptionRepository(session)
 
-    async def _ensure_auth_support_tables(self) -> None:
-        await self.session.run_sync(
-            lambda sync_session: OtpChallenge.__table__.create(bind=sync_session.connection(), checkfirst=True)
-        )
-
     @staticmethod
-    def _hash_pin(pin: str) -> str:
-        return bcrypt.hashpw(pin.strip().encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    async def _bcrypt(work: Awaitable[T]) -> T:
+        try:
+            return await work
+        except PasswordHasherBusy as exc:
+            raise AuthError('El servidor esta ocupado, intenta de nuevo en unos segundos.', status_code=503) from exc
+
+    @classmethod
+    async def _hash_pin(cls, pin: str) -> str:
+        return await cls._bcrypt(password_hasher.hash(pin.strip()))
 
     @staticmethod
     def _hash_text(value: str) -> str:
@@ -85,13 +93,12 @@ class AuthService:
         return bool(pin_hash and pin_hash.startswith(('$2a$', '$2b$', '$2y$')))
 
     @classmethod
-    def _verify_pin(cls, pin: str, pin_hash: str | None) -> tuple[bool, bool]:
+    async def _verify_pin(cls, pin: str, pin_hash: str | None) -> tuple[bool, bool]:
         if not pin_hash:
             return False, False
-        normalized = pin.strip().encode('utf-8')
         if cls._is_bcrypt_hash(pin_hash):
             try:
-                return bcrypt.checkpw(normalized, pin_hash.encode('utf-8')), False
+                return await cls._bcrypt(password_hasher.verify(pin.strip(), pin_hash)), False
             except ValueError:
                 return False, False
         return secrets.compare_digest(cls._legacy_hash_pin(pin), pin_hash), True
@@ -100,15 +107,15 @@ class AuthService:
     def _token_hash(token: str) -> str:
         return hashlib.sha256(token.encode('utf-8')).hexdigest()
 
-    @staticmethod
-    def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    @classmethod
+    async def hash_password(cls, password: str) -> str:
+        return await cls._bcrypt(password_hasher.hash(password))
 
-    @staticmethod
-    def verify_password(password: str, password_hash: str | None) -> bool:
+    @classmethod
+    async def verify_password(cls, password: str, password_hash: str | None) -> bool:
         if not password_hash:
             return False
-        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        return await cls._bcrypt(password_hasher.verify(password, password_hash))
 
     @staticmethod
     def _validate_pin(pin: str) -> int:
@@ -145,6 +152,7 @@ class AuthService:
             'username': user.username,
             'jti': secrets.token_urlsafe(8),
             'kind': kind,
+            'epoch': user.token_epoch,
         }
         return jwt.encode(payload, settings.secret_key, algorithm=settings.jwt_algorithm)
 
@@ -163,12 +171,13 @@ class AuthService:
         refresh_expires_at = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
         access_token = self._build_token(user, expires_at=access_expires_at, kind='access')
         refresh_token = self._build_token(user, expires_at=refresh_expires_at, kind='refresh')
-        await self._store_session_token(
-            user_id=user.id,
-            token=access_token,
-            expires_at=access_expires_at,
-            ip_address=ip_address,
-        )
+        if not settings.stateless_access_tokens:
+            await self._store_session_token(
+                user_id=user.id,
+                token=access_token,
+                expires_at=access_expires_at,
+                ip_address=ip_address,
+            )
         await self._store_session_token(
             user_id=user.id,
             token=refresh_token,
@@ -200,14 +209,13 @@ class AuthService:
 
     async def _ensure_unique_username(self, base_username: str) -> str:
         candidate = base_username.strip() or 'Perfil'
-        if await self.user_repo.get_by_username(candidate) is None:
+        taken = await self.user_repo.list_username_variants(candidate)
+        if candidate not in taken:
             return candidate
         suffix = 2
-        while True:
-            next_candidate = f'{candidate}-{suffix}'
-            if await self.user_repo.get_by_username(next_candidate) is None:
-                return next_candidate
+        while f'{candidate}-{suffix}' in taken:
             suffix += 1
+        return f'{candidate}-{suffix}'
 
     async def register(
         self,
@@ -233,12 +241,12 @@ class AuthService:
         pin_length = 0
         if pin:
             pin_length = self._validate_pin(pin)
-            pin_hash = self._hash_pin(pin)
+            pin_hash = await self._hash_pin(pin)
 
         user = await self.user_repo.create(
             username,
             email=normalized_email,
-            password_hash=self.hash_password(password),
+            password_hash=await self.hash_password(password),
             pin_hash=pin_hash,
             pin_length=pin_length,
         )
@@ -246,7 +254,6 @@ class AuthService:
         return await self._issue_session_tokens(user, ip_address=ip_address)
 
     async def request_registration_otp(self, username: str, email: str, password: str) -> OtpRequestResult:
-        await self._ensure_auth_support_tables()
         normalized_username = username.strip()
         if not normalized_username:
             raise AuthError('El nombre del perfil es obligatorio.')
@@ -271,7 +278,7 @@ class AuthService:
                 email=normalized_email,
                 purpose='register',
                 username=normalized_username,
-                password_hash=self.hash_password(password),
+                password_hash=await self.hash_password(password),
                 code_hash=self._hash_text(code),
                 expires_at=datetime.now(timezone.utc) + timedelta(minutes=10),
             )
@@ -368,7 +375,7 @@ class AuthService:
             user = await self.user_repo.get_by_username(identifier)
         if user is None or not user.is_active:
             raise AuthError('Credenciales invalidas.', status_code=401)
-        if not self.verify_password(password, user.password_hash):
+        if not await self.verify_password(password, user.password_hash):
             raise AuthError('Credenciales invalidas.', status_code=401)
         return await self._issue_session_tokens(user, ip_address=ip_address)
 
@@ -383,13 +390,13 @@ class AuthService:
             raise AuthError('Credenciales invalidas.', status_code=401)
         if not user.pin_hash or user.pin_length not in {4, 6}:
             raise AuthError('El usuario no tiene PIN configurado.', status_code=400)
-        valid_pin, legacy_hash = self._verify_pin(normalized_pin, user.pin_hash)
+        valid_pin, legacy_hash = await self._verify_pin(normalized_pin, user.pin_hash)
         if not valid_pin:
             raise AuthError('Credenciales invalidas.', status_code=401)
         if legacy_hash:
             upgraded = await self.user_repo.set_pin(
                 user.id,
-                pin_hash=self._hash_pin(normalized_pin),
+                pin_hash=await self._hash_pin(normalized_pin),
                 pin_length=user.pin_length,
             )
             if upgraded is not None:
@@ -413,6 +420,7 @@ class AuthService:
         if user is None or not user.is_active:
             raise AuthError('Usuario no disponible.', status_code=401)
         await self.session.delete(session_row)
+        auth_identity_cache.evict_user(user.id)
         return await self._issue_session_tokens(user, ip_address=ip_address)
 
     async def list_profiles(self, user_id: int | None = None) -> list[User]:
@@ -452,6 +460,7 @@ class AuthService:
         if updated is None:
             raise AuthError('Perfil no disponible.', status_code=404)
         await self.session.commit()
+        auth_identity_cache.evict_user(user_id)
         await self.session.refresh(updated)
         return updated
 
@@ -464,12 +473,13 @@ class AuthService:
         pin_length = 0
         if pin:
             pin_length = self._validate_pin(pin)
-            pin_hash = self._hash_pin(pin)
+            pin_hash = await self._hash_pin(pin)
 
         updated = await self.user_repo.set_pin(user_id, pin_hash=pin_hash, pin_length=pin_length)
         if updated is None:
             raise AuthError('Perfil no disponible.', status_code=404)
         await self.session.commit()
+        auth_identity_cache.evict_user(user_id)
         await self.session.refresh(updated)
         return updated
 
@@ -482,29 +492,64 @@ class AuthService:
             raise AuthError('Perfil no disponible.', status_code=404)
         await self.session.execute(delete(SessionToken).where(SessionToken.user_id == user_id))
         await self.session.commit()
+        auth_identity_cache.evict_user(user_id)
 
     async def logout(self, token: str) -> None:
         payload = self._decode_token_payload(token)
-        deleted = await self.session.execute(
-            delete(SessionToken).where(SessionToken.user_id == int(payload['sub']))
-        )
-        if not deleted.rowcount:
+        user_id = int(payload['sub'])
+        deleted = await self.session.execute(delete(SessionToken).where(SessionToken.user_id == user_id))
+        revoked = await self.user_repo.bump_token_epoch(user_id, expected=payload.get('epoch', 0))
+        if not deleted.rowcount and not revoked:
             raise AuthError('Sesion expirada.', status_code=401)
         await self.session.commit()
+        auth_identity_cache.evict_user(user_id)
 
-    async def get_current_user_from_token(self, token: str) -> User:
+    async def _resolve_identity(self, token: str, token_hash: str) -> AuthIdentity:
         payload = self._decode_token_payload(token, expected_kind='access')
-        statement = select(SessionToken).where(
-            SessionToken.token_hash == self._token_hash(token),
-            SessionToken.expires_at > datetime.now(timezone.utc),
-        )
-        session_row = (await self.session.scalars(statement)).first()
-        if session_row is None:
-            raise AuthError('Sesion expirada.', status_code=401)
-        user = await self.user_repo.get_by_id(int(payload['sub']))
+        user_id = int(payload['sub'])
+        version = auth_identity_cache.version(user_id)
+        now = datetime.now(timezone.utc)
+        if settings.stateless_access_tokens:
+            # Only refresh tokens are stored; the user's epoch revokes access tokens.
+            expires_at = datetime.fromtimestamp(payload['exp'], timezone.utc)
+        else:
+            statement = select(SessionToken.expires_at).where(
+                SessionToken.token_hash == token_hash,
+                SessionToken.expires_at > now,
+            )
+            expires_at = (await self.session.scalars(statement)).first()
+            if expires_at is None:
+                raise AuthError('Sesion expirada.', status_code=401)
+        user = await self.user_repo.get_by_id(user_id)
         if user is None or not user.is_active:
             raise AuthError('Usuario no disponible.', status_code=401)
-        return user
+        if settings.stateless_access_tokens and payload.get('epoch', 0) != user.token_epoch:
+            raise AuthError('Sesion expirada.', status_code=401)
+        identity = AuthIdentity(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            pin_length=user.pin_length,
+            is_active=user.is_active,
+        )
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        auth_identity_cache.put(
+            token_hash,
+            version,
+            identity,
+            valid_for_seconds=(expires_at - now).total_seconds(),
+        )
+        return identity
+
+    async def get_current_user_from_token(self, token: str) -> AuthIdentity:
+        started = perf_counter()
+        token_hash = self._token_hash(token)
+        cached = auth_identity_cache.get(token_hash)
+        try:
+            return cached or await self._resolve_identity(token, token_hash)
+        finally:
+            auth_identity_cache.observe(hit=cached is not None, seconds=perf_counter() - started)
 
-    async def get_user_from_token(self, token: str) -> User:
+    async def get_user_from_token(self, token: str) -> AuthIdentity:
         return await self.get_current_user_from_token(token)
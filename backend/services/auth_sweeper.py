@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+
+from backend.config import get_settings
+from backend.database.engine import SessionLocal
+from backend.database.models import OtpChallenge, RateLimitBucket, SessionToken
+
+logger = logging.getLogger(__name__)
+
+# Consumed challenges are kept until they expire (ten minutes after issue), so
+# the expiry predicate covers them too and stays on the expires_at index.
+# Rate limit buckets expire once they have refilled and only matter with the
+# database rate limit backend.
+SWEPT_MODELS = {
+    "sessions": SessionToken,
+    "otp_challenges": OtpChallenge,
+    "rate_limit_buckets": RateLimitBucket,
+}
+
+
+@dataclass(slots=True)
+class SweepReport:
+    started_at: datetime
+    finished_at: datetime | None = None
+    deleted: dict[str, int] = field(default_factory=dict)
+    batches: int = 0
+    error: str | None = None
+
+    def snapshot(self) -> dict[str, object]:
+        return asdict(self)
+
+
+class ExpiredAuthSweeper:
+    """Deletes expired session tokens and OTP challenges on a fixed schedule.
+
+    Each run removes rows ``batch_size`` at a time, one short transaction per
+    batch, and sleeps ``pause_seconds`` between batches so a large backlog is
+    drained gradually instead of holding locks against live logins.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        *,
+        interval_seconds: float,
+        batch_size: int,
+        pause_seconds: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = max(1, batch_size)
+        self.pause_seconds = max(0.0, pause_seconds)
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.totals: dict[str, int] = dict.fromkeys(SWEPT_MODELS, 0)
+        self.last_report: SweepReport | None = None
+
+    async def _delete_batch(self, model, now: datetime) -> int:
+        expired = select(model.id).where(model.expires_at <= now).limit(self.batch_size)
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(model)
+                .where(model.id.in_(expired.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    async def sweep_once(self) -> SweepReport:
+        report = SweepReport(started_at=datetime.now(UTC), deleted=dict.fromkeys(SWEPT_MODELS, 0))
+        now = report.started_at
+        try:
+            for table, model in SWEPT_MODELS.items():
+                while True:
+                    removed = await self._delete_batch(model, now)
+                    report.batches += 1
+                    report.deleted[table] += removed
+                    if removed < self.batch_size:
+                        break
+                    await asyncio.sleep(self.pause_seconds)
+        except Exception as exc:
+            logger.exception("Expired auth sweep failed")
+            report.error = str(exc)
+        report.finished_at = datetime.now(UTC)
+        self.runs += 1
+        for table, removed in report.deleted.items():
+            self.totals[table] += removed
+        self.last_report = report
+        logger.info("Expired auth sweep removed %s in %d batches", report.deleted, report.batches)
+        return report
+
+    async def _run(self) -> None:
+        while True:
+            await self.sweep_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def shutdown(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "runs": self.runs,
+            "deleted_total": dict(self.totals),
+            "last_run": self.last_report.snapshot() if self.last_report else None,
+        }
+
+
+_settings = get_settings()
+auth_sweeper = ExpiredAuthSweeper(
+    interval_seconds=_settings.auth_sweep_interval_seconds,
+    batch_size=_settings.auth_sweep_batch_size,
+    pause_seconds=_settings.auth_sweep_pause_ms / 1000,
+)
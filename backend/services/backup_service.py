@@ -6,6 +6,10 @@ from pathlib import Path
 
 from backend.config import get_settings
 from backend.repositories.backup_repo import BackupRepository
+from backend.repositories.description_index import description_index
+from backend.services.auth_cache import auth_identity_cache
+from backend.services.dashboard_cache import dashboard_cache
+from backend.services.subscription_service import entitlements_cache
 
 
 class BackupService:
@@ -38,4 +42,8 @@ class BackupService:
         source = self._db_path()
         source.parent.mkdir(parents=True, exist_ok=True)
         source.write_bytes(file_bytes)
+        auth_identity_cache.clear()
+        dashboard_cache.clear()
+        description_index.clear()
+        entitlements_cache.clear()
         return source
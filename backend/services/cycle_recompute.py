@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from threading import Lock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.engine import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CycleRecomputeJob:
+    user_id: int
+    status: str = "queued"
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    rerun: bool = False
+
+    @property
+    def progress(self) -> float:
+        if self.status == "done":
+            return 1.0
+        return 0.0 if not self.total else min(1.0, self.processed / self.total)
+
+    def snapshot(self) -> dict[str, object]:
+        payload = asdict(self)
+        payload.pop("rerun")
+        payload["progress"] = self.progress
+        return payload
+
+
+CycleRecomputeWork = Callable[[AsyncSession, CycleRecomputeJob], Awaitable[None]]
+
+
+class CycleRecomputeQueue:
+    """Runs at most one quincenal_cycle recompute per user in the background.
+
+    Scheduling while a job is already running flags it for another pass, so a
+    burst of settings changes collapses into a single follow-up run.
+    """
+
+    def __init__(self, session_factory=SessionLocal, *, max_finished: int = 1024) -> None:
+        self._session_factory = session_factory
+        self.max_finished = max_finished
+        self._jobs: dict[int, CycleRecomputeJob] = {}
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._lock = Lock()
+
+    def status(self, user_id: int) -> dict[str, object] | None:
+        with self._lock:
+            job = self._jobs.get(user_id)
+            return job.snapshot() if job is not None else None
+
+    def schedule(self, user_id: int, work: CycleRecomputeWork) -> dict[str, object]:
+        with self._lock:
+            job = self._jobs.get(user_id)
+            if job is not None and job.status in {"queued", "running"}:
+                job.rerun = True
+                return job.snapshot()
+            job = CycleRecomputeJob(user_id=user_id)
+            self._jobs[user_id] = job
+            self._prune()
+            self._tasks[user_id] = asyncio.get_running_loop().create_task(self._run(job, work))
+            return job.snapshot()
+
+    async def _run(self, job: CycleRecomputeJob, work: CycleRecomputeWork) -> None:
+        try:
+            while True:
+                with self._lock:
+                    job.status = "running"
+                    job.rerun = False
+                    job.processed = job.updated = 0
+                    job.started_at = datetime.now(UTC)
+                async with self._session_factory() as session:
+                    await work(session, job)
+                with self._lock:
+                    if not job.rerun:
+                        job.status = "done"
+                        job.finished_at = datetime.now(UTC)
+                        return
+        except Exception as exc:
+            logger.exception("Cycle recompute failed for user %s", job.user_id)
+            with self._lock:
+                job.status = "failed"
+                job.error = str(exc)
+                job.finished_at = datetime.now(UTC)
+        finally:
+            with self._lock:
+                self._tasks.pop(job.user_id, None)
+
+    def _prune(self) -> None:
+        finished = [user_id for user_id, job in self._jobs.items() if job.status in {"done", "failed"}]
+        for user_id in finished[: max(0, len(self._jobs) - self.max_finished)]:
+            del self._jobs[user_id]
+
+    async def wait(self, user_id: int) -> None:
+        task = self._tasks.get(user_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def shutdown(self) -> None:
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+cycle_recompute_jobs = CycleRecomputeQueue()
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from backend.config import get_settings
+from backend.services.versioned_cache import VersionedTTLCache
+
+_settings = get_settings()
+dashboard_cache = VersionedTTLCache(
+    max_entries=_settings.dashboard_cache_size,
+    ttl_seconds=_settings.dashboard_cache_ttl_seconds,
+)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+
+IMPORT_COLUMNS = ("date", "amount", "description", "category", "category_id", "source")
+
+
+class ExpenseImportFormatError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class ExpenseImportRowError:
+    row: int
+    message: str
+
+
+@dataclass(slots=True)
+class ExpenseImportResult:
+    imported: int
+    expense_ids: list[int] = field(default_factory=list)
+    errors: list[ExpenseImportRowError] = field(default_factory=list)
+
+
+def _parse_csv(text: str) -> list[dict[str, object]]:
+    sample = text[:4096]
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
+    if not reader.fieldnames:
+        raise ExpenseImportFormatError("CSV header row is required.")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    return [{key: value for key, value in row.items() if key in IMPORT_COLUMNS} for row in reader]
+
+
+def parse_expense_import(content: bytes, content_type: str = "") -> list[dict[str, object]]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise ExpenseImportFormatError("Import file must be UTF-8 encoded.") from exc
+    if not text.strip():
+        return []
+    if "csv" in content_type.lower() or not text.lstrip().startswith(("[", "{")):
+        return _parse_csv(text)
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ExpenseImportFormatError("Invalid JSON body.") from exc
+    if isinstance(payload, dict):
+        payload = payload.get("expenses")
+    if not isinstance(payload, list):
+        raise ExpenseImportFormatError("JSON import must be an array of expenses.")
+    return payload
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
 from datetime import date
 
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.config import get_settings
 from backend.database.models import Category, Loan
 from backend.repositories import (
     CategoryRepository,
@@ -15,11 +20,22 @@ from backend.repositories import (
     IncomeRepository,
     LoanRepository,
     SavingsRepository,
+    SearchRepository,
     SettingsRepository,
 )
-from backend.services.period_service import PeriodService
+from backend.repositories.description_index import UserDescriptionIndex, description_index
+from backend.repositories.pagination import KeysetPosition
+from backend.repositories.rollup_repo import PeriodKey, PeriodRollupRepository, PeriodTotals
+from backend.repositories.settings_repo import UserFinanceContext
+from backend.services.cycle_recompute import CycleRecomputeJob, cycle_recompute_jobs
+from backend.services.dashboard_cache import dashboard_cache
+from backend.services.expense_import import ExpenseImportResult, ExpenseImportRowError
+from backend.services.period_service import PeriodBounds, PeriodCalendar, PeriodService
 
 
+ROLLUP_LAYOUT_KEY = "period_rollups_layout"
+CALENDAR_YEARS_BACK = 5
+
 DEFAULT_CATEGORIES = (
     "Comida",
     "Combustible",
@@ -30,6 +46,11 @@ DEFAULT_CATEGORIES = (
 )
 
 
+def _settled(total: float) -> float:
+    """Rollups are running sums of deltas; treat float residue left by removals as zero."""
+    return 0.0 if abs(total) < 1e-6 else total
+
+
 @dataclass(slots=True)
 class FixedPaymentStatus:
     id: int
@@ -69,6 +90,38 @@ class DashboardResult:
     period_title: str
 
 
+@dataclass(slots=True)
+class PeriodSummary:
+    year: int
+    month: int
+    cycle: int
+    start_date: str
+    end_date: str
+    period_title: str
+    salary: float
+    extra_income: float
+    period_savings: float
+    dinero_inicial: float
+    total_expenses: float
+    total_expenses_salary: float
+    total_expenses_savings: float
+    total_fixed: float
+    dinero_disponible: float
+    avg_daily: float
+    expense_count: int
+    fixed_count: int
+    cat_totals: dict[str, float]
+
+
+@dataclass(slots=True)
+class YearOverviewResult:
+    year: int
+    period_mode: str
+    total_savings: float
+    total_loans: float
+    periods: list[PeriodSummary]
+
+
 class FinanceError(Exception):
     pass
 
@@ -85,6 +138,12 @@ class FinanceService:
         self.debt_repo = DebtRepository(session)
         self.savings_repo = SavingsRepository(session)
         self.settings_repo = SettingsRepository(session)
+        self.rollup_repo = PeriodRollupRepository(session)
+        self.search_repo = SearchRepository(session)
+        self._context: UserFinanceContext | None = None
+        self._context_version: tuple[int, int] | None = None
+        self._pending_commits: set[int] | None = None
+        self._pending_recomputes: set[int] | None = None
 
     def _uid(self, user_id: int | None = None) -> int:
         resolved = user_id if user_id is not None else self.user_id
@@ -114,7 +173,7 @@ class FinanceService:
         if await self.category_repo.get_by_name(uid, normalized):
             raise FinanceError("Category already exists.")
         category = await self.category_repo.create(uid, normalized)
-        await self.session.commit()
+        await self._commit(user_id)
         return category
 
     async def rename_category(self, category_id: int, new_name: str, user_id: int | None = None) -> Category:
@@ -123,7 +182,7 @@ class FinanceService:
         if category is None or category.user_id != uid:
             raise FinanceError("Category not found.")
         updated = await self.category_repo.update(category_id, name=new_name.strip())
-        await self.session.commit()
+        await self._commit(user_id)
         return updated
 
     async def delete_category(self, category_id: int, user_id: int | None = None) -> None:
@@ -135,48 +194,140 @@ class FinanceService:
             raise FinanceError("Category is in use by expenses.")
         if await self.fixed_payment_repo.count_active_category_usage(category_id) > 0:
             raise FinanceError("Category is in use by fixed payments.")
+        # Rollup rows outlive the expenses that fed them (their totals only drop to ~0).
+        await self.rollup_repo.delete_category(uid, category_id)
         await self.category_repo.delete(category_id)
+        await self._commit(user_id)
+
+    async def _commit(self, user_id: int | None = None) -> None:
+        uid = self._uid(user_id)
+        if self._pending_commits is not None:
+            await self.session.flush()
+            self._pending_commits.add(uid)
+            return
         await self.session.commit()
+        dashboard_cache.bump(uid)
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """Run several write methods with a single commit at the end of the block.
+
+        Inside the block ``_commit`` only flushes; any exception rolls back all of
+        it. Nested blocks join the outer one. Cycle recomputes requested inside
+        the block are only scheduled once it has committed.
+        """
+        if self._pending_commits is not None:
+            yield
+            return
+        pending: set[int] = set()
+        recomputes: set[int] = set()
+        self._pending_commits = pending
+        self._pending_recomputes = recomputes
+        try:
+            yield
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self._pending_commits = None
+            self._pending_recomputes = None
+            self.invalidate_context()
+        for uid in pending:
+            dashboard_cache.bump(uid)
+        for uid in recomputes:
+            self.schedule_cycle_recompute(uid)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """Undo only the writes made inside the block if it raises."""
+        try:
+            async with self.session.begin_nested():
+                yield
+        except BaseException:
+            self.invalidate_context()
+            raise
+
+    async def get_context(self, user_id: int | None = None) -> UserFinanceContext:
+        uid = self._uid(user_id)
+        if self._context is None or self._context.user_id != uid:
+            self._context_version = dashboard_cache.version(uid)
+            self._context = await self.settings_repo.load_finance_context(uid)
+        return self._context
+
+    def invalidate_context(self) -> None:
+        self._context = None
 
     async def get_period_mode(self, user_id: int | None = None) -> str:
-        return await self.settings_repo.get_period_mode(self._uid(user_id))
+        return (await self.get_context(user_id)).period_mode
 
     async def get_quincenal_paydays(self, user_id: int | None = None) -> tuple[int, int]:
-        uid = self._uid(user_id)
-        day1 = int(await self.settings_repo.get_setting(uid, "quincenal_pay_day_1", "1") or 1)
-        day2 = int(await self.settings_repo.get_setting(uid, "quincenal_pay_day_2", "16") or 16)
-        if day1 == day2:
-            day2 = 15 if day1 == 16 else 16
-        return day1, day2
+        return (await self.get_context(user_id)).quincenal_paydays
 
     async def get_monthly_payday(self, user_id: int | None = None) -> int:
-        uid = self._uid(user_id)
-        return int(await self.settings_repo.get_setting(uid, "monthly_pay_day", "1") or 1)
+        return (await self.get_context(user_id)).monthly_pay_day
+
+    async def get_period_calendar(self, user_id: int | None = None) -> PeriodCalendar:
+        context = await self.get_context(user_id)
+        day1, day2 = context.quincenal_paydays
+        current_year = date.today().year
+        return PeriodCalendar.build(
+            period_mode=context.period_mode,
+            day1=day1,
+            day2=day2,
+            monthly_payday=context.monthly_pay_day,
+            custom_quincenas=tuple(sorted(context.custom_quincenas.items())),
+            start_year=current_year - CALENDAR_YEARS_BACK,
+            end_year=current_year + 1,
+        )
 
     async def get_quincena_range(self, year: int, month: int, cycle: int, user_id: int | None = None) -> tuple[str, str]:
-        uid = self._uid(user_id)
-        custom = await self.settings_repo.get_custom_quincena_range(uid, year, month, cycle)
+        context = await self.get_context(user_id)
+        custom = context.custom_quincena(year, month, cycle)
         if custom is not None:
             return custom[0].isoformat(), custom[1].isoformat()
-        day1, day2 = await self.get_quincenal_paydays(uid)
+        day1, day2 = context.quincenal_paydays
         bounds = PeriodService.get_quincena_range(year, month, cycle, day1=day1, day2=day2)
         return bounds.start.isoformat(), bounds.end.isoformat()
 
     async def get_period_range(self, year: int, month: int, cycle: int, user_id: int | None = None) -> tuple[str, str]:
-        uid = self._uid(user_id)
-        mode = await self.get_period_mode(uid)
-        if mode == "mensual":
-            bounds = PeriodService.get_month_range(year, month, await self.get_monthly_payday(uid))
-            return bounds.start.isoformat(), bounds.end.isoformat()
-        return await self.get_quincena_range(year, month, cycle, uid)
+        bounds = (await self.get_period_calendar(user_id)).bounds(year, month, cycle)
+        return bounds.start.isoformat(), bounds.end.isoformat()
 
     async def get_cycle_for_date(self, value: date, user_id: int | None = None) -> int:
+        return (await self.get_period_calendar(user_id)).cycle_for_date(value)
+
+    @staticmethod
+    def _period_layout(context: UserFinanceContext) -> str:
+        day1, day2 = context.quincenal_paydays
+        parts = [context.period_mode, str(day1), str(day2), str(context.monthly_pay_day)]
+        if context.period_mode != "mensual":
+            parts.extend(
+                f"{year}-{month}-{cycle}:{start.isoformat()}:{end.isoformat()}"
+                for (year, month, cycle), (start, end) in sorted(context.custom_quincenas.items())
+            )
+        return "|".join(parts)
+
+    async def get_period_for_date(self, value: date, user_id: int | None = None) -> PeriodKey:
+        return (await self.get_period_calendar(user_id)).period_for_date(value)
+
+    async def rebuild_period_rollups(self, user_id: int | None = None) -> int:
+        uid = self._uid(user_id)
+        self.invalidate_context()
+        context = await self.get_context(uid)
+        calendar = await self.get_period_calendar(uid)
+        periods = await self.rollup_repo.replace_for_user(uid, calendar.periods_for_dates)
+        await self.settings_repo.set_setting(uid, ROLLUP_LAYOUT_KEY, self._period_layout(context))
+        await self._commit(uid)
+        self.invalidate_context()
+        return len(periods)
+
+    async def get_period_rollups(self, year: int | None = None, user_id: int | None = None) -> list[PeriodTotals]:
         uid = self._uid(user_id)
-        mode = await self.get_period_mode(uid)
-        if mode == "mensual":
-            return 1
-        day1, day2 = await self.get_quincenal_paydays(uid)
-        return PeriodService.get_cycle_for_date(value, period_mode=mode, day1=day1, day2=day2)
+        context = await self.get_context(uid)
+        if context.get_setting(ROLLUP_LAYOUT_KEY) != self._period_layout(context):
+            await self.rebuild_period_rollups(uid)
+        return await self.rollup_repo.list_by_user(uid, year)
 
     async def add_expense(
         self,
@@ -199,12 +350,51 @@ class FinanceService:
             quincenal_cycle=cycle,
             category_ids=[category_id],
             status=status,
+            period=await self.get_period_for_date(date_value, uid),
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
-    async def list_expenses(self, start_date: date, end_date: date, user_id: int | None = None):
-        return await self.expense_repo.list_by_range(self._uid(user_id), start_date, end_date)
+    async def list_expenses(
+        self,
+        start_date: date,
+        end_date: date,
+        user_id: int | None = None,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ):
+        return await self.expense_repo.list_rows_by_range(self._uid(user_id), start_date, end_date, limit=limit, after=after)
+
+    async def stream_expenses(self, start_date: date, end_date: date, user_id: int | None = None):
+        batch_size = max(1, get_settings().stream_batch_size)
+        async for item in self.expense_repo.stream_by_range(self._uid(user_id), start_date, end_date, batch_size=batch_size):
+            yield item
+
+    async def _current_period_bounds(self, user_id: int) -> PeriodBounds:
+        calendar = await self.get_period_calendar(user_id)
+        today = date.today()
+        return calendar.bounds(today.year, today.month, calendar.cycle_for_date(today))
+
+    async def count_current_period_expenses(self, user_id: int | None = None) -> int:
+        uid = self._uid(user_id)
+        current = await self._current_period_bounds(uid)
+        return await self.expense_repo.count_by_range(uid, current.start, current.end)
+
+    async def is_in_current_period(self, value: date, user_id: int | None = None) -> bool:
+        """Whether an expense dated ``value`` counts against the free plan's period limit."""
+        current = await self._current_period_bounds(self._uid(user_id))
+        return current.start <= value <= current.end
+
+    async def suggest_expenses(self, prefix: str, *, limit: int = 8, user_id: int | None = None):
+        uid = self._uid(user_id)
+        suggestions = description_index.suggest(uid, prefix, limit)
+        if suggestions is not None:
+            return suggestions
+        version = description_index.version(uid)
+        index = UserDescriptionIndex(await self.expense_repo.list_description_uses(uid))
+        description_index.put(uid, version, index)
+        return index.suggest(prefix, limit)
 
     async def update_expense(
         self,
@@ -228,8 +418,10 @@ class FinanceService:
             date_value=date_value,
             quincenal_cycle=cycle,
             category_ids=[category_id],
+            period=await self.get_period_for_date(date_value, uid),
+            previous_period=await self.get_period_for_date(expense.date, uid),
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def delete_expense(self, expense_id: int, user_id: int | None = None) -> None:
@@ -237,8 +429,99 @@ class FinanceService:
         expense = await self.expense_repo.get_by_id(expense_id)
         if expense is None or expense.user_id != uid:
             raise FinanceError("Expense not found.")
-        await self.expense_repo.delete(expense_id)
-        await self.session.commit()
+        await self.expense_repo.delete(expense_id, period=await self.get_period_for_date(expense.date, uid))
+        await self._commit(user_id)
+
+    @staticmethod
+    def _parse_import_row(raw: object, categories_by_name: dict[str, int], category_ids: set[int]) -> dict[str, object]:
+        if not isinstance(raw, dict):
+            raise FinanceError("Row must be an object.")
+        try:
+            date_value = date.fromisoformat(str(raw.get("date") or "").strip())
+        except ValueError as exc:
+            raise FinanceError("Invalid date, expected YYYY-MM-DD.") from exc
+        try:
+            amount = float(str(raw.get("amount") or "").strip().replace(",", "."))
+        except ValueError as exc:
+            raise FinanceError("Invalid amount.") from exc
+        if not math.isfinite(amount):
+            raise FinanceError("Invalid amount.")
+        if not amount > 0:
+            raise FinanceError("Amount must be greater than zero.")
+        description = str(raw.get("description") or "").strip()
+        if not description or len(description) > 255:
+            raise FinanceError("Description must be between 1 and 255 characters.")
+        raw_category_id = str(raw.get("category_id") or "").strip()
+        if raw_category_id:
+            category_id = int(raw_category_id) if raw_category_id.isdigit() else 0
+            if category_id not in category_ids:
+                raise FinanceError("Category not found.")
+        else:
+            category_name = str(raw.get("category") or "").strip().lower()
+            if category_name not in categories_by_name:
+                raise FinanceError("Category not found.")
+            category_id = categories_by_name[category_name]
+        source = str(raw.get("source") or "sueldo").strip().lower()
+        if source not in {"sueldo", "ahorro"}:
+            raise FinanceError("Source must be 'sueldo' or 'ahorro'.")
+        return {
+            "date": date_value,
+            "amount": amount,
+            "description": description,
+            "category_ids": [category_id],
+            "status": "completed_savings" if source == "ahorro" else "completed_salary",
+        }
+
+    async def import_expenses(
+        self,
+        rows: list[object],
+        *,
+        current_period_quota: int | None = None,
+        user_id: int | None = None,
+    ) -> ExpenseImportResult:
+        uid = self._uid(user_id)
+        max_rows = get_settings().expense_import_max_rows
+        if len(rows) > max_rows:
+            raise FinanceError(f"Import is limited to {max_rows} rows.")
+        categories = await self.get_categories(uid)
+        categories_by_name = {category.name.strip().lower(): category.id for category in categories}
+        category_ids = {category.id for category in categories}
+        calendar = await self.get_period_calendar(uid)
+        current = await self._current_period_bounds(uid)
+
+        errors: list[ExpenseImportRowError] = []
+        valid: list[dict[str, object]] = []
+        for index, raw in enumerate(rows, start=1):
+            try:
+                item = self._parse_import_row(raw, categories_by_name, category_ids)
+            except FinanceError as exc:
+                errors.append(ExpenseImportRowError(row=index, message=str(exc)))
+                continue
+            if current_period_quota is not None and current.start <= item["date"] <= current.end:
+                if current_period_quota <= 0:
+                    errors.append(ExpenseImportRowError(row=index, message="Free plan expense limit reached for this period."))
+                    continue
+                current_period_quota -= 1
+            item["quincenal_cycle"] = calendar.cycle_for_date(item["date"])
+            valid.append(item)
+        if not valid:
+            return ExpenseImportResult(imported=0, errors=errors)
+
+        expense_ids = await self.expense_repo.bulk_create(uid, valid)
+        totals: dict[PeriodKey, PeriodTotals] = {}
+        for item, key in zip(valid, calendar.periods_for_dates([item["date"] for item in valid])):
+            period = totals.setdefault(key, PeriodTotals(year=key[0], month=key[1], cycle=key[2]))
+            amount = float(item["amount"])
+            if item["status"] == "completed_savings":
+                period.expense_savings_total += amount
+            else:
+                period.expense_salary_total += amount
+            period.expense_count += 1
+            for category_id in item["category_ids"]:
+                period.category_totals[category_id] = period.category_totals.get(category_id, 0.0) + amount
+        await self.rollup_repo.apply_totals(uid, list(totals.values()))
+        await self._commit(uid)
+        return ExpenseImportResult(imported=len(expense_ids), expense_ids=expense_ids, errors=errors)
 
     async def add_fixed_payment(
         self,
@@ -258,7 +541,7 @@ class FinanceService:
             due_day=0 if no_fixed_date else due_day,
             category_id=category_id,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def update_fixed_payment(
@@ -284,7 +567,7 @@ class FinanceService:
             category_id=category_id,
             update_category=True,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def delete_fixed_payment(self, payment_id: int, user_id: int | None = None) -> None:
@@ -293,7 +576,7 @@ class FinanceService:
         if payment is None or payment.user_id != uid:
             raise FinanceError("Fixed payment not found.")
         await self.fixed_payment_repo.soft_delete(payment_id)
-        await self.session.commit()
+        await self._commit(user_id)
 
     async def set_fixed_payment_paid(
         self,
@@ -308,10 +591,38 @@ class FinanceService:
         payment = await self.fixed_payment_repo.get_by_id(payment_id)
         if payment is None or payment.user_id != uid:
             raise FinanceError("Fixed payment not found.")
-        await self.fixed_payment_repo.set_record_status(payment_id, year, month, cycle, paid)
-        await self.session.commit()
-        items = await self.get_fixed_payments_for_period(year, month, cycle, uid)
-        return next(item for item in items if item.id == payment_id)
+        record = await self.fixed_payment_repo.set_record_status(payment_id, year, month, cycle, paid)
+        await self._commit(user_id)
+        start_iso, end_iso = await self.get_period_range(year, month, cycle, uid)
+        item = self._fixed_payment_status(
+            payment,
+            {payment_id: record.status},
+            date.fromisoformat(start_iso),
+            date.fromisoformat(end_iso),
+            date.today(),
+        )
+        if item is None:
+            raise FinanceError("Fixed payment is not due in this period.")
+        return item
+
+    @staticmethod
+    def _fixed_payment_status(
+        payment,
+        statuses: dict[int, str],
+        start: date,
+        end: date,
+        today: date,
+    ) -> FixedPaymentStatus | None:
+        if payment.due_day <= 0:
+            status = statuses.get(payment.id, "pending")
+            return FixedPaymentStatus(payment.id, payment.name, float(payment.amount), payment.due_day, payment.category_id, status == "paid", False, "")
+        for target_year, target_month in PeriodService.iterate_months(start, end):
+            due = date(target_year, target_month, PeriodService.safe_day(target_year, target_month, payment.due_day))
+            if due < start or due > end:
+                continue
+            is_paid = statuses.get(payment.id, "paid") == "paid"
+            return FixedPaymentStatus(payment.id, payment.name, float(payment.amount), payment.due_day, payment.category_id, is_paid, due <= today, due.isoformat())
+        return None
 
     async def get_fixed_payments_for_period(self, year: int, month: int, cycle: int, user_id: int | None = None) -> list[FixedPaymentStatus]:
         uid = self._uid(user_id)
@@ -320,35 +631,42 @@ class FinanceService:
         start = date.fromisoformat(start_iso)
         end = date.fromisoformat(end_iso)
         today = date.today()
+        statuses = await self.fixed_payment_repo.get_record_statuses([payment.id for payment in payments], year, month, cycle)
         out: list[FixedPaymentStatus] = []
         for payment in payments:
-            if payment.due_day <= 0:
-                status = await self.fixed_payment_repo.get_record_status(payment.id, year, month, cycle, default_status="pending")
-                out.append(FixedPaymentStatus(payment.id, payment.name, float(payment.amount), payment.due_day, payment.category_id, status == "paid", False, ""))
-                continue
-            for target_year, target_month in PeriodService.iterate_months(start, end):
-                due = date(target_year, target_month, PeriodService.safe_day(target_year, target_month, payment.due_day))
-                if due < start or due > end:
-                    continue
-                status = await self.fixed_payment_repo.get_record_status(payment.id, year, month, cycle, default_status="paid")
-                is_paid = status == "paid"
-                out.append(FixedPaymentStatus(payment.id, payment.name, float(payment.amount), payment.due_day, payment.category_id, is_paid, due <= today, due.isoformat()))
-                break
+            item = self._fixed_payment_status(payment, statuses, start, end, today)
+            if item is not None:
+                out.append(item)
         out.sort(key=lambda item: (item.due_date != "", item.due_date, item.name.lower()))
         return out
 
     async def add_income(self, *, amount: float, description: str, date_value: date, user_id: int | None = None):
+        uid = self._uid(user_id)
         item = await self.income_repo.create(
-            user_id=self._uid(user_id),
+            user_id=uid,
             amount=amount,
             description=description.strip(),
             date_value=date_value,
+            period=await self.get_period_for_date(date_value, uid),
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
-    async def list_income(self, start_date: date, end_date: date, user_id: int | None = None):
-        return await self.income_repo.list_by_range(self._uid(user_id), start_date, end_date)
+    async def list_income(
+        self,
+        start_date: date,
+        end_date: date,
+        user_id: int | None = None,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ):
+        return await self.income_repo.list_by_range(self._uid(user_id), start_date, end_date, limit=limit, after=after)
+
+    async def stream_income(self, start_date: date, end_date: date, user_id: int | None = None):
+        batch_size = max(1, get_settings().stream_batch_size)
+        async for item in self.income_repo.stream_by_range(self._uid(user_id), start_date, end_date, batch_size=batch_size):
+            yield item
 
     async def update_income(
         self,
@@ -363,8 +681,15 @@ class FinanceService:
         income = await self.income_repo.get_by_id(income_id)
         if income is None or income.user_id != uid:
             raise FinanceError("Income item not found.")
-        item = await self.income_repo.update(income_id, amount=amount, description=description.strip(), date_value=date_value)
-        await self.session.commit()
+        item = await self.income_repo.update(
+            income_id,
+            amount=amount,
+            description=description.strip(),
+            date_value=date_value,
+            period=await self.get_period_for_date(date_value, uid),
+            previous_period=await self.get_period_for_date(income.date, uid),
+        )
+        await self._commit(user_id)
         return item
 
     async def delete_income(self, income_id: int, user_id: int | None = None) -> None:
@@ -372,28 +697,31 @@ class FinanceService:
         income = await self.income_repo.get_by_id(income_id)
         if income is None or income.user_id != uid:
             raise FinanceError("Income item not found.")
-        await self.income_repo.delete(income_id)
-        await self.session.commit()
+        await self.income_repo.delete(income_id, period=await self.get_period_for_date(income.date, uid))
+        await self._commit(user_id)
 
     async def set_salary(self, amount: float, user_id: int | None = None) -> float:
         await self.settings_repo.set_salary(self._uid(user_id), amount)
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
         return amount
 
     async def get_salary(self, user_id: int | None = None) -> float:
-        return await self.settings_repo.get_salary(self._uid(user_id))
+        return (await self.get_context(user_id)).salary
 
     async def set_salary_override(self, year: int, month: int, cycle: int, amount: float, user_id: int | None = None) -> float:
         await self.settings_repo.set_salary_override(self._uid(user_id), year, month, cycle, amount)
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
         return amount
 
     async def get_salary_override(self, year: int, month: int, cycle: int, user_id: int | None = None) -> float | None:
-        return await self.settings_repo.get_salary_override(self._uid(user_id), year, month, cycle)
+        return (await self.get_context(user_id)).salary_override(year, month, cycle)
 
     async def delete_salary_override(self, year: int, month: int, cycle: int, user_id: int | None = None) -> None:
         await self.settings_repo.delete_salary_override(self._uid(user_id), year, month, cycle)
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
 
     async def get_salary_for_period(self, year: int, month: int, cycle: int, user_id: int | None = None) -> float:
         override = await self.get_salary_override(year, month, cycle, user_id)
@@ -404,7 +732,7 @@ class FinanceService:
         today = when or date.today()
         cycle = await self.get_cycle_for_date(today, uid)
         row = await self.savings_repo.record_savings(uid, amount, today.year, today.month, cycle)
-        await self.session.commit()
+        await self._commit(user_id)
         return row
 
     async def add_extra_savings(self, amount: float, when: date | None = None, user_id: int | None = None):
@@ -412,12 +740,12 @@ class FinanceService:
         today = when or date.today()
         cycle = await self.get_cycle_for_date(today, uid)
         row = await self.savings_repo.add_extra_savings(uid, amount, today.year, today.month, cycle)
-        await self.session.commit()
+        await self._commit(user_id)
         return row
 
     async def withdraw_savings(self, amount: float, user_id: int | None = None) -> bool:
         ok = await self.savings_repo.withdraw_savings(self._uid(user_id), amount)
-        await self.session.commit()
+        await self._commit(user_id)
         return ok
 
     async def get_period_savings(self, year: int, month: int, cycle: int, user_id: int | None = None) -> float:
@@ -429,7 +757,7 @@ class FinanceService:
 
     async def add_savings_goal(self, name: str, target_amount: float, user_id: int | None = None):
         goal = await self.savings_repo.create_goal(self._uid(user_id), name.strip(), target_amount)
-        await self.session.commit()
+        await self._commit(user_id)
         return goal
 
     async def create_savings_goal(self, name: str, target_amount: float, user_id: int | None = None):
@@ -444,7 +772,7 @@ class FinanceService:
         if goal is None or goal.user_id != uid:
             raise FinanceError("Savings goal not found.")
         item = await self.savings_repo.update_goal(goal_id, name=name.strip(), target_amount=target_amount)
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def delete_savings_goal(self, goal_id: int, user_id: int | None = None) -> None:
@@ -453,13 +781,13 @@ class FinanceService:
         if goal is None or goal.user_id != uid:
             raise FinanceError("Savings goal not found.")
         await self.savings_repo.delete_goal(goal_id)
-        await self.session.commit()
+        await self._commit(user_id)
 
     async def get_settings_payload(self, user_id: int | None = None) -> dict[str, object]:
-        uid = self._uid(user_id)
-        raw = await self.settings_repo.get_all_settings(uid)
+        context = await self.get_context(user_id)
+        raw = context.settings
         return {
-            "period_mode": await self.get_period_mode(uid),
+            "period_mode": context.period_mode,
             "pay_day_1": int(raw.get("quincenal_pay_day_1", "1")),
             "pay_day_2": int(raw.get("quincenal_pay_day_2", "16")),
             "monthly_pay_day": int(raw.get("monthly_pay_day", "1")),
@@ -472,6 +800,8 @@ class FinanceService:
         uid = self._uid(user_id)
         current = await self.get_settings_payload(uid)
         merged = {**current, **payload}
+        cycle_keys = ("period_mode", "pay_day_1", "pay_day_2")
+        cycles_changed = any(str(merged[key]) != str(current[key]) for key in cycle_keys)
         await self.settings_repo.set_period_mode(uid, str(merged["period_mode"]))
         await self.settings_repo.set_setting(uid, "quincenal_pay_day_1", str(merged["pay_day_1"]))
         await self.settings_repo.set_setting(uid, "quincenal_pay_day_2", str(merged["pay_day_2"]))
@@ -479,9 +809,55 @@ class FinanceService:
         await self.settings_repo.set_setting(uid, "theme_preset", str(merged["theme"]))
         await self.settings_repo.set_setting(uid, "auto_export_close_period", str(bool(merged["auto_export"])).lower())
         await self.settings_repo.set_setting(uid, "include_beta_updates", str(bool(merged["include_beta"])).lower())
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
+        if cycles_changed:
+            self._schedule_cycle_recompute_after_commit(uid)
         return await self.get_settings_payload(uid)
 
+    def _schedule_cycle_recompute_after_commit(self, user_id: int) -> None:
+        # The job reads through its own session, so it must not start before our writes are visible.
+        if self._pending_recomputes is not None:
+            self._pending_recomputes.add(user_id)
+            return
+        self.schedule_cycle_recompute(user_id)
+
+    def schedule_cycle_recompute(self, user_id: int | None = None) -> dict[str, object]:
+        uid = self._uid(user_id)
+
+        async def work(session: AsyncSession, job: CycleRecomputeJob) -> None:
+            await FinanceService(session, uid).recompute_expense_cycles(job)
+
+        return cycle_recompute_jobs.schedule(uid, work)
+
+    def get_cycle_recompute_status(self, user_id: int | None = None) -> dict[str, object] | None:
+        return cycle_recompute_jobs.status(self._uid(user_id))
+
+    async def recompute_expense_cycles(self, job: CycleRecomputeJob | None = None, user_id: int | None = None) -> int:
+        uid = self._uid(user_id)
+        job = job or CycleRecomputeJob(user_id=uid)
+        calendar = await self.get_period_calendar(uid)
+        batch_size = max(1, get_settings().cycle_recompute_batch_size)
+        job.total = await self.expense_repo.count_by_user(uid)
+        last_id = 0
+        while True:
+            rows = await self.expense_repo.list_cycle_batch(uid, after_id=last_id, limit=batch_size)
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            changes: list[tuple[int, date, int]] = []
+            for expense_id, value, current in rows:
+                cycle = calendar.cycle_for_date(value)
+                if cycle != current:
+                    changes.append((expense_id, value, cycle))
+            if changes:
+                await self.expense_repo.set_cycles(changes)
+                await self._commit(uid)
+            job.processed += len(rows)
+            job.updated += len(changes)
+        await self.rebuild_period_rollups(uid)
+        return job.updated
+
     async def update_settings(
         self,
         *,
@@ -512,63 +888,68 @@ class FinanceService:
         return await self.update_settings_payload(payload, user_id)
 
     async def get_custom_quincena(self, year: int, month: int, cycle: int, user_id: int | None = None) -> tuple[str, str]:
-        custom = await self.settings_repo.get_custom_quincena_range(self._uid(user_id), year, month, cycle)
+        custom = (await self.get_context(user_id)).custom_quincena(year, month, cycle)
         if custom is not None:
             return custom[0].isoformat(), custom[1].isoformat()
         return await self.get_period_range(year, month, cycle, user_id)
 
     async def set_custom_quincena(self, year: int, month: int, cycle: int, start_date: date, end_date: date, user_id: int | None = None) -> tuple[str, str]:
         await self.settings_repo.set_custom_quincena(self._uid(user_id), year, month, cycle, start_date, end_date)
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
         return start_date.isoformat(), end_date.isoformat()
 
     async def delete_custom_quincena(self, year: int, month: int, cycle: int, user_id: int | None = None) -> None:
         await self.settings_repo.delete_custom_quincena(self._uid(user_id), year, month, cycle)
-        await self.session.commit()
+        await self._commit(user_id)
+        self.invalidate_context()
 
     async def get_dashboard_data(self, year: int | None = None, month: int | None = None, cycle: int | None = None, user_id: int | None = None) -> DashboardResult:
         uid = self._uid(user_id)
-        await self.ensure_default_categories(uid)
+        cache_version = dashboard_cache.version(uid)
+        if self._context_version != cache_version:
+            self.invalidate_context()
         today = date.today()
         target_year = year or today.year
         target_month = month or today.month
         target_cycle = cycle or await self.get_cycle_for_date(today, uid)
+        cache_key = (target_year, target_month, target_cycle, today)
+        cached = dashboard_cache.get(uid, cache_key, cache_version)
+        if cached is not None:
+            return cached
+        await self.ensure_default_categories(uid)
         start_iso, end_iso = await self.get_period_range(target_year, target_month, target_cycle, uid)
         start_date = date.fromisoformat(start_iso)
         end_date = date.fromisoformat(end_iso)
         period_mode = await self.get_period_mode(uid)
-        expenses = await self.expense_repo.list_by_range(uid, start_date, end_date)
+        summary = await self.expense_repo.summarize_range(uid, start_date, end_date)
         fixed_payments = await self.get_fixed_payments_for_period(target_year, target_month, target_cycle, uid)
         total_savings = await self.get_total_savings(uid)
         period_savings = await self.get_period_savings(target_year, target_month, target_cycle, uid)
         salary = await self.get_salary(uid) if period_mode == "mensual" else await self.get_salary_for_period(target_year, target_month, target_cycle, uid)
         extra_income = await self.income_repo.get_total_by_range(uid, start_date, end_date)
         total_loans = await self.get_total_loans_affecting_budget(uid)
-        total_expenses = sum(float(item.amount) for item in expenses)
-        total_expenses_salary = sum(float(item.amount) for item in expenses if item.status.strip().lower() != "completed_savings")
+        total_expenses = summary.total
+        total_expenses_salary = summary.total_salary
         total_expenses_savings = total_expenses - total_expenses_salary
         total_fixed = sum(item.amount for item in fixed_payments)
         dinero_inicial = salary + extra_income - period_savings
         dinero_disponible = dinero_inicial - total_expenses_salary - total_fixed - total_loans
 
-        daily: dict[str, float] = {}
-        cat_totals: dict[str, float] = {}
+        cat_totals = {
+            str(category_id): total
+            for category_id, total in (await self.expense_repo.sum_by_category(uid, start_date, end_date)).items()
+        }
         recent_items: list[dict[str, object]] = []
         categories = await self.get_categories(uid)
         categories_by_id = {category.id: category.name for category in categories}
-        for expense in expenses:
-            key = expense.date.isoformat()
-            daily[key] = daily.get(key, 0.0) + float(expense.amount)
-            category_ids = [category.id for category in expense.categories]
-            for category_id in category_ids:
-                str_id = str(category_id)
-                cat_totals[str_id] = cat_totals.get(str_id, 0.0) + float(expense.amount)
+        for expense in await self.expense_repo.list_recent(uid, start_date, end_date, limit=20):
             recent_items.append(
                 {
                     "date": expense.date.isoformat(),
                     "description": expense.description,
-                    "amount": float(expense.amount),
-                    "categories": ", ".join(categories_by_id.get(category_id, "Sin cat.") for category_id in category_ids) or "Sin cat.",
+                    "amount": expense.amount,
+                    "categories": ", ".join(categories_by_id.get(category_id, "Sin cat.") for category_id in expense.category_ids) or "Sin cat.",
                     "type": "expense",
                     "id": expense.id,
                 }
@@ -600,8 +981,8 @@ class FinanceService:
                     }
                 )
         recent_items.sort(key=lambda item: str(item["date"]), reverse=True)
-        avg_daily = 0.0 if not daily else sum(daily.values()) / len(daily)
-        return DashboardResult(
+        avg_daily = 0.0 if not summary.day_count else total_expenses / summary.day_count
+        result = DashboardResult(
             year=target_year,
             month=target_month,
             cycle=target_cycle,
@@ -618,7 +999,7 @@ class FinanceService:
             total_loans=total_loans,
             dinero_disponible=dinero_disponible,
             avg_daily=avg_daily,
-            expense_count=len(expenses),
+            expense_count=summary.count,
             fixed_count=len(fixed_payments),
             cat_totals=cat_totals,
             quincena_range=[start_iso, end_iso],
@@ -633,7 +1014,103 @@ class FinanceService:
                 end_date=end_iso,
             ),
         )
+        dashboard_cache.put(uid, cache_key, cache_version, result)
+        return result
 
+    async def get_year_overview(self, year: int | None = None, user_id: int | None = None) -> YearOverviewResult:
+        uid = self._uid(user_id)
+        cache_version = dashboard_cache.version(uid)
+        if self._context_version != cache_version:
+            self.invalidate_context()
+        today = date.today()
+        target_year = year or today.year
+        cache_key = ("year", target_year, today)
+        cached = dashboard_cache.get(uid, cache_key, cache_version)
+        if cached is not None:
+            return cached
+        context = await self.get_context(uid)
+        calendar = await self.get_period_calendar(uid)
+        period_mode = context.period_mode
+        bounds: list[tuple[int, int, date, date]] = []
+        for month in range(1, 13):
+            for cycle in ((1,) if period_mode == "mensual" else (1, 2)):
+                period_bounds = calendar.bounds(target_year, month, cycle)
+                bounds.append((month, cycle, period_bounds.start, period_bounds.end))
+        span_start = min(start for _, _, start, _ in bounds)
+        span_end = max(end for _, _, _, end in bounds)
+
+        rollups = {(item.month, item.cycle): item for item in await self.get_period_rollups(target_year, uid)}
+        # Rollups carry the totals; only the days with expenses (for avg_daily) come from the expenses table.
+        expense_dates = await self.expense_repo.list_dates(uid, span_start, span_end)
+        payments = await self.fixed_payment_repo.list_active_by_user(uid)
+        statuses = await self.fixed_payment_repo.get_record_statuses_for_year([payment.id for payment in payments], target_year)
+        savings = {
+            (row.month, row.quincenal_cycle): float(row.last_quincenal_savings or 0)
+            for row in await self.savings_repo.list_by_year(uid, target_year)
+        }
+
+        periods: list[PeriodSummary] = []
+        for month, cycle, start, end in bounds:
+            rollup = rollups.get((month, cycle)) or PeriodTotals(year=target_year, month=month, cycle=cycle)
+            expense_days = bisect_right(expense_dates, end) - bisect_left(expense_dates, start)
+            total_expenses = _settled(rollup.expense_total)
+            total_expenses_salary = _settled(rollup.expense_salary_total)
+            cat_totals = {
+                category_id: _settled(total) for category_id, total in rollup.category_totals.items() if _settled(total)
+            }
+            extra_income = _settled(rollup.extra_income_total)
+            fixed_payments = [
+                item
+                for item in (
+                    self._fixed_payment_status(payment, statuses.get((month, cycle), {}), start, end, today)
+                    for payment in payments
+                )
+                if item is not None
+            ]
+            total_fixed = sum(item.amount for item in fixed_payments)
+            override = context.salary_override(target_year, month, cycle)
+            salary = context.salary if period_mode == "mensual" or override is None else override
+            period_savings = savings.get((month, cycle), 0.0)
+            dinero_inicial = salary + extra_income - period_savings
+            periods.append(
+                PeriodSummary(
+                    year=target_year,
+                    month=month,
+                    cycle=cycle,
+                    start_date=start.isoformat(),
+                    end_date=end.isoformat(),
+                    period_title=PeriodService.format_period_label(
+                        year=target_year,
+                        month=month,
+                        cycle=cycle,
+                        period_mode=period_mode,
+                        start_date=start,
+                        end_date=end,
+                    ),
+                    salary=salary,
+                    extra_income=extra_income,
+                    period_savings=period_savings,
+                    dinero_inicial=dinero_inicial,
+                    total_expenses=total_expenses,
+                    total_expenses_salary=total_expenses_salary,
+                    total_expenses_savings=total_expenses - total_expenses_salary,
+                    total_fixed=total_fixed,
+                    dinero_disponible=dinero_inicial - total_expenses_salary - total_fixed,
+                    avg_daily=total_expenses / expense_days if expense_days else 0.0,
+                    expense_count=rollup.expense_count,
+                    fixed_count=len(fixed_payments),
+                    cat_totals={str(category_id): cat_totals[category_id] for category_id in sorted(cat_totals)},
+                )
+            )
+        result = YearOverviewResult(
+            year=target_year,
+            period_mode=period_mode,
+            total_savings=await self.get_total_savings(uid),
+            total_loans=await self.get_total_loans_affecting_budget(uid),
+            periods=periods,
+        )
+        dashboard_cache.put(uid, cache_key, cache_version, result)
+        return result
 
     def _normalize_deduction_type(self, value: str | None) -> str:
         normalized = (value or "ninguno").strip().lower()
@@ -683,6 +1160,7 @@ class FinanceService:
                 quincenal_cycle=cycle,
                 category_ids=[category.id],
                 status="completed_salary",
+                period=await self.get_period_for_date(date_value, uid),
             )
         item = await self.loan_repo.create(
             user_id=uid,
@@ -692,11 +1170,18 @@ class FinanceService:
             date_value=date_value,
             deduction_type=normalized_deduction,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
-    async def list_loans(self, *, include_paid: bool = False, user_id: int | None = None):
-        return await self.loan_repo.list_by_user(self._uid(user_id), include_paid=include_paid)
+    async def list_loans(
+        self,
+        *,
+        include_paid: bool = False,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+        user_id: int | None = None,
+    ):
+        return await self.loan_repo.list_by_user(self._uid(user_id), include_paid=include_paid, limit=limit, after=after)
 
     async def update_loan(
         self,
@@ -721,7 +1206,7 @@ class FinanceService:
             date_value=date_value,
             deduction_type=self._normalize_deduction_type(deduction_type),
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return updated
 
     async def delete_loan(self, loan_id: int, user_id: int | None = None) -> None:
@@ -730,7 +1215,7 @@ class FinanceService:
         if item is None or item.user_id != uid:
             raise FinanceError("Loan not found.")
         await self.loan_repo.delete(loan_id)
-        await self.session.commit()
+        await self._commit(user_id)
 
     async def pay_loan(self, loan_id: int, user_id: int | None = None):
         uid = self._uid(user_id)
@@ -738,7 +1223,7 @@ class FinanceService:
         if item is None or item.user_id != uid:
             raise FinanceError("Loan not found.")
         updated = await self.loan_repo.update(loan_id, is_paid=True, paid_date=date.today())
-        await self.session.commit()
+        await self._commit(user_id)
         return updated
 
     async def create_debt(
@@ -765,7 +1250,7 @@ class FinanceService:
             monthly_payment=monthly_payment,
             current_balance=principal_amount,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def list_debts(self, *, include_inactive: bool = False, user_id: int | None = None):
@@ -800,7 +1285,7 @@ class FinanceService:
             monthly_payment=monthly_payment,
             current_balance=current_balance,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return updated
 
     async def delete_debt(self, debt_id: int, user_id: int | None = None) -> None:
@@ -809,7 +1294,7 @@ class FinanceService:
         if item is None or item.user_id != uid:
             raise FinanceError("Debt not found.")
         await self.debt_repo.delete_debt(debt_id)
-        await self.session.commit()
+        await self._commit(user_id)
 
     async def add_debt_payment(
         self,
@@ -840,15 +1325,22 @@ class FinanceService:
         )
         new_balance = max(0.0, float(item.current_balance) - capital_amount)
         await self.debt_repo.update_debt(debt_id, current_balance=new_balance, is_active=new_balance > 0)
-        await self.session.commit()
+        await self._commit(user_id)
         return payment
 
-    async def list_debt_payments(self, debt_id: int, user_id: int | None = None):
+    async def list_debt_payments(
+        self,
+        debt_id: int,
+        user_id: int | None = None,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ):
         uid = self._uid(user_id)
         item = await self.debt_repo.get_debt(debt_id)
         if item is None or item.user_id != uid:
             raise FinanceError("Debt not found.")
-        return await self.debt_repo.list_debt_payments(debt_id)
+        return await self.debt_repo.list_debt_payments(debt_id, limit=limit, after=after)
 
     async def create_personal_debt(
         self,
@@ -868,7 +1360,7 @@ class FinanceService:
             description=description.strip() if description else None,
             date_value=date_value,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return item
 
     async def list_personal_debts(self, *, include_paid: bool = False, user_id: int | None = None):
@@ -897,7 +1389,7 @@ class FinanceService:
             description=description.strip() if description else None,
             date_value=date_value,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return updated
 
     async def delete_personal_debt(self, debt_id: int, user_id: int | None = None) -> None:
@@ -906,7 +1398,7 @@ class FinanceService:
         if item is None or item.user_id != uid:
             raise FinanceError("Personal debt not found.")
         await self.debt_repo.delete_personal_debt(debt_id)
-        await self.session.commit()
+        await self._commit(user_id)
 
     async def add_personal_debt_payment(
         self,
@@ -936,15 +1428,23 @@ class FinanceService:
             is_paid=new_balance <= 0,
             paid_date=date.today() if new_balance <= 0 else None,
         )
-        await self.session.commit()
+        await self._commit(user_id)
         return payment
 
-    async def list_personal_debt_payments(self, debt_id: int, user_id: int | None = None):
+    async def list_personal_debt_payments(
+        self,
+        debt_id: int,
+        user_id: int | None = None,
+        *,
+        limit: int | None = None,
+        after: KeysetPosition | None = None,
+    ):
         uid = self._uid(user_id)
         item = await self.debt_repo.get_personal_debt(debt_id)
         if item is None or item.user_id != uid:
             raise FinanceError("Personal debt not found.")
-        return await self.debt_repo.list_personal_debt_payments(debt_id)
+        return await self.debt_repo.list_personal_debt_payments(debt_id, limit=limit, after=after)
+
     async def get_total_loans_affecting_budget(self, user_id: int | None = None) -> float:
         uid = self._uid(user_id)
         stmt = select(func.coalesce(func.sum(Loan.amount), 0.0)).where(
@@ -953,3 +1453,14 @@ class FinanceService:
             or_(Loan.deduction_type.is_(None), Loan.deduction_type == "ninguno"),
         )
         return float((await self.session.scalar(stmt)) or 0.0)
+
+    async def search(
+        self,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        user_id: int | None = None,
+    ):
+        return await self.search_repo.search(self._uid(user_id), query, kinds=kinds, limit=limit, offset=offset)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import TypeVar
+
+import bcrypt
+
+from backend.config import get_settings
+
+T = TypeVar('T')
+
+
+class PasswordHasherBusy(Exception):
+    """Raised instead of queueing once ``max_pending`` hashes are already in flight."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a small dedicated thread pool so it never blocks the event loop.
+
+    ``max_pending`` bounds the work admitted at once (running plus queued);
+    beyond it callers are rejected immediately rather than piling up behind a
+    login burst. bcrypt releases the GIL while hashing, so ``workers`` threads
+    really do hash in parallel.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int, rounds: int) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self.rounds = rounds
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hasher')
+        return self._executor
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def _run(self, work: Callable[[], T]) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+            pool = self._pool()
+        submitted = perf_counter()
+
+        def timed() -> T:
+            started = perf_counter()
+            try:
+                return work()
+            finally:
+                finished = perf_counter()
+                with self._lock:
+                    self.completed += 1
+                    self.wait_seconds += started - submitted
+                    self.max_wait_seconds = max(self.max_wait_seconds, started - submitted)
+                    self.hash_seconds += finished - started
+
+        try:
+            future = pool.submit(timed)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        # Released from the pool's side so a cancelled caller keeps its slot until the thread is done.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, secret: str) -> str:
+        rounds = self.rounds
+        return await self._run(
+            lambda: bcrypt.hashpw(secret.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+        )
+
+    async def verify(self, secret: str, hashed: str) -> bool:
+        return await self._run(lambda: bcrypt.checkpw(secret.encode('utf-8'), hashed.encode('utf-8')))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'rounds': self.rounds,
+                'pending': self._pending,
+                'queued': max(0, self._pending - self.workers),
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_wait_ms': round(self.wait_seconds * 1000 / self.completed, 3) if self.completed else 0.0,
+                'max_wait_ms': round(self.max_wait_seconds * 1000, 3),
+                'avg_hash_ms': round(self.hash_seconds * 1000 / self.completed, 3) if self.completed else 0.0,
+            }
+
+
+_settings = get_settings()
+password_hasher = PasswordHasher(
+    workers=_settings.password_hash_workers,
+    max_pending=_settings.password_hash_max_pending,
+    rounds=_settings.bcrypt_rounds,
+)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 @dataclass(slots=True)
@@ -120,6 +122,34 @@ class PeriodService:
             return 1
         return 2
 
+    @classmethod
+    def get_period_for_date(
+        cls,
+        value: date,
+        *,
+        period_mode: str,
+        day1: int,
+        day2: int,
+        monthly_payday: int,
+    ) -> tuple[int, int, int]:
+        if period_mode == "mensual":
+            if value.day >= cls.safe_day(value.year, value.month, monthly_payday):
+                return value.year, value.month, 1
+            prev_year, prev_month = cls.previous_month(value.year, value.month)
+            return prev_year, prev_month, 1
+        prev_year, prev_month = cls.previous_month(value.year, value.month)
+        next_year, next_month = cls.next_month(value.year, value.month)
+        for year, month, cycle in (
+            (value.year, value.month, 1),
+            (value.year, value.month, 2),
+            (prev_year, prev_month, 2),
+            (next_year, next_month, 1),
+        ):
+            bounds = cls.get_quincena_range(year, month, cycle, day1=day1, day2=day2)
+            if bounds.start <= value <= bounds.end:
+                return year, month, cycle
+        return value.year, value.month, cls.get_cycle_for_date(value, period_mode=period_mode, day1=day1, day2=day2)
+
     @classmethod
     def iterate_months(cls, start: date, end: date):
         year = start.year
@@ -153,3 +183,141 @@ class PeriodService:
         if year % 100 == 0:
             return False
         return year % 4 == 0
+
+
+PeriodKey = tuple[int, int, int]
+CustomRanges = tuple[tuple[PeriodKey, tuple[date, date]], ...]
+
+
+class PeriodCalendar:
+    """Precomputed period boundaries for one pay-day configuration.
+
+    Bounds for every period in ``[start_year, end_year]`` are built once and,
+    with custom quincenas merged in, flattened into sorted breakpoints: the
+    period a date maps to can only change at a breakpoint, so each segment is
+    resolved once and a date lookup is a single bisect. Dates outside the span
+    fall back to ``PeriodService``.
+    """
+
+    def __init__(
+        self,
+        *,
+        period_mode: str,
+        day1: int,
+        day2: int,
+        monthly_payday: int,
+        custom_quincenas: CustomRanges = (),
+        start_year: int,
+        end_year: int,
+    ) -> None:
+        self.period_mode = "mensual" if period_mode == "mensual" else "quincenal"
+        self.day1 = day1
+        self.day2 = day2
+        self.monthly_payday = monthly_payday
+        self.custom_quincenas = dict(custom_quincenas) if self.period_mode != "mensual" else {}
+        self._custom_order = sorted(self.custom_quincenas.items())
+        self._bounds: dict[PeriodKey, PeriodBounds] = {}
+        self._first_quincenas: dict[tuple[int, int], PeriodBounds] = {}
+        for year in range(start_year - 1, end_year + 2):
+            for month in range(1, 13):
+                if self.period_mode == "mensual":
+                    self._bounds[(year, month, 1)] = PeriodService.get_month_range(year, month, monthly_payday)
+                    continue
+                for cycle in (1, 2):
+                    bounds = PeriodService.get_quincena_range(year, month, cycle, day1=day1, day2=day2)
+                    if cycle == 1:
+                        self._first_quincenas[(year, month)] = bounds
+                    self._bounds[(year, month, cycle)] = bounds
+        self.span_start = date(start_year, 1, 1)
+        self.span_end = date(end_year, 12, 31)
+
+        breakpoints = {self.span_start}
+        for year in range(start_year, end_year + 1):
+            breakpoints.update(date(year, month, 1) for month in range(1, 13))
+        for bounds in self._bounds.values():
+            for value in (bounds.start, bounds.end + timedelta(days=1)):
+                if self.span_start <= value <= self.span_end:
+                    breakpoints.add(value)
+        for start, end in self.custom_quincenas.values():
+            for value in (start, end + timedelta(days=1)):
+                if self.span_start <= value <= self.span_end:
+                    breakpoints.add(value)
+        self._breaks = sorted(breakpoints)
+        self._keys = [self._resolve(value) for value in self._breaks]
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def build(
+        cls,
+        *,
+        period_mode: str,
+        day1: int,
+        day2: int,
+        monthly_payday: int,
+        custom_quincenas: CustomRanges = (),
+        start_year: int,
+        end_year: int,
+    ) -> PeriodCalendar:
+        return cls(
+            period_mode=period_mode,
+            day1=day1,
+            day2=day2,
+            monthly_payday=monthly_payday,
+            custom_quincenas=custom_quincenas,
+            start_year=start_year,
+            end_year=end_year,
+        )
+
+    def _resolve(self, value: date) -> PeriodKey:
+        for key, (start, end) in self._custom_order:
+            if start <= value <= end:
+                return key
+        return PeriodService.get_period_for_date(
+            value,
+            period_mode=self.period_mode,
+            day1=self.day1,
+            day2=self.day2,
+            monthly_payday=self.monthly_payday,
+        )
+
+    def period_for_date(self, value: date) -> PeriodKey:
+        if not self.span_start <= value <= self.span_end:
+            return self._resolve(value)
+        return self._keys[bisect_right(self._breaks, value) - 1]
+
+    def periods_for_dates(self, values: list[date]) -> list[PeriodKey]:
+        """Map many dates at once with one sweep over the sorted breakpoints."""
+        out: list[PeriodKey] = [None] * len(values)  # type: ignore[list-item]
+        index = 0
+        last = len(self._breaks) - 1
+        for position in sorted(range(len(values)), key=values.__getitem__):
+            value = values[position]
+            if not self.span_start <= value <= self.span_end:
+                out[position] = self._resolve(value)
+                continue
+            while index < last and self._breaks[index + 1] <= value:
+                index += 1
+            out[position] = self._keys[index]
+        return out
+
+    def cycle_for_date(self, value: date) -> int:
+        if self.period_mode == "mensual":
+            return 1
+        first = self._first_quincenas.get((value.year, value.month))
+        if first is None:
+            first = PeriodService.get_quincena_range(value.year, value.month, 1, day1=self.day1, day2=self.day2)
+        return 1 if first.start <= value <= first.end else 2
+
+    def bounds(self, year: int, month: int, cycle: int) -> PeriodBounds:
+        if self.period_mode == "mensual":
+            cycle = 1
+        else:
+            custom = self.custom_quincenas.get((year, month, cycle))
+            if custom is not None:
+                return PeriodBounds(start=custom[0], end=custom[1])
+        bounds = self._bounds.get((year, month, cycle))
+        if bounds is not None:
+            return bounds
+        if self.period_mode == "mensual":
+            return PeriodService.get_month_range(year, month, self.monthly_payday)
+        return PeriodService.get_quincena_range(year, month, cycle, day1=self.day1, day2=self.day2)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from time import monotonic, time
+from typing import Protocol
+from zlib import crc32
+
+from sqlalchemy import case, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.config import get_settings
+from backend.database.engine import engine
+from backend.database.models import RateLimitBucket
+
+logger = logging.getLogger(__name__)
+
+# Idle buckets looked at per hit; keeps eviction amortized without a background pass.
+_IDLE_EVICTION_STEP = 2
+
+
+class RateLimitStore(Protocol):
+    async def hit(self, key: str, *, limit: int, window_seconds: int) -> bool: ...
+
+    def stats(self) -> dict[str, object]: ...
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated_at: float
+    full_at: float
+
+
+class _Shard:
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self.buckets: OrderedDict[str, _Bucket] = OrderedDict()
+        self.lock = Lock()
+        self.evictions = 0
+
+
+class MemoryRateLimitStore:
+    """Per-process token buckets split over independently locked shards.
+
+    A bucket holds ``limit`` tokens and refills at ``limit / window_seconds``
+    per second. Buckets are kept in LRU order, so idle buckets that have
+    refilled completely (and therefore carry no state) are dropped from the
+    front as traffic passes through, and each shard never holds more than its
+    share of ``max_keys``.
+    """
+
+    def __init__(self, *, max_keys: int, shards: int) -> None:
+        self.max_keys = max(1, max_keys)
+        shard_count = max(1, min(shards, self.max_keys))
+        self._shards = [_Shard(max(1, self.max_keys // shard_count)) for _ in range(shard_count)]
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[crc32(key.encode('utf-8')) % len(self._shards)]
+
+    def take(self, key: str, *, limit: int, window_seconds: int) -> bool:
+        rate = limit / window_seconds
+        now = monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = shard.buckets[key] = _Bucket(tokens=float(limit), updated_at=now, full_at=now)
+            else:
+                bucket.tokens = min(float(limit), bucket.tokens + (now - bucket.updated_at) * rate)
+                bucket.updated_at = now
+                shard.buckets.move_to_end(key)
+            allowed = bucket.tokens >= 1
+            if allowed:
+                bucket.tokens -= 1
+            bucket.full_at = now + (limit - bucket.tokens) / rate
+            for _ in range(_IDLE_EVICTION_STEP):
+                oldest_key = next(iter(shard.buckets))
+                if oldest_key == key or shard.buckets[oldest_key].full_at > now:
+                    break
+                del shard.buckets[oldest_key]
+            while len(shard.buckets) > shard.max_keys:
+                shard.buckets.popitem(last=False)
+                shard.evictions += 1
+            return allowed
+
+    async def hit(self, key: str, *, limit: int, window_seconds: int) -> bool:
+        return self.take(key, limit=limit, window_seconds=window_seconds)
+
+    def stats(self) -> dict[str, object]:
+        keys = evictions = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys += len(shard.buckets)
+                evictions += shard.evictions
+        return {
+            'backend': 'memory',
+            'keys': keys,
+            'max_keys': self.max_keys,
+            'shards': len(self._shards),
+            'capacity_evictions': evictions,
+        }
+
+
+class DatabaseRateLimitStore:
+    """Token buckets in the ``rate_limit_buckets`` table, shared by every worker.
+
+    Taking a token is one conditional UPDATE that refills and decrements in
+    SQL, so concurrent workers cannot both spend the last token. A missing
+    bucket is inserted full minus one. ``expires_at`` is one window after the
+    last hit, when the bucket is full again and carries no state, and lets the
+    expired auth sweeper remove idle rows. If the database is unavailable the
+    request is let through.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self.allowed = 0
+        self.denied = 0
+        self.errors = 0
+
+    async def _take(self, key: str, *, limit: int, window_seconds: int) -> bool:
+        table = RateLimitBucket.__table__
+        rate = limit / window_seconds
+        now = time()
+        expires_at = datetime.now(UTC) + timedelta(seconds=window_seconds)
+        refilled = table.c.tokens + (now - table.c.updated_at) * rate
+        available = case((refilled > limit, float(limit)), else_=refilled)
+        take = (
+            update(table)
+            .where(table.c.bucket_key == key, available >= 1)
+            .values(tokens=available - 1, updated_at=now, expires_at=expires_at)
+        )
+        dialect_insert = postgresql.insert if self._engine.dialect.name == 'postgresql' else sqlite.insert
+        create = (
+            dialect_insert(table)
+            .values(bucket_key=key, tokens=float(limit - 1), updated_at=now, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[table.c.bucket_key])
+        )
+        async with self._engine.begin() as connection:
+            if (await connection.execute(take)).rowcount:
+                return True
+            if (await connection.execute(create)).rowcount:
+                return True
+            # The bucket exists and is empty, unless another worker created it in between.
+            return bool((await connection.execute(take)).rowcount)
+
+    async def hit(self, key: str, *, limit: int, window_seconds: int) -> bool:
+        try:
+            allowed = await self._take(key, limit=limit, window_seconds=window_seconds)
+        except SQLAlchemyError:
+            logger.exception('Rate limit backend unavailable; allowing %s', key)
+            self.errors += 1
+            return True
+        if allowed:
+            self.allowed += 1
+        else:
+            self.denied += 1
+        return allowed
+
+    def stats(self) -> dict[str, object]:
+        return {
+            'backend': 'database',
+            'allowed': self.allowed,
+            'denied': self.denied,
+            'errors': self.errors,
+        }
+
+
+def build_rate_limit_store(settings=None) -> RateLimitStore:
+    settings = settings or get_settings()
+    if settings.rate_limit_backend == 'database':
+        return DatabaseRateLimitStore(engine)
+    if settings.rate_limit_backend != 'memory':
+        raise RuntimeError(f'RATE_LIMIT_BACKEND desconocido: {settings.rate_limit_backend}')
+    return MemoryRateLimitStore(max_keys=settings.rate_limit_max_keys, shards=settings.rate_limit_shards)
+
+
+rate_limit_store = build_rate_limit_store()
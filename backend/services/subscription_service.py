@@ -14,6 +14,7 @@ import httpx
 
 from backend.config import Settings, get_settings
 from backend.repositories.subscription_repo import SubscriptionRepository
+from backend.services.versioned_cache import VersionedTTLCache
 
 
 @dataclass(slots=True)
@@ -27,6 +28,16 @@ class SubscriptionStatus:
     billing_provider: str
 
 
+_settings = get_settings()
+# Entries expire after a short TTL (other workers may have processed a
+# webhook) and ``_commit`` drops them explicitly whenever this process changes
+# a subscription.
+entitlements_cache = VersionedTTLCache(
+    max_entries=_settings.entitlements_cache_size,
+    ttl_seconds=_settings.entitlements_cache_ttl_seconds,
+)
+
+
 class SubscriptionError(Exception):
     pass
 
@@ -89,12 +100,24 @@ class SubscriptionService:
             self._stripe_sdk = None
         return self._stripe_sdk
 
-    async def get_status(self, user_id: int) -> SubscriptionStatus:
-        item = await self.repo.ensure_default(user_id)
+    async def _commit(self, user_id: int) -> None:
         await self.repo.session.commit()
+        entitlements_cache.bump(user_id)
+
+    async def get_status(self, user_id: int) -> SubscriptionStatus:
+        version = entitlements_cache.version(user_id)
+        cached = entitlements_cache.get(user_id, 'status', version)
+        if cached is not None:
+            return cached
+        item = await self.repo.get_by_user(user_id)
+        if item is None:
+            # Rows are created at registration; this only covers accounts older than that.
+            item = await self.repo.ensure_default(user_id)
+            await self._commit(user_id)
+            version = entitlements_cache.version(user_id)
         is_premium = item.plan == 'premium' and item.status in {'active', 'trialing', 'past_due'}
         expense_limit = None if is_premium else 15
-        return SubscriptionStatus(
+        status = SubscriptionStatus(
             plan=item.plan,
             status=item.status,
             is_premium=is_premium,
@@ -103,11 +126,13 @@ class SubscriptionService:
             expense_limit_per_period=expense_limit,
             billing_provider=self._status_provider_name(),
         )
+        entitlements_cache.put(user_id, 'status', version, status)
+        return status
 
     async def create_checkout(self, user_id: int) -> str | None:
         item = await self.repo.ensure_default(user_id)
         if item.plan == 'premium' and item.status in {'active', 'trialing', 'past_due'}:
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return None
 
         provider = self._checkout_provider_name()
@@ -116,13 +141,13 @@ class SubscriptionService:
         if provider == 'polar':
             return await self._create_polar_checkout(user_id)
 
-        await self.repo.session.commit()
+        await self._commit(user_id)
         return self._build_checkout_placeholder(provider)
 
     async def _create_stripe_checkout(self, user_id: int) -> str:
         stripe_sdk = self._get_stripe_sdk()
         if not self.settings.stripe_enabled or stripe_sdk is None:
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return self._build_checkout_placeholder('stripe')
 
         stripe_sdk.api_key = self.settings.stripe_secret_key
@@ -136,7 +161,7 @@ class SubscriptionService:
                 subscription_data={'metadata': {'user_id': str(user_id)}},
             )
         except Exception:
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return self._build_checkout_placeholder('stripe')
         await self.repo.update_status(
             user_id,
@@ -144,7 +169,7 @@ class SubscriptionService:
             provider_customer_id=str(getattr(checkout, 'customer', '') or '') or None,
             provider_subscription_id=str(getattr(checkout, 'subscription', '') or '') or None,
         )
-        await self.repo.session.commit()
+        await self._commit(user_id)
         return getattr(checkout, 'url', None) or self._build_checkout_placeholder('stripe')
 
     def _polar_checkout_payload(self, user_id: int) -> dict[str, object]:
@@ -165,7 +190,7 @@ class SubscriptionService:
     async def _create_polar_checkout(self, user_id: int) -> str:
         if not (self.settings.polar_access_token and self.settings.polar_product_id):
             await self.repo.update_status(user_id, status='pending_checkout')
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return self._build_checkout_placeholder('polar')
 
         headers = {
@@ -201,7 +226,7 @@ class SubscriptionService:
             provider_customer_id=customer_id,
             provider_subscription_id=subscription_id,
         )
-        await self.repo.session.commit()
+        await self._commit(user_id)
         return checkout_url
 
     @staticmethod
@@ -379,7 +404,7 @@ class SubscriptionService:
         active_items = active_subscriptions if isinstance(active_subscriptions, list) else []
         if not active_items:
             await self.repo.update_status(user_id, plan='free', status='canceled')
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return f'Suscripcion degradada para user_id={user_id}: customer.state_changed'
 
         first_active = active_items[0] if isinstance(active_items[0], dict) else {}
@@ -395,7 +420,7 @@ class SubscriptionService:
             provider_subscription_id=subscription_id,
             current_period_end=period_end,
         )
-        await self.repo.session.commit()
+        await self._commit(user_id)
         return f'Suscripcion premium actualizada para user_id={user_id}: customer.state_changed'
 
     async def _process_subscription_like_event(
@@ -449,7 +474,7 @@ class SubscriptionService:
                 provider_subscription_id=subscription_id,
                 current_period_end=period_end,
             )
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return f'Suscripcion premium actualizada para user_id={user_id}: {event_type}'
 
         if event_type in past_due_events:
@@ -461,7 +486,7 @@ class SubscriptionService:
                 provider_subscription_id=subscription_id,
                 current_period_end=period_end,
             )
-            await self.repo.session.commit()
+            await self._commit(user_id)
             return f'Suscripcion premium actualizada para user_id={user_id}: {event_type}'
 
         if event_type in downgrade_events:
@@ -475,22 +500,32 @@ class SubscriptionService:
                 provider_subscription_id=subscription_id,
                 current_period_end=period_end,
             )
-            await self.repo.session.commit()
+            await self._commit(user_id)
             action = 'actualizada' if next_plan == 'premium' else 'degradada'
             return f'Suscripcion {action} para user_id={user_id}: {event_type}'
 
         return f'Webhook recibido sin accion aplicada: {event_type}'
 
-    async def can_create_expense(self, user_id: int, period_expense_count: int) -> bool:
+    async def expense_limit(self, user_id: int) -> int | None:
+        """Expenses allowed per period, or ``None`` while premium or in trial."""
         status = await self.get_status(user_id)
         if status.is_premium:
-            return True
+            return None
         trial_end = status.trial_end
         if trial_end is not None:
             if trial_end.tzinfo is None:
                 trial_end = trial_end.replace(tzinfo=timezone.utc)
             if trial_end > datetime.now(timezone.utc):
-                return True
-        limit = status.expense_limit_per_period or 15
-        return period_expense_count < limit
+                return None
+        return status.expense_limit_per_period or 15
+
+    async def remaining_expense_quota(self, user_id: int, period_expense_count: int) -> int | None:
+        limit = await self.expense_limit(user_id)
+        if limit is None:
+            return None
+        return max(0, limit - period_expense_count)
+
+    async def can_create_expense(self, user_id: int, period_expense_count: int) -> bool:
+        remaining = await self.remaining_expense_quota(user_id, period_expense_count)
+        return remaining is None or remaining > 0
 
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+CacheVersion = tuple[int, int]
+
+
+class VersionedTTLCache:
+    """In-process LRU of per-user results guarded by a per-user data version.
+
+    Readers capture ``version(user_id)`` before touching the database and store
+    the result under that version; writers call ``bump(user_id)`` after their
+    commit, so anything computed from pre-commit data can never be served again.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[CacheVersion, float, Any]] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        self._generation = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _current(self, user_id: int) -> CacheVersion:
+        return self._generation, self._versions.get(user_id, 0)
+
+    def version(self, user_id: int) -> CacheVersion:
+        with self._lock:
+            return self._current(user_id)
+
+    def bump(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def get(self, user_id: int, key: Hashable, version: CacheVersion) -> Any | None:
+        if not self.enabled:
+            return None
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            entry_version, expires_at, value = entry
+            if entry_version != self._current(user_id) or expires_at <= now:
+                del self._entries[(user_id, key)]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            if entry_version != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((user_id, key))
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, user_id: int, key: Hashable, version: CacheVersion, value: Any) -> None:
+        if not self.enabled:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            if version != self._current(user_id):
+                return
+            self._entries[(user_id, key)] = (version, monotonic() + self.ttl_seconds, stored)
+            self._entries.move_to_end((user_id, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and invalidate all versions handed out so far."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._generation += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
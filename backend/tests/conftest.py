@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+# Settings and the engine are built at import time, so point them at a scratch
+# database before anything under backend is imported.
+_DB_DIR = Path(tempfile.mkdtemp(prefix="rbp-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR / 'test.db'}"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("AUTH_SWEEP_INTERVAL_SECONDS", "0")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.database.base import Base
+from backend.database.engine import SessionLocal, engine
+from backend.middleware import rate_limit
+from backend.repositories.description_index import description_index
+from backend.services.auth_cache import auth_identity_cache
+from backend.services.auth_service import AuthService
+from backend.services.dashboard_cache import dashboard_cache
+from backend.services.rate_limiter import MemoryRateLimitStore
+from backend.services.subscription_service import entitlements_cache
+
+PASSWORD = "secret123"
+
+
+async def _reset_schema() -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def database(monkeypatch):
+    """A fresh schema, empty in-process caches and untouched rate limits for every test."""
+    asyncio.run(_reset_schema())
+    for cache in (auth_identity_cache, dashboard_cache, description_index, entitlements_cache):
+        cache.clear()
+    monkeypatch.setattr(rate_limit, "rate_limit_store", MemoryRateLimitStore(max_keys=1024, shards=1))
+    yield
+    # Pooled aiosqlite connections belong to the test's event loop; drop them with it.
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def session_factory():
+    return SessionLocal
+
+
+async def register_user(username: str = "alice", email: str | None = "alice@example.com"):
+    async with SessionLocal() as session:
+        return await AuthService(session).register(username, email, PASSWORD)
+
+
+@pytest.fixture
+def client():
+    from backend.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth_client(client):
+    response = client.post("/api/auth/register", json={"username": "alice", "email": "alice@example.com", "password": PASSWORD})
+    assert response.status_code == 201, response.text
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    return client
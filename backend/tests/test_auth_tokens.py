@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.app.infrastructure import build_container
+from backend.database.models import SessionToken
+from backend.services import auth_service
+from backend.services.auth_cache import AuthIdentity
+from backend.tests.conftest import PASSWORD, register_user
+
+
+@pytest.fixture(params=[False, True], ids=["stored", "stateless"])
+def stateless(request, monkeypatch):
+    monkeypatch.setattr(auth_service.settings, "stateless_access_tokens", request.param)
+    return request.param
+
+
+@pytest.fixture
+def tokens(client, stateless):
+    response = client.post(
+        "/api/auth/register",
+        json={"username": "alice", "email": "alice@example.com", "password": PASSWORD},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _me(client, access_token: str) -> int:
+    return client.get("/api/auth/me", headers={"Authorization": f"Bearer {access_token}"}).status_code
+
+
+def _login(client) -> dict[str, object]:
+    response = client.post("/api/auth/login", json={"identifier": "alice", "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_logout_revokes_every_session_of_the_user(client, tokens):
+    other_device = _login(client)
+    # Resolve both tokens first so the identity cache holds them when logout runs.
+    assert _me(client, tokens["access_token"]) == 200
+    assert _me(client, other_device["access_token"]) == 200
+
+    response = client.post("/api/auth/logout", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+
+    assert response.status_code == 204
+    assert _me(client, tokens["access_token"]) == 401
+    assert _me(client, other_device["access_token"]) == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": other_device["refresh_token"]}).status_code == 401
+    assert _me(client, _login(client)["access_token"]) == 200
+
+
+def test_refresh_rotates_the_refresh_token(client, tokens):
+    response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 200, response.text
+    assert _me(client, response.json()["access_token"]) == 200
+    assert client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+def test_deactivation_revokes_access_tokens(client, tokens):
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert _me(client, tokens["access_token"]) == 200
+
+    assert client.delete("/api/auth/me", headers=headers).status_code == 204
+
+    assert _me(client, tokens["access_token"]) == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("stateless_tokens", "stored_rows"), [(False, 2), (True, 1)])
+async def test_stateless_mode_stores_only_refresh_tokens(session_factory, monkeypatch, stateless_tokens, stored_rows):
+    monkeypatch.setattr(auth_service.settings, "stateless_access_tokens", stateless_tokens)
+
+    result = await register_user()
+
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(SessionToken).where(SessionToken.user_id == result.user.id))
+    assert count == stored_rows
+
+
+@pytest.mark.asyncio
+async def test_me_returns_the_cached_identity(session_factory):
+    result = await register_user()
+    async with session_factory() as session:
+        use_cases = build_container(session).auth_use_cases()
+        identity = await use_cases.me(result.access_token)
+        await use_cases.update_pin(result.user.id, pin="1234")
+        updated = await use_cases.me(result.access_token)
+
+    assert isinstance(identity, AuthIdentity)
+    assert (identity.id, identity.username, identity.pin_length) == (result.user.id, "alice", 0)
+    assert updated.pin_length == 4
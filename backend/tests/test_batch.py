@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.middleware import get_expense_import_quota
+
+
+@pytest.fixture
+def category_id(auth_client):
+    return auth_client.get("/api/categories").json()[0]["id"]
+
+
+def _create(category_id: int, description: str, amount: float = 10, day: str = "2026-10-03") -> dict[str, object]:
+    return {
+        "resource": "expense",
+        "action": "create",
+        "data": {"amount": amount, "description": description, "date": day, "category_id": category_id},
+    }
+
+
+def _october_expenses(client) -> list[dict[str, object]]:
+    response = client.get("/api/expenses", params={"start": "2026-10-01", "end": "2026-10-31"})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _october_total(client) -> float:
+    periods = client.get("/api/dashboard/year", params={"year": 2026}).json()["periods"]
+    return sum(period["total_expenses"] for period in periods if period["month"] == 10)
+
+
+def test_atomic_batch_rolls_back_every_operation(auth_client, category_id):
+    response = auth_client.post(
+        "/api/batch",
+        json={
+            "atomic": True,
+            "operations": [
+                _create(category_id, "mercado"),
+                _create(category_id, "farmacia"),
+                {"resource": "expense", "action": "delete", "id": 999999},
+                _create(category_id, "no ejecutada"),
+            ],
+        },
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["committed"] is False
+    assert [result["status"] for result in body["results"]] == [424, 424, 404, 424]
+    assert _october_expenses(auth_client) == []
+    assert _october_total(auth_client) == 0
+    assert auth_client.get("/api/expenses/suggest", params={"prefix": "merc"}).json() == []
+
+
+def test_non_atomic_batch_keeps_the_operations_that_succeeded(auth_client, category_id):
+    response = auth_client.post(
+        "/api/batch",
+        json={
+            "operations": [
+                _create(category_id, "mercado", 12),
+                {"resource": "expense", "action": "delete", "id": 999999},
+                _create(category_id, "farmacia", 8),
+            ],
+        },
+    )
+
+    body = response.json()
+    assert body["committed"] is True
+    assert [result["status"] for result in body["results"]] == [201, 404, 201]
+    assert sorted(item["description"] for item in _october_expenses(auth_client)) == ["farmacia", "mercado"]
+    assert _october_total(auth_client) == 20
+
+
+def test_exhausted_quota_only_rejects_current_period_expenses(auth_client, category_id):
+    auth_client.app.dependency_overrides[get_expense_import_quota] = lambda: 0
+    try:
+        response = auth_client.post(
+            "/api/batch",
+            json={
+                "operations": [
+                    _create(category_id, "atrasado", day="2020-01-15"),
+                    _create(category_id, "hoy", day=date.today().isoformat()),
+                ],
+            },
+        )
+    finally:
+        auth_client.app.dependency_overrides.pop(get_expense_import_quota)
+
+    assert response.status_code == 200, response.text
+    assert [result["status"] for result in response.json()["results"]] == [201, 403]
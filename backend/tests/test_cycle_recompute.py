@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.services import finance_service as finance_module
+from backend.services.finance_service import FinanceService
+from backend.tests.conftest import register_user
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls: list[int] = []
+    monkeypatch.setattr(
+        finance_module.cycle_recompute_jobs, "schedule", lambda user_id, work: calls.append(user_id) or {}
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_settings_change_schedules_recompute_after_outer_commit(session_factory, scheduled):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        async with finance.unit_of_work():
+            await finance.update_settings_payload({"pay_day_1": 5})
+            assert scheduled == []
+        assert scheduled == [uid]
+
+    async with session_factory() as session:
+        assert (await FinanceService(session, uid).get_settings_payload())["pay_day_1"] == 5
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_settings_change_does_not_schedule_recompute(session_factory, scheduled):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        with pytest.raises(RuntimeError):
+            async with finance.unit_of_work():
+                await finance.update_settings_payload({"pay_day_1": 5})
+                raise RuntimeError("boom")
+    assert scheduled == []
+
+
+@pytest.mark.asyncio
+async def test_settings_change_outside_unit_of_work_schedules_immediately(session_factory, scheduled):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        await FinanceService(session, uid).update_settings_payload({"pay_day_1": 5})
+    assert scheduled == [uid]
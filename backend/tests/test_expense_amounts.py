@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def category_id(auth_client):
+    return auth_client.get("/api/categories").json()[0]["id"]
+
+
+def test_import_rejects_non_finite_amounts(auth_client, category_id):
+    content = "date,amount,description,category_id\n" + "".join(
+        f"2026-10-0{day},{amount},fila,{category_id}\n"
+        for day, amount in enumerate(("inf", "Infinity", "1e400", "nan", "12.5"), start=1)
+    )
+
+    response = auth_client.post("/api/expenses/import", content=content, headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["imported"] == 1
+    assert [error["row"] for error in body["errors"]] == [1, 2, 3, 4]
+    assert {error["message"] for error in body["errors"]} == {"Invalid amount."}
+
+
+@pytest.mark.parametrize("amount", ['"inf"', '"Infinity"', "1e400", "Infinity", "NaN"])
+def test_create_rejects_non_finite_amounts(auth_client, category_id, amount):
+    content = f'{{"amount": {amount}, "description": "x", "date": "2026-10-01", "category_id": {category_id}}}'
+
+    response = auth_client.post("/api/expenses", content=content, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", "amount"]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def category_ids(auth_client):
+    return [category["id"] for category in auth_client.get("/api/categories").json()[:2]]
+
+
+def _suggest(client, prefix: str) -> list[dict[str, object]]:
+    response = client.get("/api/expenses/suggest", params={"prefix": prefix})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _expense(category_id: int, description: str, amount: float, day: int) -> dict[str, object]:
+    return {"amount": amount, "description": description, "date": f"2026-10-{day:02d}", "category_id": category_id}
+
+
+def test_suggestions_follow_expense_updates_and_deletes(auth_client, category_ids):
+    first, second = category_ids
+    created = [
+        auth_client.post("/api/expenses", json=_expense(first, "Supermercado", 30, day)).json()
+        for day in (1, 2)
+    ]
+    # Load the cached index first so the assertions below check that writes reach it.
+    assert [(item["description"], item["uses"]) for item in _suggest(auth_client, "super")] == [("Supermercado", 2)]
+
+    response = auth_client.put(f"/api/expenses/{created[0]['id']}", json=_expense(second, "Panaderia", 5, 3))
+    assert response.status_code == 200, response.text
+    assert [item["uses"] for item in _suggest(auth_client, "super")] == [1]
+    assert [(item["description"], item["category_id"]) for item in _suggest(auth_client, "pan")] == [("Panaderia", second)]
+
+    assert auth_client.delete(f"/api/expenses/{created[1]['id']}").status_code == 204
+    assert _suggest(auth_client, "super") == []
+    assert [item["description"] for item in _suggest(auth_client, "pan")] == ["Panaderia"]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.config import settings
+
+
+@pytest.mark.parametrize(
+    ("app_env", "flag", "expected"),
+    [
+        ("development", "", 200),
+        ("production", "", 404),
+        ("production", "true", 200),
+        ("development", "false", 404),
+    ],
+)
+def test_metrics_endpoint_is_gated(client, monkeypatch, app_env, flag, expected):
+    monkeypatch.setattr(settings, "app_env", app_env)
+    monkeypatch.setattr(settings, "metrics_flag", flag)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == expected
+    if expected == 200:
+        assert "rate_limiter" in response.json()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = ROOT / "backend" / "database" / "migrations" / "alembic.ini"
+
+
+def _alembic(database: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "DATABASE_URL": f"sqlite+aiosqlite:///{database}"}
+    return subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", str(ALEMBIC_INI), *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_migrated_schema_matches_models(tmp_path):
+    database = tmp_path / "migrated.db"
+    upgrade = _alembic(database, "upgrade", "head")
+    assert upgrade.returncode == 0, upgrade.stderr
+
+    # The FTS5 search tables exist only in the migrations; autogenerate must leave them alone.
+    check = _alembic(database, "check")
+    assert check.returncode == 0, check.stderr[-2000:]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from backend.database.engine import engine
+from backend.database.models import RateLimitBucket
+from backend.middleware import rate_limit
+from backend.services import rate_limiter
+from backend.services.auth_sweeper import ExpiredAuthSweeper
+from backend.services.rate_limiter import DatabaseRateLimitStore, MemoryRateLimitStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter, "monotonic", clock)
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def _take(store: MemoryRateLimitStore, key: str, times: int, *, limit: int = 3) -> list[bool]:
+    return [store.take(key, limit=limit, window_seconds=60) for _ in range(times)]
+
+
+def test_memory_store_allows_a_burst_then_refills(clock):
+    store = MemoryRateLimitStore(max_keys=100, shards=4)
+
+    assert _take(store, "login:1.2.3.4", 4) == [True, True, True, False]
+    assert _take(store, "login:5.6.7.8", 1) == [True]
+
+    clock.now += 20  # one token back at 3 per minute
+    assert _take(store, "login:1.2.3.4", 2) == [True, False]
+
+
+def test_memory_store_drops_refilled_buckets_and_caps_keys(clock):
+    store = MemoryRateLimitStore(max_keys=2, shards=1)
+    _take(store, "a", 1)
+    clock.now += 60
+    _take(store, "b", 1)
+    assert store.stats()["keys"] == 1  # "a" was full again, so it carried no state
+
+    _take(store, "c", 1)
+    _take(store, "d", 1)
+
+    assert store.stats()["keys"] == 2
+    assert store.stats()["capacity_evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_database_store_is_shared_between_stores(clock):
+    first, second = DatabaseRateLimitStore(engine), DatabaseRateLimitStore(engine)
+
+    results = [await store.hit("login:1.2.3.4", limit=3, window_seconds=60) for store in (first, second, first, second)]
+    assert results == [True, True, True, False]
+
+    clock.now += 20
+    assert await second.hit("login:1.2.3.4", limit=3, window_seconds=60) is True
+    assert await first.hit("login:1.2.3.4", limit=3, window_seconds=60) is False
+    assert (first.stats()["allowed"], second.stats()["denied"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_database_store_never_overspends_under_concurrency():
+    stores = [DatabaseRateLimitStore(engine) for _ in range(4)]
+
+    results = await asyncio.gather(
+        *(stores[index % 4].hit("otp:1.2.3.4", limit=5, window_seconds=60) for index in range(20))
+    )
+
+    assert sum(results) == 5
+
+
+@pytest.mark.asyncio
+async def test_sweeper_removes_expired_buckets(session_factory):
+    store = DatabaseRateLimitStore(engine)
+    for key in ("idle", "active"):
+        await store.hit(key, limit=3, window_seconds=60)
+    async with session_factory() as session:
+        await session.execute(
+            update(RateLimitBucket)
+            .where(RateLimitBucket.bucket_key == "idle")
+            .values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await session.commit()
+
+    report = await ExpiredAuthSweeper(session_factory, interval_seconds=0, batch_size=10, pause_seconds=0).sweep_once()
+
+    assert report.deleted["rate_limit_buckets"] == 1
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(RateLimitBucket)) == 1
+
+
+@pytest.mark.parametrize("backend", ["memory", "database"])
+def test_endpoint_answers_429_once_the_bucket_is_empty(client, clock, monkeypatch, backend):
+    store = DatabaseRateLimitStore(engine) if backend == "database" else MemoryRateLimitStore(max_keys=100, shards=1)
+    monkeypatch.setattr(rate_limit, "rate_limit_store", store)
+
+    statuses = [
+        client.post("/api/auth/refresh", json={"refresh_token": "invalido"}).status_code for _ in range(121)
+    ]
+
+    assert set(statuses[:120]) == {401}
+    assert statuses[120] == 429
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from backend.database.models import PeriodCategoryRollup
+from backend.services.finance_service import FinanceService
+from backend.tests.conftest import register_user
+
+
+@pytest.mark.asyncio
+async def test_delete_category_after_its_last_expense_is_deleted(session_factory):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        category = await finance.add_category("Temporal")
+        for amount, day in ((10.1, 3), (20.2, 4)):
+            expense = await finance.add_expense(
+                amount=amount, description="cafe", category_id=category.id, date_value=date(2026, 10, day)
+            )
+            await finance.delete_expense(expense.id)
+
+        await finance.delete_category(category.id)
+
+        assert category.id not in {item.id for item in await finance.get_categories()}
+        rows = await session.scalars(select(PeriodCategoryRollup).where(PeriodCategoryRollup.category_id == category.id))
+        assert rows.all() == []
+
+
+@pytest.mark.asyncio
+async def test_delete_category_after_its_expense_is_recategorized(session_factory):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        categories = await finance.get_categories()
+        category = await finance.add_category("Temporal")
+        expense = await finance.add_expense(amount=15, description="taxi", category_id=category.id, date_value=date(2026, 10, 3))
+        await finance.update_expense(
+            expense.id,
+            amount=15,
+            description="taxi",
+            category_id=categories[0].id,
+            date_value=date(2026, 10, 3),
+        )
+
+        await finance.delete_category(category.id)
+
+        rollups = await finance.get_period_rollups(2026)
+        totals = {category_id: total for item in rollups for category_id, total in item.category_totals.items() if total}
+        assert totals == {categories[0].id: 15}
+
+
+@pytest.mark.asyncio
+async def test_write_during_rebuild_is_not_lost(session_factory):
+    uid = (await register_user()).user.id
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        category_id = (await finance.get_categories())[0].id
+        await finance.add_expense(amount=10, description="cafe", category_id=category_id, date_value=date(2026, 10, 3))
+
+    async def concurrent_write() -> None:
+        async with session_factory() as other:
+            await FinanceService(other, uid).add_expense(
+                amount=5, description="pan", category_id=category_id, date_value=date(2026, 10, 4)
+            )
+
+    async with session_factory() as session:
+        finance = FinanceService(session, uid)
+        compute = finance.rollup_repo.compute_for_user
+        writer: asyncio.Task | None = None
+
+        async def compute_with_interleaved_write(*args):
+            nonlocal writer
+            periods = await compute(*args)
+            writer = asyncio.create_task(concurrent_write())
+            # Give the other write every chance to commit before the rebuild stores its totals.
+            await asyncio.wait({writer}, timeout=0.2)
+            return periods
+
+        finance.rollup_repo.compute_for_user = compute_with_interleaved_write
+        await finance.rebuild_period_rollups()
+        await writer
+
+    async with session_factory() as session:
+        rollups = await FinanceService(session, uid).get_period_rollups(2026)
+    assert sum(item.expense_total for item in rollups) == 15
+    assert sum(item.expense_count for item in rollups) == 2
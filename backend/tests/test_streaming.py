@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+
+from backend.routers.streaming import CHUNK_SIZE, NDJSON_MEDIA_TYPE
+
+
+def test_ndjson_listing_streams_every_row_past_the_first_chunk(auth_client):
+    category_id = auth_client.get("/api/categories").json()[0]["id"]
+    description = "x" * 200
+    rows = CHUNK_SIZE // len(description) + 50
+    content = "date,amount,description,category_id\n" + "".join(
+        f"2026-10-{day % 28 + 1:02d},1,{description},{category_id}\n" for day in range(rows)
+    )
+    assert auth_client.post("/api/expenses/import", content=content, headers={"Content-Type": "text/csv"}).json()["imported"] == rows
+
+    with auth_client.stream(
+        "GET",
+        "/api/expenses",
+        params={"start": "2026-10-01", "end": "2026-10-31"},
+        headers={"Accept": NDJSON_MEDIA_TYPE},
+    ) as response:
+        assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+        chunks = list(response.iter_bytes())
+
+    lines = b"".join(chunks).splitlines()
+    assert len(lines) == rows
+    assert {json.loads(line)["description"] for line in lines} == {description}
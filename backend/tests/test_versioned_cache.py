@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from backend.services import versioned_cache
+from backend.services.dashboard_cache import dashboard_cache
+from backend.services.subscription_service import entitlements_cache
+from backend.services.versioned_cache import VersionedTTLCache
+
+
+def test_bump_and_stale_versions_are_never_served():
+    cache = VersionedTTLCache(max_entries=8, ttl_seconds=60)
+    before = cache.version(1)
+    cache.put(1, "plan", before, {"tier": "free"})
+    assert cache.get(1, "plan", before) == {"tier": "free"}
+
+    cache.bump(1)
+    assert cache.get(1, "plan", cache.version(1)) is None
+    cache.put(1, "plan", before, {"tier": "stale"})
+    assert cache.get(1, "plan", cache.version(1)) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_and_respect_the_size_limit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(versioned_cache, "monotonic", lambda: now[0])
+    cache = VersionedTTLCache(max_entries=2, ttl_seconds=10)
+    for user_id in (1, 2, 3):
+        cache.put(user_id, "key", cache.version(user_id), user_id)
+    assert cache.stats()["entries"] == 2
+    assert cache.get(1, "key", cache.version(1)) is None
+
+    now[0] += 10
+    assert cache.get(3, "key", cache.version(3)) is None
+
+
+def test_dashboard_and_entitlements_keep_separate_stats():
+    assert dashboard_cache is not entitlements_cache
+    dashboard_misses, entitlements_misses = dashboard_cache.stats()["misses"], entitlements_cache.stats()["misses"]
+
+    entitlements_cache.get(1, "plan", entitlements_cache.version(1))
+
+    assert entitlements_cache.stats()["misses"] == entitlements_misses + 1
+    assert dashboard_cache.stats()["misses"] == dashboard_misses
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def category_ids(auth_client):
+    return [category["id"] for category in auth_client.get("/api/categories").json()[:2]]
+
+
+def _expense(category_id: int, amount: float, value: str, description: str = "gasto") -> dict[str, object]:
+    return {"amount": amount, "description": description, "date": value, "category_id": category_id}
+
+
+def _expected_period(client, start: str, end: str) -> dict[str, object]:
+    expenses = client.get("/api/expenses", params={"start": start, "end": end}).json()
+    income = client.get("/api/income", params={"start": start, "end": end}).json()
+    categories: dict[str, float] = {}
+    for item in expenses:
+        for category_id in item["category_ids"]:
+            categories[str(category_id)] = categories.get(str(category_id), 0.0) + item["amount"]
+    total = sum(item["amount"] for item in expenses)
+    days = {item["date"] for item in expenses}
+    return {
+        "total_expenses": pytest.approx(total),
+        "extra_income": pytest.approx(sum(item["amount"] for item in income)),
+        "expense_count": len(expenses),
+        "avg_daily": pytest.approx(total / len(days) if days else 0.0),
+        "cat_totals": pytest.approx(categories),
+    }
+
+
+def test_year_overview_matches_the_expenses_after_edits(auth_client, category_ids):
+    first, second = category_ids
+    created = [
+        auth_client.post("/api/expenses", json=_expense(first, amount, value)).json()
+        for amount, value in ((10.1, "2026-03-02"), (20.2, "2026-03-02"), (7.5, "2026-03-20"), (3.3, "2026-07-09"))
+    ]
+    auth_client.post("/api/income", json={"amount": 50, "description": "bono", "date": "2026-03-21"})
+    auth_client.put(f"/api/expenses/{created[0]['id']}", json=_expense(second, 12, "2026-07-10"))
+    auth_client.delete(f"/api/expenses/{created[3]['id']}")
+
+    response = auth_client.get("/api/dashboard/year", params={"year": 2026})
+
+    assert response.status_code == 200, response.text
+    periods = response.json()["periods"]
+    assert sum(period["expense_count"] for period in periods) == 3
+    for period in periods:
+        actual = {key: period[key] for key in ("total_expenses", "extra_income", "expense_count", "avg_daily", "cat_totals")}
+        assert actual == _expected_period(auth_client, period["start_date"], period["end_date"]), period["period_title"]